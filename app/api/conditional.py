@@ -0,0 +1,63 @@
+from typing import Dict, Optional, Type
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from app.api.routing import model_response, response_media_type
+from app.core.etag import ResourceVersion, http_date, none_match, not_modified_since
+
+
+class Preconditions:
+    """조건부 요청 헤더 (If-None-Match, If-Modified-Since, If-Match)"""
+
+    __slots__ = ("if_none_match", "if_modified_since", "if_match")
+
+    def __init__(
+        self,
+        if_none_match: Optional[str] = None,
+        if_modified_since: Optional[str] = None,
+        if_match: Optional[str] = None,
+    ):
+        self.if_none_match = if_none_match
+        self.if_modified_since = if_modified_since
+        self.if_match = if_match
+
+    @property
+    def revalidating(self) -> bool:
+        """클라이언트가 캐시한 표현의 재검증 요청인지 (전체 행을 읽기 전에 버전만 확인)"""
+        return self.if_none_match is not None or self.if_modified_since is not None
+
+    def not_modified(self, version: ResourceVersion, schema: Type[BaseModel]) -> Optional[Response]:
+        """캐시한 표현이 최신이면 304 응답, 아니면 None
+
+        If-None-Match 가 있으면 If-Modified-Since 는 무시합니다 (RFC 9110).
+        """
+        etag = version.etag(_variant(schema))
+        if self.if_none_match is not None:
+            fresh = none_match(self.if_none_match, etag)
+        else:
+            fresh = not_modified_since(self.if_modified_since, version.last_modified)
+        if not fresh:
+            return None
+        return Response(status_code=304, headers=_version_headers(version, etag))
+
+
+def versioned_response(content: BaseModel, version: ResourceVersion, status_code: int = 200) -> Response:
+    """응답 스키마 인스턴스 -> ETag/Last-Modified 헤더를 붙인 응답 (협상한 형식으로 직렬화)"""
+    response = model_response(content, status_code)
+    response.headers.update(_version_headers(version, version.etag(_variant(type(content)))))
+    return response
+
+
+def _variant(schema: Type[BaseModel]) -> str:
+    # ?fields= 로 줄인 스키마(이름에 필드 목록 포함)와 응답 형식마다 다른 ETag
+    return f"{schema.__name__}|{response_media_type.get()}"
+
+
+def _version_headers(version: ResourceVersion, etag: str) -> Dict[str, str]:
+    # 사용자별 접근 권한이 있는 응답이므로 공유 캐시에는 저장하지 않고, 매번 재검증하도록
+    return {
+        "ETag": etag,
+        "Last-Modified": http_date(version.last_modified),
+        "Cache-Control": "private, no-cache",
+    }
@@ -0,0 +1,106 @@
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.session import engine
+from app.redis.session import redis_client
+
+logger = logging.getLogger(__name__)
+
+
+def pool_usage() -> Dict[str, Any]:
+    """현재 워커의 DB 커넥션 풀 사용률 (I/O 없이 풀 카운터만 읽음)"""
+    pool = engine.pool
+    size = pool.size() if hasattr(pool, "size") else 0
+    checked_out = pool.checkedout() if hasattr(pool, "checkedout") else 0
+    capacity = size + max(getattr(pool, "_max_overflow", 0), 0)
+    return {
+        "size": size,
+        "checked_out": checked_out,
+        "capacity": capacity,
+        "utilization": round(checked_out / capacity, 3) if capacity else 0.0,
+    }
+
+
+def _check(probe) -> Dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        probe()
+    except Exception as e:
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    return {"ok": True, "latency_ms": round((time.perf_counter() - started) * 1000, 3)}
+
+
+def _probe_database() -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+class ReadinessProber:
+    """DB/Redis 상태를 백그라운드에서 주기적으로 확인하고 결과를 캐시
+
+    /ready 요청은 캐시된 결과만 읽으므로 오케스트레이터가 자주 호출해도 부하가 없습니다.
+    """
+
+    def __init__(self):
+        self.checks: Optional[Dict[str, Dict[str, Any]]] = None
+        self.checked_at: Optional[float] = None
+
+    def probe(self) -> None:
+        checks = {
+            "database": _check(_probe_database),
+            "redis": _check(redis_client.ping),
+        }
+        for name, result in checks.items():
+            if not result["ok"]:
+                logger.warning(f"readiness 확인 실패 ({name}): {result['error']}")
+        self.checks, self.checked_at = checks, time.time()
+
+    def status(self) -> Dict[str, Any]:
+        """캐시된 의존성 상태 + 현재 풀 사용률로 준비 여부 판단"""
+        pool = pool_usage()
+        if self.checks is None:
+            return {"ready": False, "reason": "starting", "pool": pool}
+        age = time.time() - self.checked_at
+        reason = None
+        if age > settings.READINESS_PROBE_INTERVAL * 3:
+            reason = "stale"
+        elif not all(result["ok"] for result in self.checks.values()):
+            reason = "dependency_unavailable"
+        elif pool["utilization"] >= settings.READINESS_MAX_POOL_UTILIZATION:
+            # 커넥션 풀이 포화된 워커는 로드밸런서에서 잠시 제외
+            reason = "pool_saturated"
+        return {
+            "ready": reason is None,
+            "reason": reason,
+            "checked_at": self.checked_at,
+            "age_seconds": round(age, 3),
+            "checks": self.checks,
+            "pool": pool,
+        }
+
+
+readiness = ReadinessProber()
+
+router = APIRouter(include_in_schema=False)
+
+@router.get("/health")
+async def health():
+    """Liveness 확인 (I/O 없음, 프로세스가 요청을 처리할 수 있으면 200)"""
+    return {"status": "ok"}
+
+@router.get("/ready")
+async def ready():
+    """
+    Readiness 확인
+
+    백그라운드 prober가 캐시한 DB/Redis 상태와 커넥션 풀 사용률을 반환합니다.
+    의존성 장애, 확인 결과 만료, 풀 포화 시 503을 반환합니다.
+    """
+    result = readiness.status()
+    return JSONResponse(result, status_code=200 if result["ready"] else 503)
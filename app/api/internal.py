@@ -0,0 +1,84 @@
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, status
+
+from app.core.cache import cache_stats
+from app.core.config import settings
+from app.core.exceptions import ForbiddenError
+from app.core.loop_monitor import loop_monitor
+from app.db.stats import merge_snapshots, statement_stats, summarize
+from app.redis.snapshots import collect_snapshots, publish_snapshot
+
+STATS_SNAPSHOT_NAME = "db_statements"
+
+
+def verify_internal_token(x_internal_token: str = Header("", include_in_schema=False)) -> None:
+    """내부 API 접근 확인 (토큰 미설정 시 개발 환경에서만 허용)"""
+    if settings.INTERNAL_API_TOKEN:
+        if x_internal_token != settings.INTERNAL_API_TOKEN:
+            raise ForbiddenError("내부 API 접근 권한이 없습니다")
+    elif not settings.DEBUG:
+        raise ForbiddenError("내부 API 접근 권한이 없습니다")
+
+
+def publish_statement_stats() -> None:
+    """워커 간 병합을 위해 현재 워커의 쿼리 통계 스냅샷을 Redis에 발행"""
+    publish_snapshot(
+        STATS_SNAPSHOT_NAME, statement_stats.snapshot(), ttl=settings.DB_STATS_PUBLISH_INTERVAL * 3
+    )
+
+
+router = APIRouter(dependencies=[Depends(verify_internal_token)], include_in_schema=False)
+
+@router.get("/db/statements")
+def list_statement_stats(
+    sort: Literal["total_ms", "calls", "mean_ms", "max_ms", "p99_ms", "rows"] = Query("total_ms"),
+    limit: int = Query(50, ge=1, le=1000),
+    merge: bool = Query(False, description="모든 워커의 통계를 병합"),
+):
+    """
+    쿼리 fingerprint별 통계 조회 (pg_stat_statements 유사)
+
+    - **sort**: 정렬 기준 (내림차순)
+    - **limit**: 반환할 fingerprint 수
+    - **merge**: true면 Redis에 발행된 모든 워커의 스냅샷을 병합 (발행 주기만큼 지연될 수 있음)
+    """
+    if merge:
+        publish_statement_stats()
+        entries = merge_snapshots(collect_snapshots(STATS_SNAPSHOT_NAME))
+    else:
+        entries = merge_snapshots([statement_stats.snapshot()])
+    return {"statements": summarize(entries, sort, limit)}
+
+@router.delete("/db/statements", status_code=status.HTTP_204_NO_CONTENT)
+def reset_statement_stats():
+    """현재 워커의 쿼리 통계 초기화"""
+    statement_stats.reset()
+
+@router.get("/cache")
+def get_cache_stats():
+    """현재 워커의 네임스페이스별 캐시 조회 수와 적중률 (L1/Redis, 워커 합계는 /metrics 의 cache_requests_total)"""
+    return {"namespaces": cache_stats()}
+
+@router.get("/loop-monitor")
+def get_loop_monitor():
+    """현재 워커의 이벤트 루프 블로킹 감지 상태와 최근 블로킹 이벤트(스택 포함) 조회"""
+    return loop_monitor.status()
+
+@router.put("/loop-monitor")
+async def update_loop_monitor(
+    enabled: bool = Query(..., description="블로킹 감지 활성화 여부"),
+    threshold_ms: Optional[float] = Query(None, gt=0, description="스택을 캡처할 블로킹 임계값 (ms)"),
+):
+    """
+    현재 워커의 이벤트 루프 블로킹 감지 설정 변경 (재시작 없이 적용)
+
+    루프에서 시작해야 하므로 async 엔드포인트로 처리합니다.
+    """
+    if threshold_ms is not None:
+        loop_monitor.threshold_ms = threshold_ms
+    if enabled:
+        loop_monitor.start()
+    else:
+        await loop_monitor.stop()
+    return loop_monitor.status()
@@ -0,0 +1,68 @@
+import logging
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.metrics import merge_metric_snapshots, registry, render_prometheus
+from app.core.security import bcrypt_pending_tasks, bcrypt_queue_depth
+from app.db.session import engine
+from app.redis.session import add_command_listener
+from app.redis.snapshots import collect_snapshots, publish_snapshot
+
+logger = logging.getLogger(__name__)
+
+METRICS_SNAPSHOT_NAME = "metrics"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _pool_stat(name: str) -> float:
+    """커넥션 풀 통계 (QueuePool이 아닌 경우 0, overflow는 풀이 다 차기 전까지 음수이므로 0으로 보정)"""
+    stat = getattr(engine.pool, name, None)
+    return max(float(stat()), 0.0) if callable(stat) else 0.0
+
+
+registry.gauge("db_pool_size", "DB 커넥션 풀 크기", callback=lambda: _pool_stat("size"))
+registry.gauge("db_pool_checked_out", "사용 중인 DB 커넥션 수", callback=lambda: _pool_stat("checkedout"))
+registry.gauge("db_pool_overflow", "풀 크기를 초과해 생성된 DB 커넥션 수", callback=lambda: _pool_stat("overflow"))
+registry.gauge("bcrypt_executor_pending_tasks", "bcrypt 스레드풀에서 실행/대기 중인 작업 수", callback=bcrypt_pending_tasks)
+registry.gauge("bcrypt_executor_queue_depth", "bcrypt 스레드풀 대기열 길이", callback=bcrypt_queue_depth)
+
+redis_command_duration_seconds = registry.histogram(
+    "redis_command_duration_seconds",
+    "Redis 명령 실행 시간 (초)",
+    ("command",),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+
+def _observe_redis_command(command: str, duration: float) -> None:
+    redis_command_duration_seconds.labels(command).observe(duration)
+
+
+if settings.METRICS_ENABLED:
+    add_command_listener(_observe_redis_command)
+
+
+def publish_metrics() -> None:
+    """워커 간 병합을 위해 현재 워커의 메트릭 스냅샷을 Redis에 발행"""
+    publish_snapshot(METRICS_SNAPSHOT_NAME, registry.snapshot(), ttl=settings.METRICS_PUBLISH_INTERVAL * 3)
+
+
+router = APIRouter(include_in_schema=False)
+
+@router.get("/metrics")
+def metrics():
+    """
+    Prometheus 메트릭
+
+    모든 uvicorn 워커가 Redis에 발행한 스냅샷을 합산해 반환합니다.
+    Redis를 사용할 수 없으면 현재 워커의 메트릭만 반환합니다.
+    """
+    try:
+        publish_metrics()
+        snapshot = merge_metric_snapshots(collect_snapshots(METRICS_SNAPSHOT_NAME))
+    except Exception as e:
+        logger.error(f"워커 메트릭 병합 실패: {e}")
+        snapshot = registry.snapshot()
+    return PlainTextResponse(render_prometheus(snapshot), media_type=PROMETHEUS_CONTENT_TYPE)
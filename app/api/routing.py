@@ -0,0 +1,178 @@
+import functools
+import inspect
+import json
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+import msgpack
+from fastapi import Request, Response
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from starlette.datastructures import Headers
+
+from app.core.negotiation import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPES,
+    media_type_of,
+    negotiate_media_type,
+)
+from app.core.timing import RequestTimings, current_timings
+
+# 요청의 Accept 로 협상한 응답 미디어 타입 (TimedRoute 핸들러가 요청마다 설정)
+response_media_type: ContextVar[str] = ContextVar("response_media_type", default=JSON_MEDIA_TYPE)
+
+
+def _io_ms(timings: RequestTimings) -> float:
+    return timings.get("db") + timings.get("redis")
+
+
+def _finish_endpoint(timings: RequestTimings, started: float, io_before: float) -> None:
+    """엔드포인트 실행 시간에서 그동안의 DB/Redis 시간을 뺀 나머지를 app 구간으로 기록"""
+    finished = time.perf_counter()
+    timings.endpoint_finished = finished
+    io_during = _io_ms(timings) - io_before
+    timings.add("app", max((finished - started) * 1000 - io_during, 0.0))
+
+
+def _timed_endpoint(endpoint: Callable[..., Any], serialize: Callable[[Any], Any]) -> Callable[..., Any]:
+    """엔드포인트 실행 구간을 측정하고 반환값을 serialize 로 넘기는 래퍼 (시그니처는 functools.wraps로 유지)"""
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            timings = current_timings()
+            if timings is None:
+                return serialize(await endpoint(*args, **kwargs))
+            io_before, started = _io_ms(timings), time.perf_counter()
+            try:
+                result = await endpoint(*args, **kwargs)
+            finally:
+                _finish_endpoint(timings, started, io_before)
+            return serialize(result)
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def sync_wrapper(*args, **kwargs):
+        timings = current_timings()
+        if timings is None:
+            return serialize(endpoint(*args, **kwargs))
+        io_before, started = _io_ms(timings), time.perf_counter()
+        try:
+            result = endpoint(*args, **kwargs)
+        finally:
+            _finish_endpoint(timings, started, io_before)
+        return serialize(result)
+    return sync_wrapper
+
+
+def model_response(content: BaseModel, status_code: int = 200, by_alias: bool = True) -> Response:
+    """검증된 응답 스키마 인스턴스 -> 협상한 형식(JSON 기본, MessagePack)의 응답
+
+    MessagePack 은 JSON 과 같은 값(datetime 은 ISO 문자열)을 담으므로 클라이언트는 같은 응답 스키마로 검증할 수 있습니다.
+    라우트의 response_model 검증을 거치지 않으므로 ?fields= 로 필드를 줄인 스키마 인스턴스도 그대로 응답합니다.
+    """
+    serializer = content.__pydantic_serializer__
+    if response_media_type.get() == MSGPACK_MEDIA_TYPE:
+        body = msgpack.packb(serializer.to_python(content, mode="json", by_alias=by_alias))
+        return Response(content=body, status_code=status_code, media_type=MSGPACK_MEDIA_TYPE)
+    return Response(
+        content=serializer.to_json(content, by_alias=by_alias),
+        status_code=status_code,
+        media_type=JSON_MEDIA_TYPE,
+    )
+
+
+class MsgpackRequest(Request):
+    """Content-Type: application/msgpack 본문을 JSON 본문처럼 읽는 요청
+
+    FastAPI 는 JSON Content-Type 일 때만 request.json() 으로 본문을 파싱하므로
+    Content-Type 을 JSON 으로 노출하고 json() 에서 MessagePack 을 디코딩합니다.
+    디코딩 실패는 FastAPI 의 본문 파싱 오류(400)로 처리됩니다.
+    """
+
+    def __init__(self, scope, receive):
+        super().__init__(scope, receive)
+        self._headers = Headers(raw=[
+            (key, JSON_MEDIA_TYPE.encode() if key == b"content-type" else value)
+            for key, value in scope["headers"]
+        ])
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            self._json = msgpack.unpackb(await self.body())
+        return self._json
+
+
+def _to_msgpack(response: Response) -> Response:
+    """fast path 를 거치지 않은 JSON 응답 (dict 반환, FastAPI 기본 직렬화) 을 MessagePack 으로 변환"""
+    body = getattr(response, "body", None)
+    if not body or media_type_of(response.headers.get("content-type", "")) != JSON_MEDIA_TYPE:
+        return response
+    response.body = msgpack.packb(json.loads(body))
+    response.headers["content-type"] = MSGPACK_MEDIA_TYPE
+    response.headers["content-length"] = str(len(response.body))
+    return response
+
+
+class TimedRoute(APIRoute):
+    """엔드포인트 로직(app)과 응답 직렬화(ser) 구간을 Server-Timing에 기록하는 라우트
+
+    엔드포인트가 response_model 인스턴스(서비스에서 검증을 마친 응답 스키마, paginate 결과 페이지)를
+    반환하면 FastAPI의 재검증(dict 변환 후 다시 검증)과 jsonable 변환을 건너뛰고
+    pydantic-core 직렬화로 바로 JSON 바이트를 만듭니다 (model_dump_json 과 같은 결과, str 변환 없이 bytes).
+    Accept 가 MessagePack 을 선호하면 같은 응답 모델을 MessagePack 으로 인코딩하고 (Vary: Accept),
+    Content-Type: application/msgpack 요청 본문은 JSON 본문과 같은 방식으로 검증합니다.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, _timed_endpoint(endpoint, self.serialize), **kwargs)
+
+    @functools.cached_property
+    def fast_path_model(self) -> Optional[type]:
+        """바로 직렬화해도 FastAPI 결과와 같은 응답 모델 (필드 필터링 옵션이나 커스텀 응답 클래스가 있으면 None)"""
+        model = self.response_model
+        if not (inspect.isclass(model) and issubclass(model, BaseModel)):
+            return None
+        if (
+            self.response_model_include is not None
+            or self.response_model_exclude is not None
+            or self.response_model_exclude_unset
+            or self.response_model_exclude_defaults
+            or self.response_model_exclude_none
+            or not isinstance(self.response_class, DefaultPlaceholder)
+        ):
+            return None
+        return model
+
+    def serialize(self, result: Any) -> Any:
+        """response_model 과 정확히 같은 타입이면 JSON 응답으로 바로 변환, 아니면 FastAPI 처리에 맡김"""
+        model = self.fast_path_model
+        if model is None or type(result) is not model:
+            return result
+        return model_response(result, self.status_code or 200, self.response_model_by_alias)
+
+    def get_route_handler(self) -> Callable[[Request], Any]:
+        handler = super().get_route_handler()
+
+        async def timed_handler(request: Request) -> Response:
+            if media_type_of(request.headers.get("content-type", "")) in MSGPACK_MEDIA_TYPES:
+                request = MsgpackRequest(request.scope, request.receive)
+            media_type = negotiate_media_type(request.headers.get("accept", ""))
+            token = response_media_type.set(media_type)
+            try:
+                response = await handler(request)
+            finally:
+                response_media_type.reset(token)
+            if media_type == MSGPACK_MEDIA_TYPE:
+                response = _to_msgpack(response)
+            # 같은 URL 이 Accept 에 따라 다른 형식이므로 공유 캐시가 형식별로 저장하도록
+            response.headers.add_vary_header("Accept")
+            timings = current_timings()
+            if timings is not None and timings.endpoint_finished is not None:
+                # 엔드포인트 반환 이후 response_model 검증/직렬화에 걸린 시간
+                timings.add("ser", (time.perf_counter() - timings.endpoint_finished) * 1000)
+            return response
+
+        return timed_handler
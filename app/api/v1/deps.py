@@ -1,21 +1,32 @@
-from fastapi import Depends
+from typing import Callable, Optional, Type
+
+from fastapi import Depends, Header, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from pydantic import BaseModel
 
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
+from app.api.conditional import Preconditions
 from app.crud.user import user as user_crud
 from app.crud.board import board as board_crud
 from app.crud.post import post as post_crud
 from app.services.auth import AuthService
 from app.services.board import BoardService
 from app.services.post import PostService
-from app.models.user import User
 from app.core.session import validate_session
 from app.core.security import decode_access_token
+from app.core.timing import measure
+from app.core.tracing import traced
 from app.core.exceptions import (
-    AuthenticationError
+    AuthenticationError,
+    BadRequestError
 )
+from app.schemas.auth import CurrentUser
+from app.schemas.board import BoardResponse
+from app.schemas.fields import FIELDS_DESCRIPTION, sparse_schema
+from app.schemas.post import PostResponse, PostSummaryResponse
+from app.schemas.sync import SyncWatermark
 
 
 # HTTP Bearer 토큰 스키마
@@ -37,24 +48,64 @@ def get_post_service() -> PostService:
     return PostService(post_crud=post_crud, board_crud=board_crud)
 
 
+def response_fields(schema: Type[BaseModel]) -> Callable[..., Type[BaseModel]]:
+    """?fields= 쿼리 파라미터 -> 응답 스키마 의존성 (필드를 지정하면 해당 필드만 가진 스키마)"""
+    def dependency(fields: Optional[str] = Query(None, description=FIELDS_DESCRIPTION)) -> Type[BaseModel]:
+        try:
+            return sparse_schema(schema, fields)
+        except ValueError as e:
+            raise BadRequestError(str(e))
+    return dependency
+
+
+get_board_fields = response_fields(BoardResponse)
+get_post_fields = response_fields(PostResponse)
+get_post_summary_fields = response_fields(PostSummaryResponse)
+
+
+def get_sync_watermark(
+    since: Optional[str] = Query(None, description="이전 변경분 응답의 watermark (생략하면 처음부터)")
+) -> Optional[SyncWatermark]:
+    """?since= 쿼리 파라미터 -> 변경분 동기화 watermark 의존성"""
+    if since is None:
+        return None
+    try:
+        return SyncWatermark.decode(since)
+    except ValueError as e:
+        raise BadRequestError(str(e))
+
+
+def get_preconditions(
+    if_none_match: Optional[str] = Header(None, description="캐시한 응답의 ETag (같으면 304 Not Modified)"),
+    if_modified_since: Optional[str] = Header(None, description="캐시한 응답의 Last-Modified (If-None-Match 우선)"),
+    if_match: Optional[str] = Header(None, description="수정 전 조회한 ETag (다르면 412 Precondition Failed)"),
+) -> Preconditions:
+    """조건부 요청 헤더 의존성"""
+    return Preconditions(if_none_match, if_modified_since, if_match)
+
+
+@traced("get_current_user")
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
     auth_service: AuthService = Depends(get_auth_service)
-) -> User:
+) -> CurrentUser:
     """현재 로그인된 사용자 조회"""
     try:
-        payload = decode_access_token(credentials.credentials)
+        with measure("auth"):
+            payload = decode_access_token(credentials.credentials)
         user_id: str = payload.get("user_id")
         if user_id is None:
             raise AuthenticationError("사용자 ID가 없습니다")
     except Exception:
         raise AuthenticationError("토큰이 유효하지 않습니다")
 
-    if not validate_session(int(user_id), credentials.credentials):
+    with measure("session"):
+        session_valid = validate_session(int(user_id), credentials.credentials)
+    if not session_valid:
         raise AuthenticationError("세션이 유효하지 않습니다")
 
-    user = auth_service.get_user_by_id(user_id=int(user_id), db=db)
+    user = auth_service.get_principal(user_id=int(user_id), db=db)
     if user is None:
         raise AuthenticationError("사용자를 찾을 수 없습니다")
 
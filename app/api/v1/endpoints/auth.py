@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
+from app.api.routing import TimedRoute
 from app.services.auth import AuthService
 from app.api.v1.deps import get_auth_service, get_current_user
 from app.schemas.auth import (
@@ -12,9 +13,8 @@ from app.schemas.auth import (
     LogoutResponse,
     CurrentUser
 )
-from app.models.user import User
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 @router.post("/signup", response_model=SignUpResponse)
 async def signup(
@@ -61,7 +61,7 @@ async def login(
 
 @router.post("/logout", response_model=LogoutResponse)
 async def logout(
-    current_user: User = Depends(get_current_user)
+    current_user: CurrentUser = Depends(get_current_user)
 ):
     """로그아웃
 
@@ -76,9 +76,4 @@ async def logout(
     Raises:
         HTTPException 401: 유효하지 않은 토큰
     """
-    current_user_data = CurrentUser(
-        id=current_user.id,
-        email=current_user.email,
-        fullname=current_user.fullname
-    )
-    return await AuthService.logout(current_user_data)
\ No newline at end of file
+    return await AuthService.logout(current_user)
\ No newline at end of file
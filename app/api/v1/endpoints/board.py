@@ -1,11 +1,14 @@
+from typing import Type
+
 from fastapi import APIRouter, Depends, Query, status
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
-from fastapi_pagination.ext.sqlalchemy import paginate
-
 from app.db.session import get_db
+from app.api.conditional import Preconditions, versioned_response
+from app.api.routing import TimedRoute, model_response
 from app.services.board import BoardService
-from app.api.v1.deps import get_board_service, get_current_user
+from app.api.v1.deps import get_board_service, get_board_fields, get_current_user, get_preconditions
 from app.schemas.board import (
     BoardCreate,
     BoardUpdate,
@@ -17,7 +20,7 @@ from app.schemas.pagination import TotalCursorParams
 from app.schemas.auth import CurrentUser
 
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 @router.post("/", response_model=BoardResponse, status_code=status.HTTP_201_CREATED)
 async def create(
@@ -49,6 +52,7 @@ def list(
         BoardSortOption.created_at,
         description="정렬 옵션 (created_at: 생성일순, posts: 게시글수순)"
     ),
+    schema: Type[BaseModel] = Depends(get_board_fields),
     current_user: CurrentUser = Depends(get_current_user),
     board_service: BoardService = Depends(get_board_service),
     db: Session = Depends(get_db)
@@ -64,18 +68,25 @@ def list(
       - posts: 게시글 수 순 (많은순)
       - updated_at: 수정일 순
       - name: 이름 순
+    - **fields**: 응답에 포함할 필드 (예: id,name,posts_count)
+
+    공개 게시판은 모든 사용자가 공유하는 캐시에서, 본인 비공개 게시판은 DB 에서 조회해 합칩니다.
 
     권한: 로그인한 사용자, 본인이 생성한 게시판 + 공개 게시판만 조회 가능
 
     Returns:
         BoardListResponse: 게시판 목록 정보
     """
-    stmt = board_service.list(current_user, db, sort)
-    return paginate(db, stmt, params)
+    page = board_service.list(current_user, db, sort, params.size, params.cursor, schema)
+    if schema is BoardResponse:
+        return page
+    return model_response(page)
 
 @router.get("/{board_id}", response_model=BoardResponse)
 async def get(
     board_id: int,
+    schema: Type[BaseModel] = Depends(get_board_fields),
+    preconditions: Preconditions = Depends(get_preconditions),
     current_user: CurrentUser = Depends(get_current_user),
     board_service: BoardService = Depends(get_board_service),
     db: Session = Depends(get_db)
@@ -84,22 +95,31 @@ async def get(
     게시판 상세 조회
     
     - **board_id**: 조회할 게시판 ID
+    - **fields**: 응답에 포함할 필드 (예: id,name, 지정한 컬럼만 SELECT)
+    - **If-None-Match / If-Modified-Since**: 캐시한 응답의 ETag / Last-Modified (버전만 조회해 같으면 304)
 
     권한: 로그인한 사용자, 본인이 생성한 게시판 + 공개 게시판만 조회 가능
 
     Returns:
-        BoardResponse: 게시판 정보
+        BoardResponse: 게시판 정보 (ETag, Last-Modified 헤더 포함)
 
     Raises:
         HTTPException 404: 게시판 없음
         HTTPException 403: 접근 권한 없음
     """
-    return await board_service.get(board_id, current_user, db)
+    if preconditions.revalidating:
+        version = await board_service.get_version(board_id, current_user, db)
+        not_modified = preconditions.not_modified(version, schema)
+        if not_modified is not None:
+            return not_modified
+    board, version = await board_service.get(board_id, current_user, db, schema)
+    return versioned_response(board, version)
 
 @router.put("/{board_id}", response_model=BoardResponse)
 async def update(
     board_id: int,
     board_update: BoardUpdate,
+    preconditions: Preconditions = Depends(get_preconditions),
     current_user: CurrentUser = Depends(get_current_user),
     board_service: BoardService = Depends(get_board_service),
     db: Session = Depends(get_db)
@@ -110,18 +130,21 @@ async def update(
     - **board_id**: 수정할 게시판 ID
     - **name**: 새로운 게시판 이름 (선택사항)
     - **public**: 새로운 공개 여부 (선택사항)
+    - **If-Match**: 수정 전 조회한 ETag (그 사이 다른 요청이 수정했으면 412)
     
     권한: 게시판 생성자만 수정 가능
 
     Returns:
-        BoardResponse: 수정된 게시판 정보
+        BoardResponse: 수정된 게시판 정보 (새 ETag 헤더 포함)
 
     Raises:
         HTTPException 404: 게시판 없음
         HTTPException 403: 접근 권한 없음
         HTTPException 409: 게시판 이름 중복
+        HTTPException 412: 버전 불일치 (If-Match)
     """
-    return await board_service.update(board_id, board_update, current_user, db)
+    board, version = await board_service.update(board_id, board_update, current_user, db, preconditions.if_match)
+    return versioned_response(board, version)
 
 @router.delete("/{board_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete(
@@ -1,23 +1,35 @@
+from typing import Optional, Type
+
 from fastapi import APIRouter, Depends, Query, Path, status
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from fastapi_pagination import set_page
 from fastapi_pagination.ext.sqlalchemy import paginate
 
 from app.db.session import get_db
+from app.api.conditional import Preconditions, versioned_response
+from app.api.routing import TimedRoute, model_response
 from app.services.post import PostService
-from app.api.v1.deps import get_post_service, get_current_user
+from app.api.v1.deps import (
+    get_post_service, get_current_user, get_post_fields, get_post_summary_fields, get_preconditions,
+    get_sync_watermark
+)
 from app.schemas.post import (
     PostCreate,
     PostUpdate, 
     PostResponse,
+    PostSummaryResponse,
     PostListResponse,
     PostSortOption
 )
-from app.schemas.pagination import TotalCursorParams
+from app.schemas.pagination import CursorPageCustom, TotalCursorParams
+from app.schemas.sync import PostChangesResponse, SyncWatermark
+from app.core.config import settings
 from app.schemas.auth import CurrentUser
 
 
-router = APIRouter()
+router = APIRouter(route_class=TimedRoute)
 
 @router.post("/boards/{board_id}/posts", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
 async def create(
@@ -53,6 +65,7 @@ def list(
         PostSortOption.created_at, 
         description="정렬 옵션 (created_at: 생성일순)"
     ),
+    schema: Type[BaseModel] = Depends(get_post_summary_fields),
     current_user: CurrentUser = Depends(get_current_user),
     post_service: PostService = Depends(get_post_service),
     db: Session = Depends(get_db)
@@ -66,22 +79,61 @@ def list(
     - **sort**: 정렬 옵션
       - created_at: 생성일 순 (최신순, 기본값)
       - name: 이름 순
+    - **fields**: 응답에 포함할 필드 (예: id,title,created_at, 지정한 컬럼만 SELECT)
 
     권한: 로그인한 사용자 + 접근 가능한 게시판의 게시글만 조회 가능
 
     Returns:
-        PostListResponse: 게시글 목록 정보
+        PostListResponse: 게시글 목록 정보 (본문 대신 최대 200자 요약 excerpt, 본문은 상세 조회에서 제공)
+
+    Raises:
+        HTTPException 404: 게시판 없음
+        HTTPException 403: 접근 권한 없음
+    """
+    stmt = post_service.list(board_id, current_user, db, sort, schema)
+    if schema is PostSummaryResponse:
+        return paginate(db, stmt, params)
+    with set_page(CursorPageCustom[schema]):
+        return model_response(paginate(db, stmt, params, unwrap_mode="unwrap"))
+
+@router.get("/boards/{board_id}/posts/changes", response_model=PostChangesResponse)
+def changes(
+    board_id: int = Path(..., description="게시판 ID"),
+    since: Optional[SyncWatermark] = Depends(get_sync_watermark),
+    size: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="최대 개수"),
+    current_user: CurrentUser = Depends(get_current_user),
+    post_service: PostService = Depends(get_post_service),
+    db: Session = Depends(get_db)
+):
+    """
+    특정 게시판의 게시글 변경분 조회 (목록 전체를 다시 받지 않고 동기화)
+
+    Query Parameters:
+    - **since**: 이전 응답의 watermark (생략하면 처음부터 전체)
+    - **size**: 게시글/삭제 기록 각각의 최대 개수 (기본값: 20)
+
+    응답의 items 를 id 로 덮어쓰고 deleted 의 게시글을 지운 뒤, 새 watermark 를 since 로 다시 요청합니다.
+    has_more 가 true 면 바로 이어서, false 면 다음 동기화 때 요청합니다.
+    최근 몇 초 이내 변경분은 다음 동기화에서 한 번 더 올 수 있습니다 (SYNC_WATERMARK_LAG_SECONDS).
+
+    권한: 로그인한 사용자 + 접근 가능한 게시판만 조회 가능
+
+    Returns:
+        PostChangesResponse: 생성/수정된 게시글 (요약), 삭제된 게시글 ID, 새 watermark, has_more
 
     Raises:
+        HTTPException 400: 잘못된 watermark
         HTTPException 404: 게시판 없음
         HTTPException 403: 접근 권한 없음
+        HTTPException 410: 삭제 기록 보관 기간(SYNC_TOMBSTONE_RETENTION_DAYS)이 지난 watermark (처음부터 다시 동기화)
     """
-    stmt = post_service.list(board_id, current_user, db, sort)
-    return paginate(db, stmt, params)
+    return post_service.changes(board_id, since, size, current_user, db)
 
 @router.get("/posts/{post_id}", response_model=PostResponse)
 async def get(
     post_id: int = Path(..., description="게시글 ID"),
+    schema: Type[BaseModel] = Depends(get_post_fields),
+    preconditions: Preconditions = Depends(get_preconditions),
     current_user: CurrentUser = Depends(get_current_user),
     post_service: PostService = Depends(get_post_service),
     db: Session = Depends(get_db)
@@ -90,22 +142,31 @@ async def get(
     게시글 상세 조회
     
     - **post_id**: 조회할 게시글 ID
+    - **fields**: 응답에 포함할 필드 (예: id,title,content, 지정한 컬럼만 SELECT)
+    - **If-None-Match / If-Modified-Since**: 캐시한 응답의 ETag / Last-Modified (본문 없이 버전만 조회해 같으면 304)
 
     권한: 로그인한 사용자 + 접근 가능한 게시판의 게시글만 조회 가능
 
     Returns:
-        PostResponse: 게시글 정보
+        PostResponse: 게시글 정보 (본문 포함, ETag, Last-Modified 헤더 포함)
 
     Raises:
         HTTPException 404: 게시글 없음
         HTTPException 403: 접근 권한 없음
     """
-    return await post_service.get(post_id, current_user, db)
+    if preconditions.revalidating:
+        version = await post_service.get_version(post_id, current_user, db)
+        not_modified = preconditions.not_modified(version, schema)
+        if not_modified is not None:
+            return not_modified
+    post, version = await post_service.get(post_id, current_user, db, schema)
+    return versioned_response(post, version)
 
 @router.put("/posts/{post_id}", response_model=PostResponse)
 async def update(
     post_id: int = Path(..., description="게시글 ID"),
     post_update: PostUpdate = ...,
+    preconditions: Preconditions = Depends(get_preconditions),
     current_user: CurrentUser = Depends(get_current_user),
     post_service: PostService = Depends(get_post_service),
     db: Session = Depends(get_db)
@@ -116,17 +177,20 @@ async def update(
     - **post_id**: 수정할 게시글 ID
     - **title**: 새로운 제목 (선택사항)
     - **content**: 새로운 내용 (선택사항)
+    - **If-Match**: 수정 전 조회한 ETag (그 사이 다른 요청이 수정했으면 412)
     
     권한: 게시글 작성자만 수정 가능
 
     Returns:
-        PostResponse: 수정된 게시글 정보
+        PostResponse: 수정된 게시글 정보 (새 ETag 헤더 포함)
 
     Raises:
         HTTPException 403: 권한 없음
         HTTPException 404: 게시글 없음
+        HTTPException 412: 버전 불일치 (If-Match)
     """
-    return await post_service.update(post_id, post_update, current_user, db)
+    post, version = await post_service.update(post_id, post_update, current_user, db, preconditions.if_match)
+    return versioned_response(post, version)
 
 @router.delete("/posts/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete(
@@ -0,0 +1,22 @@
+import asyncio
+import logging
+from typing import Callable, List
+
+logger = logging.getLogger(__name__)
+
+
+async def run_periodically(interval: float, func: Callable[[], None]) -> None:
+    """interval 초마다 동기 함수를 스레드에서 실행 (이벤트 루프 블로킹 방지)"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(func)
+        except Exception as e:
+            logger.error(f"백그라운드 작업 실패 ({func.__qualname__}): {e}")
+
+
+async def cancel_tasks(tasks: List[asyncio.Task]) -> None:
+    """백그라운드 작업 종료"""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
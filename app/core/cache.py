@@ -0,0 +1,536 @@
+import asyncio
+import json
+import logging
+import math
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, NamedTuple, Optional, Tuple
+
+from redis import RedisError, WatchError
+
+from app.core.config import settings
+from app.core.metrics import registry
+from app.redis.session import redis_client
+
+logger = logging.getLogger(__name__)
+
+# 키가 많을 때 (게시판 삭제 등) DEL 한 번에 보낼 최대 키 수
+_DELETE_BATCH = 1000
+# 무효화 메시지에 넣는 워커 식별자 (자기 메시지는 이미 반영했으므로 건너뜀)
+_ORIGIN = uuid.uuid4().hex
+_MISSING = object()
+# 다른 워커의 로드를 기다릴 때 Redis 확인 간격 (초)
+_LEASE_POLL_INTERVAL = 0.02
+# load: 만료/미스 후 로드, early: 만료 전 조기 갱신, coalesced: 워커 안 같은 로드 결과 공유,
+# stale: 다른 요청이 갱신하는 동안 이전 값 응답, lease_wait: 다른 워커의 로드 결과 대기
+_LOAD_OUTCOMES = ("load", "early", "coalesced", "stale", "lease_wait")
+
+cache_requests_total = registry.counter(
+    "cache_requests_total",
+    "캐시 조회 수 (result: local_hit, redis_hit, miss / 적중률은 hit 합계 / 전체)",
+    ["namespace", "result"],
+)
+cache_invalidations_total = registry.counter(
+    "cache_invalidations_total",
+    "로컬 캐시에서 무효화한 키 수 (source: local 은 이 워커의 쓰기, remote 는 pub/sub 으로 받은 다른 워커의 쓰기)",
+    ["namespace", "source"],
+)
+cache_loads_total = registry.counter(
+    "cache_loads_total",
+    "get_or_load 결과별 수 (outcome: load, early, coalesced, stale, lease_wait)",
+    ["namespace", "outcome"],
+)
+
+
+class LocalCache:
+    """크기 제한 LRU + 항목별 만료 (프로세스 메모리, 스레드 안전)"""
+
+    def __init__(self, max_entries: Callable[[], int]):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        """항목 조회 (없거나 만료되면 _MISSING)"""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return _MISSING
+            if item[0] <= time.monotonic():
+                del self._entries[key]
+                return _MISSING
+            self._entries.move_to_end(key)
+            return item[1]
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """항목 저장 (최대 항목 수를 넘으면 가장 오래 쓰지 않은 항목부터 제거)"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(self._max_entries(), 0):
+                self._entries.popitem(last=False)
+
+    def discard(self, keys: Iterable[str]) -> int:
+        with self._lock:
+            return sum(self._entries.pop(key, None) is not None for key in keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SingleFlight:
+    """같은 키의 동시 로드를 하나로 합침 (워커 내, 먼저 온 요청이 로드하고 나머지는 결과를 공유)"""
+
+    class _Call:
+        __slots__ = ("done", "result", "error")
+
+        def __init__(self):
+            self.done = threading.Event()
+            self.result: Any = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "SingleFlight._Call"] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], Any], busy: Any = _MISSING, timeout: Optional[float] = None) -> Tuple[Any, bool]:
+        """fn 실행 결과와 직접 실행했는지 여부
+
+        이미 실행 중이면 busy 가 있을 때는 기다리지 않고 busy 를, 없으면 결과를 기다립니다.
+        timeout 초 안에 끝나지 않으면 기다리지 않고 직접 실행합니다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+        if not leader:
+            if busy is not _MISSING:
+                return busy, False
+            if not call.done.wait(timeout):
+                return fn(), True
+            if call.error is not None:
+                raise call.error
+            return call.result, False
+        try:
+            call.result = fn()
+            return call.result, True
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class _Entry(NamedTuple):
+    """캐시 항목 (값, 갱신 시각(epoch 초), 마지막 로드 소요 시간)"""
+
+    value: Any
+    fresh_until: float
+    delta: float
+
+
+def _on_event_loop() -> bool:
+    """이벤트 루프 스레드에서 호출했는지 여부 (async 엔드포인트/의존성에서 동기로 호출한 경우)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def lease_key(key: str) -> str:
+    """로드 lease 키 (예: cache:board:12:lease)"""
+    return f"{key}:lease"
+
+
+def _with_lease(key: str, token: str, write: Callable[[Any], Any]) -> bool:
+    """lease 가 아직 내 것이면 write 와 lease 해제를 한 트랜잭션으로 실행 (WATCH/MULTI)
+
+    로드 중 무효화되면 lease 도 지워지므로 무효화 전에 읽은 값을 저장하지 않습니다.
+    """
+    lease = lease_key(key)
+    with redis_client.pipeline() as pipe:
+        try:
+            pipe.watch(lease)
+            if pipe.get(lease) != token:
+                return False
+            pipe.multi()
+            write(pipe)
+            pipe.delete(lease)
+            pipe.execute()
+            return True
+        except WatchError:
+            return False
+
+
+class TieredCache:
+    """프로세스 내 LRU (L1) + Redis (L2) 캐시
+
+    조회는 L1 -> Redis 순서이고 Redis 에서 읽은 값은 L1 에 CACHE_LOCAL_MAX_STALENESS 초 (Redis TTL 이 더 짧으면 TTL) 동안 둡니다.
+    무효화는 Redis 에서 지운 뒤 pub/sub (CACHE_INVALIDATION_CHANNEL) 으로 모든 워커의 L1 에서도 지웁니다.
+    메시지를 놓치더라도 (구독 끊김 등) L1 항목은 MAX_STALENESS 초 후 만료되므로 그보다 오래된 값은 주지 않습니다.
+
+    get_or_load 는 캐시 스탬피드를 막습니다 (만료 직후 같은 키를 동시에 DB 에서 로드하는 것).
+    - 워커 안에서는 SingleFlight 로 동시 로드를 하나로 합치고, 워커 간에는 Redis lease (SET NX PX) 를 가진 요청만 로드
+    - 만료 전이라도 남은 시간이 로드 소요 시간에 가까울수록 높은 확률로 미리 갱신 (XFetch, CACHE_EARLY_REFRESH_BETA)
+    - 만료 후 CACHE_STALE_WHILE_REVALIDATE 초 동안은 lease 를 가진 요청이 갱신하는 사이 다른 요청에 이전 값을 응답
+    무효화한 항목은 Redis 에서 지우므로 이전 값을 응답하지 않습니다.
+    이벤트 루프 스레드에서 호출하면 다른 요청의 로드를 기다리지 않고 (루프 전체가 멈추므로) 이전 값이 없으면 직접 로드합니다.
+
+    plain=True 면 다른 곳에서 Redis 에 직접 쓰는 값 (세션 등) 을 그대로 읽으며 만료 시각 없이 Redis TTL 만 따릅니다.
+    L1 은 역직렬화한 값을 그대로 공유하므로 조회한 값을 수정하면 안 됩니다.
+    켜짐 여부와 TTL 은 호출할 때마다 설정에서 읽습니다. Redis 장애는 캐시 미스로 처리합니다.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        enabled: Callable[[], bool],
+        ttl: Callable[[], int],
+        max_entries: Callable[[], int] = lambda: settings.CACHE_LOCAL_MAX_ENTRIES,
+        plain: bool = False,
+    ):
+        if namespace in _caches:
+            raise ValueError(f"이미 등록된 캐시 네임스페이스입니다: {namespace}")
+        self.namespace = namespace
+        self.plain = plain
+        self._enabled = enabled
+        self._ttl = ttl
+        self._local = LocalCache(max_entries)
+        self._flight = SingleFlight()
+        # 무효화할 때마다 증가 (Redis 조회/로드 중 무효화되면 이전 값을 L1 에 넣거나 합친 로드로 공유하지 않도록)
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        self._local_hits = cache_requests_total.labels(namespace, "local_hit")
+        self._redis_hits = cache_requests_total.labels(namespace, "redis_hit")
+        self._misses = cache_requests_total.labels(namespace, "miss")
+        self._local_invalidations = cache_invalidations_total.labels(namespace, "local")
+        self._remote_invalidations = cache_invalidations_total.labels(namespace, "remote")
+        self._loads = {outcome: cache_loads_total.labels(namespace, outcome) for outcome in _LOAD_OUTCOMES}
+        _caches[namespace] = self
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled()
+
+    def _local_ttl(self) -> float:
+        return min(settings.CACHE_LOCAL_MAX_STALENESS, self._ttl())
+
+    def _encode(self, entry: _Entry) -> str:
+        payload = entry.value if self.plain else list(entry)
+        return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+
+    def _decode(self, raw: str) -> _Entry:
+        if self.plain:
+            return _Entry(json.loads(raw), math.inf, 0.0)
+        return _Entry(*json.loads(raw))
+
+    def _read(self, key: str) -> Optional[_Entry]:
+        """L1 -> Redis 순서로 항목 조회 (만료 후 stale 구간의 항목 포함)"""
+        local = settings.CACHE_LOCAL_ENABLED
+        if local:
+            entry = self._local.get(key)
+            if entry is not _MISSING:
+                self._local_hits.inc()
+                return entry
+        generation = self._generation
+        try:
+            raw = redis_client.get(key)
+        except RedisError as e:
+            logger.warning(f"캐시 조회 실패 ({key}): {e}")
+            raw = None
+        if not raw:
+            self._misses.inc()
+            return None
+        try:
+            entry = self._decode(raw)
+        except (TypeError, ValueError) as e:
+            # 형식이 다른 항목 (배포 중 이전 버전이 저장한 값 등) 은 미스로 처리
+            logger.warning(f"캐시 항목 형식 오류 ({key}): {e}")
+            self._misses.inc()
+            return None
+        self._redis_hits.inc()
+        if local and generation == self._generation:
+            self._local.set(key, entry, self._local_ttl())
+        return entry
+
+    def get(self, key: str) -> Any:
+        """캐시 항목 조회 (L1 -> Redis, 없거나 만료되었으면 None)"""
+        if not self._enabled():
+            return None
+        entry = self._read(key)
+        if entry is None or entry.fresh_until <= time.time():
+            return None
+        return entry.value
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """캐시 항목 조회, 없거나 갱신할 때가 되면 loader 로 로드해 저장 (loader 가 None 을 주면 저장하지 않음)
+
+        캐시를 끄면 loader 결과를 그대로 반환합니다.
+        """
+        if not self._enabled():
+            return loader()
+        entry = self._read(key)
+        now = time.time()
+        if entry is not None and now < entry.fresh_until and not self._refresh_early(entry, now):
+            return entry.value
+        # 갱신하는 동안 다른 요청에 응답할 값 (만료 전 조기 갱신이면 현재 값, 만료 후면 stale 구간 안의 이전 값)
+        current = entry if entry is not None and now < entry.fresh_until + settings.CACHE_STALE_WHILE_REVALIDATE else None
+        wait = not _on_event_loop()
+        value, leader = self._flight.do(
+            (key, self._generation),
+            lambda: self._load(key, loader, current, wait),
+            busy=current.value if current is not None else _MISSING,
+            timeout=settings.CACHE_LEASE_TIMEOUT if wait else 0,
+        )
+        if not leader:
+            self._loads["stale" if current is not None else "coalesced"].inc()
+        return value
+
+    @staticmethod
+    def _refresh_early(entry: _Entry, now: float) -> bool:
+        """만료 전 조기 갱신 여부 (XFetch: now - delta * beta * ln(rand) >= 만료 시각)"""
+        beta = settings.CACHE_EARLY_REFRESH_BETA
+        if beta <= 0 or entry.delta <= 0:
+            return False
+        return now - entry.delta * beta * math.log(1.0 - random.random()) >= entry.fresh_until
+
+    def _load(self, key: str, loader: Callable[[], Any], current: Optional[_Entry], wait: bool = True) -> Any:
+        """lease 를 얻어 로드 후 저장 (다른 워커가 로드 중이면 이전 값을 주거나, wait 면 저장될 때까지 대기)"""
+        generation = self._generation
+        token = self._acquire_lease(key)
+        if token is None:
+            if current is not None:
+                self._loads["stale"].inc()
+                return current.value
+            entry = self._wait_for_load(key) if wait else None
+            if entry is not None:
+                self._loads["lease_wait"].inc()
+                return entry.value
+            # 기다릴 수 없거나, lease 를 가진 워커가 제시간에 끝내지 못했거나 저장할 값이 없었음: 직접 로드 (lease 없이 저장)
+            token = ""
+        stored = False
+        try:
+            started = time.monotonic()
+            value = loader()
+            delta = time.monotonic() - started
+            self._loads["early" if current is not None and current.fresh_until > time.time() else "load"].inc()
+            if value is not None:
+                stored = self._store(key, _Entry(value, time.time() + self._ttl(), delta), token, generation)
+            return value
+        finally:
+            if token and not stored:
+                self._release_lease(key, token)
+
+    def _acquire_lease(self, key: str) -> Optional[str]:
+        """로드 lease (다른 워커가 가지고 있으면 None, Redis 장애면 빈 토큰으로 lease 없이 로드)"""
+        token = uuid.uuid4().hex
+        try:
+            acquired = redis_client.set(lease_key(key), token, nx=True, px=int(settings.CACHE_LEASE_TIMEOUT * 1000))
+        except RedisError as e:
+            logger.warning(f"캐시 lease 획득 실패 ({key}): {e}")
+            return ""
+        return token if acquired else None
+
+    def _release_lease(self, key: str, token: str) -> None:
+        try:
+            _with_lease(key, token, lambda pipe: None)
+        except RedisError as e:
+            logger.warning(f"캐시 lease 해제 실패 ({key}): {e}")
+
+    def _wait_for_load(self, key: str) -> Optional[_Entry]:
+        """다른 워커가 로드해 저장할 때까지 대기 (lease 가 풀리거나 CACHE_LEASE_TIMEOUT 초가 지나면 None)"""
+        deadline = time.monotonic() + settings.CACHE_LEASE_TIMEOUT
+        try:
+            while time.monotonic() < deadline:
+                time.sleep(_LEASE_POLL_INTERVAL)
+                raw, leased = redis_client.get(key), redis_client.exists(lease_key(key))
+                if raw:
+                    entry = self._decode(raw)
+                    if entry.fresh_until > time.time():
+                        return entry
+                if not leased:
+                    return None
+        except (RedisError, TypeError, ValueError) as e:
+            logger.warning(f"캐시 로드 대기 실패 ({key}): {e}")
+        return None
+
+    def _store(self, key: str, entry: _Entry, token: str, generation: int) -> bool:
+        """Redis (TTL + stale 구간 후 만료) 와 L1 에 저장 (lease 를 잃었으면 저장하지 않음)"""
+        raw = self._encode(entry)
+        px = int((self._ttl() + (0 if self.plain else settings.CACHE_STALE_WHILE_REVALIDATE)) * 1000)
+        try:
+            if token:
+                stored = _with_lease(key, token, lambda pipe: pipe.set(key, raw, px=px))
+            else:
+                stored = bool(redis_client.set(key, raw, px=px))
+        except RedisError as e:
+            logger.warning(f"캐시 저장 실패 ({key}): {e}")
+            return False
+        if stored and settings.CACHE_LOCAL_ENABLED and generation == self._generation:
+            self._local.set(key, entry, self._local_ttl())
+        return stored
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시 항목 저장 (Redis 는 TTL 후 만료, 실패해도 응답에는 영향 없음)"""
+        if not self._enabled():
+            return
+        self._store(key, _Entry(value, time.time() + self._ttl(), 0.0), "", self._generation)
+
+    def invalidate(self, keys: Iterable[str]) -> int:
+        """캐시 항목 삭제 (커밋 후 호출, Redis 에서 지운 키 수)
+
+        로드 중인 lease 도 지워 무효화 전에 읽은 값이 저장되지 않게 합니다.
+        Redis 삭제에 실패하면 Redis TTL 까지 이전 값이 남을 수 있습니다.
+        """
+        if not self._enabled():
+            return 0
+        keys = list(keys)
+        if not keys:
+            return 0
+        deleted = 0
+        try:
+            for start in range(0, len(keys), _DELETE_BATCH):
+                batch = keys[start:start + _DELETE_BATCH]
+                deleted += redis_client.delete(*batch)
+                if not self.plain:
+                    redis_client.delete(*map(lease_key, batch))
+        except RedisError as e:
+            logger.error(f"{self.namespace} 캐시 무효화 실패 ({', '.join(keys[:5])}): {e}")
+        self.evict(keys)
+        return deleted
+
+    def evict(self, keys: Iterable[str]) -> None:
+        """모든 워커의 L1 에서 삭제 (Redis 의 값을 직접 바꾼 뒤 호출, 예: 세션 재발급)"""
+        keys = list(keys)
+        self._evict_local(keys, self._local_invalidations)
+        self._publish(keys)
+
+    def _bump_generation(self) -> None:
+        # 요청 스레드와 무효화 구독 스레드가 동시에 증가시킴
+        with self._generation_lock:
+            self._generation += 1
+
+    def _evict_local(self, keys: Iterable[str], counter) -> None:
+        self._bump_generation()
+        counter.inc(self._local.discard(keys))
+
+    def clear_local(self) -> None:
+        self._bump_generation()
+        self._local.clear()
+
+    def _publish(self, keys: list) -> None:
+        if not settings.CACHE_LOCAL_ENABLED:
+            return
+        message = json.dumps({"origin": _ORIGIN, "namespace": self.namespace, "keys": keys}, ensure_ascii=False)
+        try:
+            redis_client.publish(settings.CACHE_INVALIDATION_CHANNEL, message)
+        except RedisError as e:
+            # 다른 워커는 MAX_STALENESS 초 후 L1 만료로 반영
+            logger.error(f"{self.namespace} 캐시 무효화 전파 실패 ({', '.join(keys[:5])}): {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 워커의 조회/적중 수와 적중률, 로드 결과별 수"""
+        local_hits, redis_hits, misses = self._local_hits.value, self._redis_hits.value, self._misses.value
+        total = local_hits + redis_hits + misses
+        return {
+            "local_entries": len(self._local),
+            "local_hits": local_hits,
+            "redis_hits": redis_hits,
+            "misses": misses,
+            "hit_ratio": (local_hits + redis_hits) / total if total else None,
+            "local_hit_ratio": local_hits / total if total else None,
+            "loads": {outcome: counter.value for outcome, counter in self._loads.items()},
+        }
+
+
+_caches: Dict[str, TieredCache] = {}
+
+
+def cache_stats() -> Dict[str, Dict[str, Any]]:
+    """네임스페이스별 캐시 통계 (현재 워커)"""
+    return {namespace: cache.stats() for namespace, cache in _caches.items()}
+
+
+def clear_local_caches() -> None:
+    """모든 네임스페이스의 L1 비우기"""
+    for cache in _caches.values():
+        cache.clear_local()
+
+
+class InvalidationListener:
+    """다른 워커의 캐시 무효화 메시지 구독 (워커마다 스레드 하나)
+
+    구독이 끊겼다 다시 연결되면 그 사이 메시지를 놓쳤을 수 있으므로 L1 을 모두 비웁니다.
+    """
+
+    def __init__(self, reconnect_delay: float = 1.0):
+        self.reconnect_delay = reconnect_delay
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="cache-invalidation", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """구독 종료 (대기 중인 스레드를 깨우려고 빈 메시지를 발행)"""
+        if not self.running:
+            return
+        self._stop.set()
+        try:
+            redis_client.publish(settings.CACHE_INVALIDATION_CHANNEL, "{}")
+        except RedisError:
+            pass
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            pubsub = redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                pubsub.subscribe(settings.CACHE_INVALIDATION_CHANNEL)
+                clear_local_caches()
+                for message in pubsub.listen():
+                    if self._stop.is_set():
+                        break
+                    if message["type"] == "message":
+                        self._handle(message["data"])
+            except RedisError as e:
+                logger.warning(f"캐시 무효화 구독 끊김, {self.reconnect_delay}초 후 재연결: {e}")
+                clear_local_caches()
+                self._stop.wait(self.reconnect_delay)
+            finally:
+                pubsub.close()
+
+    @staticmethod
+    def _handle(data: str) -> None:
+        try:
+            message = json.loads(data)
+            if message.get("origin") == _ORIGIN:
+                return
+            cache = _caches.get(message.get("namespace"))
+            if cache is not None:
+                cache._evict_local(message["keys"], cache._remote_invalidations)
+        except (TypeError, ValueError, KeyError, AttributeError) as e:
+            logger.warning(f"잘못된 캐시 무효화 메시지 무시: {e}")
+
+
+invalidation_listener = InvalidationListener()
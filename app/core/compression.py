@@ -0,0 +1,138 @@
+import zlib
+from functools import lru_cache
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+from app.core.negotiation import media_type_of, parse_quality_values
+
+# zstd: Python 3.14+ 표준 라이브러리 또는 zstandard 패키지, br: brotli 패키지 (없으면 해당 인코딩 미지원)
+try:
+    from compression import zstd as _stdlib_zstd
+except ImportError:
+    _stdlib_zstd = None
+try:
+    import zstandard as _zstandard
+except ImportError:
+    _zstandard = None
+try:
+    import brotli as _brotli
+except ImportError:
+    _brotli = None
+
+
+class GzipStream:
+    """gzip 스트리밍 압축 (청크마다 sync flush 해 클라이언트가 바로 풀 수 있게)"""
+
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int):
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.compress(chunk) + self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class BrotliStream:
+    __slots__ = ("_obj",)
+
+    def __init__(self, quality: int):
+        self._obj = _brotli.Compressor(quality=quality)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.process(chunk) + self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class StdlibZstdStream:
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int):
+        self._obj = _stdlib_zstd.ZstdCompressor(level)
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.compress(chunk, _stdlib_zstd.ZstdCompressor.FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class ZstandardStream:
+    __slots__ = ("_obj",)
+
+    def __init__(self, level: int):
+        self._obj = _zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, chunk: bytes) -> bytes:
+        return self._obj.compress(chunk) + self._obj.flush(_zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class Codec(NamedTuple):
+    """Content-Encoding 하나 (한 번에 압축 / 스트리밍 압축기 생성)"""
+
+    name: str
+    compress: Callable[[bytes], bytes]
+    stream: Callable[[], object]
+
+
+def _available_codecs() -> Dict[str, Codec]:
+    codecs = {
+        "gzip": Codec(
+            "gzip",
+            lambda data: zlib.compress(data, settings.COMPRESSION_GZIP_LEVEL, wbits=31),
+            lambda: GzipStream(settings.COMPRESSION_GZIP_LEVEL),
+        ),
+    }
+    if _brotli is not None:
+        codecs["br"] = Codec(
+            "br",
+            lambda data: _brotli.compress(data, quality=settings.COMPRESSION_BROTLI_QUALITY),
+            lambda: BrotliStream(settings.COMPRESSION_BROTLI_QUALITY),
+        )
+    if _stdlib_zstd is not None:
+        codecs["zstd"] = Codec(
+            "zstd",
+            lambda data: _stdlib_zstd.compress(data, settings.COMPRESSION_ZSTD_LEVEL),
+            lambda: StdlibZstdStream(settings.COMPRESSION_ZSTD_LEVEL),
+        )
+    elif _zstandard is not None:
+        # ZstdCompressor 는 스레드 간 공유하면 안 되므로 호출마다 생성
+        codecs["zstd"] = Codec(
+            "zstd",
+            lambda data: _zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compress(data),
+            lambda: ZstandardStream(settings.COMPRESSION_ZSTD_LEVEL),
+        )
+    return codecs
+
+
+CODECS = _available_codecs()
+
+
+@lru_cache(maxsize=128)
+def negotiate_encoding(accept_encoding: str, preference: Tuple[str, ...]) -> Optional[str]:
+    """Accept-Encoding 헤더 -> 사용할 인코딩 (없으면 None, 압축하지 않음)
+
+    q 값이 가장 큰 인코딩을 고르고 같으면 서버 선호 순서(preference)를 따릅니다.
+    q=0 은 거부, * 는 명시하지 않은 나머지 인코딩에 적용됩니다.
+    헤더 값은 클라이언트별로 몇 가지뿐이라 결과를 캐시합니다.
+    """
+    weights = parse_quality_values(accept_encoding)
+    best, best_q = None, 0.0
+    for coding in preference:
+        q = weights.get(coding, weights.get("*", 0.0))
+        if coding in CODECS and q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """압축 대상 Content-Type 인지 (COMPRESSION_CONTENT_TYPES 접두어 기준, 이미지/압축 파일 등은 제외)"""
+    media_type = media_type_of(content_type)
+    return bool(media_type) and media_type.startswith(tuple(settings.COMPRESSION_CONTENT_TYPES))
@@ -0,0 +1,82 @@
+import zlib
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import List, NamedTuple
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class ResourceVersion(NamedTuple):
+    """리소스 버전 (ETag 의 버전 부분, Last-Modified)
+
+    tag 는 행을 식별하는 값과 updated_at(마이크로초)으로 만들며 수정될 때마다 바뀝니다.
+    """
+
+    tag: str
+    last_modified: datetime
+
+    @classmethod
+    def of(cls, updated_at: datetime, *parts: object) -> "ResourceVersion":
+        """updated_at 과 버전을 구분하는 값들 (id, posts_count 등) -> 버전"""
+        micros = (as_utc(updated_at) - _EPOCH) // _MICROSECOND
+        return cls("-".join([*(str(part) for part in parts), format(micros, "x")]), updated_at)
+
+    def etag(self, variant: str = "") -> str:
+        """강한 ETag (?fields= 나 응답 형식이 다른 표현은 variant 로 구분, 예: "12-5f3a1c0e2b4d0+1a2b3c4d")"""
+        if not variant:
+            return f'"{self.tag}"'
+        return f'"{self.tag}+{zlib.crc32(variant.encode()):08x}"'
+
+
+def _opaque_tags(header: str) -> List[str]:
+    """If-None-Match/If-Match 헤더 -> 따옴표 안의 태그 목록 (약한 태그의 W/ 는 제거)"""
+    tags = []
+    for item in header.split(","):
+        item = item.strip()
+        if item.startswith("W/"):
+            item = item[2:]
+        if len(item) >= 2 and item[0] == item[-1] == '"':
+            tags.append(item[1:-1])
+    return tags
+
+
+def none_match(header: str, etag: str) -> bool:
+    """If-None-Match 가 현재 ETag 와 일치하는지 (약한 비교, * 는 항상 일치) -> True 면 304"""
+    if header.strip() == "*":
+        return True
+    return etag.strip('"') in _opaque_tags(header)
+
+
+def version_matches(header: str, version: ResourceVersion) -> bool:
+    """If-Match 가 현재 버전과 일치하는지 (* 는 항상 일치)
+
+    태그의 버전 부분만 비교하므로 ?fields=, MessagePack, 압축 응답(W/) 에서 받은 ETag 로도
+    같은 버전이면 수정할 수 있습니다.
+    """
+    if header.strip() == "*":
+        return True
+    return any(tag.partition("+")[0] == version.tag for tag in _opaque_tags(header))
+
+
+def not_modified_since(header: str, last_modified: datetime) -> bool:
+    """If-Modified-Since 이후 수정되지 않았는지 (HTTP 날짜는 초 단위, 잘못된 날짜는 무시)"""
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return as_utc(last_modified).replace(microsecond=0) <= since
+
+
+def http_date(value: datetime) -> str:
+    """datetime -> HTTP 날짜 (Last-Modified 헤더 형식)"""
+    return format_datetime(as_utc(value), usegmt=True)
+
+
+def as_utc(value: datetime) -> datetime:
+    """timezone 있는 UTC datetime 으로 (SQLite 는 timezone 없이 UTC 로 저장하므로 naive 값은 UTC 로 간주)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -40,6 +40,20 @@ class ConflictError(HTTPException):
             detail=detail,
         )
 
+class GoneError(HTTPException):
+    def __init__(self, detail: str = "Gone"):
+        super().__init__(
+            status_code=status.HTTP_410_GONE,
+            detail=detail,
+        )
+
+class PreconditionFailedError(HTTPException):
+    def __init__(self, detail: str = "Precondition failed"):
+        super().__init__(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=detail,
+        )
+
 class InternalServerError(HTTPException):
     def __init__(self, detail: str = "Internal server error"):
         super().__init__(
@@ -0,0 +1,72 @@
+from bisect import bisect_left
+from typing import Dict, List, Sequence
+
+
+def log_scale_bounds(start: float, factor: float, end: float) -> List[float]:
+    """start 부터 end 까지 factor 배씩 증가하는 버킷 경계값 생성"""
+    bounds = []
+    value = start
+    while value < end:
+        bounds.append(round(value, 4))
+        value *= factor
+    bounds.append(round(value, 4))
+    return bounds
+
+
+# 0.05ms ~ 약 2분, 20% 간격 (분위수 상대 오차 10% 이내)
+LATENCY_BOUNDS_MS = log_scale_bounds(0.05, 1.2, 120_000)
+
+
+class FixedBucketHistogram:
+    """고정 버킷 히스토그램
+
+    버킷 수가 고정되어 있어 관측 횟수와 무관하게 메모리 사용량이 일정하고,
+    같은 경계값을 쓰는 히스토그램끼리는 버킷별 합산으로 병합할 수 있습니다 (워커 간 집계).
+    """
+
+    __slots__ = ("bounds", "counts", "count", "total")
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BOUNDS_MS):
+        self.bounds = bounds
+        # 마지막 칸은 최대 경계값을 넘는 관측치 (+Inf)
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float:
+        """버킷 내 선형 보간으로 분위수 추정"""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self.bounds[index - 1] if index > 0 else 0.0
+                upper = self.bounds[index] if index < len(self.bounds) else self.bounds[-1]
+                return lower + (upper - lower) * ((rank - cumulative) / bucket_count)
+            cumulative += bucket_count
+        return self.bounds[-1]
+
+    def merge(self, other: "FixedBucketHistogram") -> None:
+        if list(other.bounds) != list(self.bounds):
+            raise ValueError("버킷 경계값이 다른 히스토그램은 병합할 수 없습니다")
+        for index, bucket_count in enumerate(other.counts):
+            self.counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+
+    def to_dict(self) -> Dict:
+        return {"counts": list(self.counts), "count": self.count, "total": self.total}
+
+    @classmethod
+    def from_dict(cls, data: Dict, bounds: Sequence[float] = LATENCY_BOUNDS_MS) -> "FixedBucketHistogram":
+        histogram = cls(bounds)
+        histogram.counts = list(data["counts"])
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        return histogram
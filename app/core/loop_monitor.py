@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# 캡처할 스택 최대 프레임 수 (안쪽 프레임 기준)
+_MAX_STACK_FRAMES = 30
+# 보관할 최근 블로킹 이벤트 수
+_MAX_EVENTS = 50
+# 프로젝트 루트 (블로킹 위치를 라이브러리가 아닌 프로젝트 코드 기준으로 표시)
+_PROJECT_ROOT = str(Path(__file__).resolve().parents[2])
+
+event_loop_lag_seconds = registry.histogram(
+    "event_loop_lag_seconds",
+    "이벤트 루프 지연 (예정된 heartbeat 대비 늦어진 시간, 초)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+event_loop_blocked_total = registry.counter(
+    "event_loop_blocked_total", "임계값 이상 이벤트 루프를 점유한 콜백 수"
+)
+
+
+def _project_frame(stack: List[traceback.FrameSummary]) -> Optional[str]:
+    """스택에서 가장 안쪽의 프로젝트 코드 프레임 위치 (설치된 라이브러리 제외)"""
+    for frame in reversed(stack):
+        filename = frame.filename
+        if filename.startswith(_PROJECT_ROOT) and "site-packages" not in filename and filename != __file__:
+            return f"{filename}:{frame.lineno} in {frame.name}"
+    return None
+
+
+class LoopMonitor:
+    """이벤트 루프 블로킹 감지기
+
+    루프에서 interval 마다 heartbeat 를 기록하고, 감시 스레드가 heartbeat 가
+    threshold 이상 멈춘 것을 발견하면 그 순간 루프 스레드의 스택을 캡처합니다.
+    동기 DB/Redis/bcrypt 호출이 async 핸들러에서 루프를 막는 지점을 찾는 용도입니다.
+    """
+
+    def __init__(self, interval: float, threshold_ms: float):
+        self.interval = interval
+        self.threshold_ms = threshold_ms
+        self.events: Deque[Dict[str, Any]] = deque(maxlen=_MAX_EVENTS)
+        self._last_beat = time.perf_counter()
+        self._beat_count = 0
+        self._loop_thread_id: Optional[int] = None
+        self._pending: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def enabled(self) -> bool:
+        return self._task is not None
+
+    def start(self) -> None:
+        """실행 중인 이벤트 루프에서 호출 (heartbeat 작업과 감시 스레드 시작)"""
+        if self.enabled:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stop.clear()
+        self._task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._thread.start()
+
+    async def stop(self) -> None:
+        if not self.enabled:
+            return
+        self._stop.set()
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        self._thread = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            lag = max(now - expected, 0.0)
+            event_loop_lag_seconds.observe(lag)
+            pending = self._pending
+            if pending is not None:
+                # 블로킹이 끝난 뒤 실제 점유 시간 기록
+                pending["duration_ms"] = round(lag * 1000, 3)
+                self._pending = None
+            self._last_beat = now
+            self._beat_count += 1
+
+    def _watch(self) -> None:
+        reported_beat = -1
+        while not self._stop.wait(min(self.interval, self.threshold_ms / 1000) / 2):
+            stalled_ms = (time.perf_counter() - self._last_beat - self.interval) * 1000
+            beat = self._beat_count
+            if stalled_ms < self.threshold_ms or beat == reported_beat:
+                continue
+            # 같은 블로킹 구간은 한 번만 보고
+            reported_beat = beat
+            self._report(stalled_ms)
+
+    def _report(self, stalled_ms: float) -> None:
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return
+        stack = traceback.extract_stack(frame)[-_MAX_STACK_FRAMES:]
+        event = {
+            "detected_at": time.time(),
+            "stalled_ms": round(stalled_ms, 3),
+            "duration_ms": None,
+            "location": _project_frame(stack),
+            "stack": traceback.format_list(stack),
+        }
+        self.events.append(event)
+        self._pending = event
+        event_loop_blocked_total.inc()
+        logger.warning(
+            f"이벤트 루프 블로킹 감지 ({stalled_ms:.0f}ms 이상, 위치: {event['location']})\n"
+            + "".join(event["stack"])
+        )
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "interval": self.interval,
+            "threshold_ms": self.threshold_ms,
+            "events": list(self.events),
+        }
+
+
+loop_monitor = LoopMonitor(settings.LOOP_MONITOR_INTERVAL, settings.LOOP_MONITOR_THRESHOLD_MS)
@@ -0,0 +1,259 @@
+import copy
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.histogram import FixedBucketHistogram
+
+# Prometheus 기본 버킷 (초 단위 지연시간)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+# 응답 크기 버킷 (바이트)
+SIZE_BUCKETS = (128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+LabelValues = Tuple[str, ...]
+
+
+class CounterChild:
+    """라벨 값이 고정된 카운터 (핫패스에서는 child를 미리 받아 inc만 호출)
+
+    GIL 하에서 단순 덧셈만 수행하며 락을 잡지 않습니다.
+    스레드 경합 시 드물게 증가분이 유실될 수 있지만 모니터링 용도로는 허용합니다.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class HistogramChild(FixedBucketHistogram):
+    __slots__ = ()
+
+    observe = FixedBucketHistogram.record
+
+
+class Metric(ABC):
+    """라벨별 child를 가지는 메트릭 공통 클래스"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[LabelValues, object] = {}
+
+    @abstractmethod
+    def _new_child(self):
+        """라벨 조합 하나에 해당하는 child 생성"""
+
+    def labels(self, *values: str):
+        """라벨 값에 해당하는 child 반환 (없으면 생성)"""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 라벨 수가 맞지 않습니다 ({self.labelnames})")
+            child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def collect(self) -> Dict:
+        """스냅샷 (워커 간 병합/렌더링 공통 형식)"""
+        return {
+            "type": self.type_name,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "samples": [[list(values), child.value] for values, child in list(self._children.items())],
+        }
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def _new_child(self):
+        return CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """게이지 (callback 지정 시 수집 시점에 값을 계산)"""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], float]] = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def _new_child(self):
+        return GaugeChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def collect(self) -> Dict:
+        if self.callback is not None:
+            self.labels().set(float(self.callback()))
+        return super().collect()
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def _new_child(self):
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def collect(self) -> Dict:
+        return {
+            "type": self.type_name,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "buckets": list(self.buckets),
+            "samples": [[list(values), child.to_dict()] for values, child in list(self._children.items())],
+        }
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"이미 등록된 메트릭입니다: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], float]] = None,
+    ) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames, callback))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def snapshot(self) -> Dict[str, Dict]:
+        return {name: metric.collect() for name, metric in self._metrics.items()}
+
+
+def merge_metric_snapshots(snapshots: Iterable[Dict[str, Dict]]) -> Dict[str, Dict]:
+    """여러 워커의 스냅샷 병합 (카운터/게이지는 합계, 히스토그램은 버킷별 합계)"""
+    merged: Dict[str, Dict] = {}
+    indexes: Dict[str, Dict[LabelValues, list]] = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            if name not in merged:
+                merged[name] = {**metric, "samples": []}
+                indexes[name] = {}
+            target, index = merged[name], indexes[name]
+            for values, value in metric["samples"]:
+                key = tuple(values)
+                existing = index.get(key)
+                if existing is None:
+                    index[key] = [values, copy.deepcopy(value)]
+                    target["samples"].append(index[key])
+                elif metric["type"] == "histogram":
+                    histogram = existing[1]
+                    histogram["counts"] = [a + b for a, b in zip(histogram["counts"], value["counts"])]
+                    histogram["count"] += value["count"]
+                    histogram["total"] += value["total"]
+                else:
+                    existing[1] += value
+    return merged
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labelnames: List[str], values: List[str], extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def render_prometheus(snapshot: Dict[str, Dict]) -> str:
+    """Prometheus text exposition format (0.0.4) 렌더링"""
+    lines: List[str] = []
+    for name, metric in snapshot.items():
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        labelnames = metric["labelnames"]
+        for values, value in metric["samples"]:
+            if metric["type"] != "histogram":
+                lines.append(f"{name}{_format_labels(labelnames, values)} {_format_value(value)}")
+                continue
+            cumulative = 0
+            bounds = metric["buckets"] + [float("inf")]
+            for bound, bucket_count in zip(bounds, value["counts"]):
+                cumulative += bucket_count
+                le = _format_value(bound)
+                lines.append(f"{name}_bucket{_format_labels(labelnames, values, ('le', le))} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labelnames, values)} {_format_value(value['total'])}")
+            lines.append(f"{name}_count{_format_labels(labelnames, values)} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+registry = Registry()
@@ -0,0 +1,53 @@
+from functools import lru_cache
+from typing import Dict
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+# MessagePack 으로 인식하는 미디어 타입 (등록된 타입과 널리 쓰이는 비표준 별칭)
+MSGPACK_MEDIA_TYPES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"})
+
+
+def parse_quality_values(header: str) -> Dict[str, float]:
+    """Accept/Accept-Encoding 헤더 -> {값: q} (소문자, q 가 없으면 1, 잘못된 q 는 0)"""
+    weights: Dict[str, float] = {}
+    for item in header.lower().split(","):
+        value, _, params = item.partition(";")
+        value = value.strip()
+        if not value:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, raw = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(raw)
+                except ValueError:
+                    q = 0.0
+        weights[value] = q
+    return weights
+
+
+def media_type_of(content_type: str) -> str:
+    """Content-Type 헤더 -> 파라미터를 뺀 소문자 미디어 타입"""
+    return content_type.partition(";")[0].strip().lower()
+
+
+@lru_cache(maxsize=128)
+def negotiate_media_type(accept: str) -> str:
+    """Accept 헤더 -> 응답 미디어 타입 (JSON 또는 MessagePack, 기본은 JSON)
+
+    MessagePack 의 q 가 JSON 보다 크거나, 같으면서 MessagePack 만 명시했을 때
+    (예: application/msgpack, */*) MessagePack 을 고릅니다.
+    """
+    weights = parse_quality_values(accept)
+    msgpack_q = max((weights.get(media_type, 0.0) for media_type in MSGPACK_MEDIA_TYPES), default=0.0)
+    if msgpack_q <= 0:
+        return JSON_MEDIA_TYPE
+    json_explicit = JSON_MEDIA_TYPE in weights
+    if json_explicit:
+        json_q = weights[JSON_MEDIA_TYPE]
+    else:
+        json_q = max(weights.get("application/*", 0.0), weights.get("*/*", 0.0))
+    if msgpack_q > json_q or (msgpack_q == json_q and not json_explicit):
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
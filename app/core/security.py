@@ -1,3 +1,6 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, UTC
 from typing import Optional
 from jose import JWTError, jwt
@@ -6,6 +9,13 @@ from app.core.config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt 전용 스레드풀 (CPU 바운드 해싱이 이벤트 루프를 막지 않도록)
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=settings.BCRYPT_WORKERS, thread_name_prefix="bcrypt"
+)
+_bcrypt_pending = 0
+_bcrypt_pending_lock = threading.Lock()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
@@ -17,6 +27,40 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def bcrypt_pending_tasks() -> int:
+    """bcrypt 스레드풀에서 실행 중이거나 대기 중인 작업 수"""
+    return _bcrypt_pending
+
+
+def bcrypt_queue_depth() -> int:
+    """bcrypt 스레드풀에서 워커를 기다리는 작업 수"""
+    return max(_bcrypt_pending - settings.BCRYPT_WORKERS, 0)
+
+
+def _track_pending(delta: int) -> None:
+    global _bcrypt_pending
+    with _bcrypt_pending_lock:
+        _bcrypt_pending += delta
+
+
+async def _run_bcrypt(func, *args):
+    _track_pending(1)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_bcrypt_executor, func, *args)
+    finally:
+        _track_pending(-1)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (bcrypt 스레드풀에서 실행)"""
+    return await _run_bcrypt(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """비밀번호 해싱 (bcrypt 스레드풀에서 실행)"""
+    return await _run_bcrypt(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """JWT 액세스 토큰 생성"""
     to_encode = data.copy()
@@ -4,8 +4,15 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 
 from app.redis.session import redis_client
+from app.core.cache import TieredCache
 from app.core.config import settings
 
+# 세션 조회 캐시 (저장/삭제는 Redis 에 직접 하고 L1 만 무효화, 요청마다 하던 세션 조회는 L1 에서)
+# 세션 값은 캐시 봉투가 아닌 JSON 그대로 저장하므로 plain=True
+session_cache = TieredCache(
+    "session", lambda: True, lambda: settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60, plain=True
+)
+
 
 def create_session(user_id: int, access_token: str, user_info: Dict[str, Any]) -> str:
     session_key = f"session:{user_id}"
@@ -23,12 +30,13 @@ def create_session(user_id: int, access_token: str, user_info: Dict[str, Any]) -
         json.dumps(session_data, ensure_ascii=False),
         ex=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     )
+    # 다시 로그인하면 워커들의 L1 에 남은 이전 토큰 세션을 지움
+    session_cache.evict([session_key])
     return session_key
 
 def _get_session(user_id: int) -> Optional[Dict[str, Any]]:
     session_key = f"session:{user_id}"
-    raw = redis_client.get(session_key)
-    return json.loads(raw) if raw else None
+    return session_cache.get(session_key)
 
 def validate_session(user_id: int, access_token: str) -> bool:
     session_data = _get_session(user_id)
@@ -53,4 +61,5 @@ def validate_session(user_id: int, access_token: str) -> bool:
 def delete_session(user_id: int) -> bool:
     session_key = f"session:{user_id}"
     result = redis_client.delete(session_key)
+    session_cache.evict([session_key])
     return result > 0
\ No newline at end of file
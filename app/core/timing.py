@@ -0,0 +1,78 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, Optional
+
+# Server-Timing 항목 설명 (브라우저 개발자 도구에 표시)
+TIMING_DESCRIPTIONS = {
+    "auth": "JWT decode",
+    "session": "Redis session validation",
+    "redis": "Redis total",
+    "db": "DB total",
+    "app": "Service logic (excl. DB/Redis)",
+    "ser": "Response serialization",
+    "total": "Total",
+}
+
+
+class RequestTimings:
+    """요청 하나의 구간별 누적 시간 (ms)"""
+
+    __slots__ = ("started", "durations", "endpoint_finished")
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.durations: Dict[str, float] = {}
+        self.endpoint_finished: Optional[float] = None
+
+    def add(self, name: str, duration_ms: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + duration_ms
+
+    def get(self, name: str) -> float:
+        return self.durations.get(name, 0.0)
+
+    def header_value(self) -> str:
+        """Server-Timing 헤더 값 (total 은 헤더 생성 시점까지의 경과 시간)"""
+        durations = dict(self.durations)
+        durations["total"] = (time.perf_counter() - self.started) * 1000
+        return ", ".join(
+            f'{name};dur={duration:.2f};desc="{TIMING_DESCRIPTIONS.get(name, name)}"'
+            for name, duration in durations.items()
+        )
+
+
+_request_timings: ContextVar[Optional[RequestTimings]] = ContextVar("request_timings", default=None)
+
+
+def start_request_timings() -> Token:
+    """현재 컨텍스트(요청)에서 타이밍 수집 시작"""
+    return _request_timings.set(RequestTimings())
+
+
+def reset_request_timings(token: Token) -> None:
+    _request_timings.reset(token)
+
+
+def current_timings() -> Optional[RequestTimings]:
+    return _request_timings.get()
+
+
+def record_timing(name: str, duration_ms: float) -> None:
+    """타이밍 수집 중인 요청이면 구간 시간 누적"""
+    timings = _request_timings.get()
+    if timings is not None:
+        timings.add(name, duration_ms)
+
+
+@contextmanager
+def measure(name: str) -> Iterator[None]:
+    """with 블록 실행 시간을 구간 시간으로 누적"""
+    timings = _request_timings.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, (time.perf_counter() - started) * 1000)
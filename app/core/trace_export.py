@@ -0,0 +1,167 @@
+import json
+import logging
+import queue
+import socket
+import threading
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.tracing import Span, Trace
+
+logger = logging.getLogger(__name__)
+
+SCOPE_NAME = "app.core.tracing"
+
+
+def _attribute_value(value: Any) -> Dict[str, Any]:
+    """OTLP AnyValue 인코딩"""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _attribute_value(value)} for key, value in attributes.items()]
+
+
+def encode_span(span: Span) -> Dict[str, Any]:
+    data = {
+        "traceId": span.trace.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": span.kind,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": _attributes(span.attributes),
+        "status": {"code": span.status},
+    }
+    if span.parent_id is not None:
+        data["parentSpanId"] = span.parent_id
+    return data
+
+
+def encode_traces(traces: List[Trace]) -> Dict[str, Any]:
+    """OTLP/JSON ExportTraceServiceRequest 인코딩"""
+    resource = {
+        "service.name": settings.PROJECT_NAME,
+        "service.version": settings.VERSION,
+        "deployment.environment": settings.ENVIRONMENT,
+        "host.name": socket.gethostname(),
+    }
+    return {
+        "resourceSpans": [{
+            "resource": {"attributes": _attributes(resource)},
+            "scopeSpans": [{
+                "scope": {"name": SCOPE_NAME},
+                "spans": [encode_span(span) for trace in traces for span in trace.spans],
+            }],
+        }]
+    }
+
+
+class FileTraceWriter:
+    """OTLP/JSON 요청을 한 줄씩 파일에 기록 (JSON Lines)"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def write(self, payload: Dict[str, Any]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(payload, separators=(",", ":")) + "\n")
+
+
+class OTLPHttpTraceWriter:
+    """OTLP/HTTP JSON 으로 컬렉터에 전송 (예: http://localhost:4318/v1/traces)"""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self.timeout = timeout
+
+    def write(self, payload: Dict[str, Any]) -> None:
+        request = urllib.request.Request(
+            self.endpoint,
+            data=json.dumps(payload, separators=(",", ":")).encode(),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout):
+            pass
+
+
+class BatchTraceExporter:
+    """샘플링된 트레이스를 큐에 모아 별도 스레드에서 배치로 내보냄
+
+    요청 처리 경로에서는 큐에 넣기만 하며, 큐가 가득 차면 트레이스를 버립니다.
+    """
+
+    def __init__(self, writer, batch_size: int, interval: float, max_queue_size: int = 2048):
+        self.writer = writer
+        self.batch_size = batch_size
+        self.interval = interval
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Trace]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def export(self, trace: Trace) -> None:
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch: List[Trace] = []
+            stop = False
+            try:
+                item = self._queue.get(timeout=self.interval)
+                while True:
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    item = self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            if batch:
+                self._flush(batch)
+            if stop:
+                return
+
+    def _flush(self, batch: List[Trace]) -> None:
+        try:
+            self.writer.write(encode_traces(batch))
+        except Exception as e:
+            logger.error(f"트레이스 내보내기 실패 ({len(batch)}건): {e}")
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """남은 트레이스를 내보내고 스레드 종료"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
+
+
+def create_exporter() -> BatchTraceExporter:
+    """설정에 따른 exporter 생성 (file: JSON Lines 파일, otlp: OTLP/HTTP 컬렉터)"""
+    if settings.TRACING_EXPORTER == "otlp":
+        writer = OTLPHttpTraceWriter(settings.TRACING_OTLP_ENDPOINT)
+    else:
+        writer = FileTraceWriter(settings.TRACING_EXPORT_FILE)
+    return BatchTraceExporter(writer, settings.TRACING_BATCH_SIZE, settings.TRACING_EXPORT_INTERVAL)
@@ -0,0 +1,204 @@
+import functools
+import inspect
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from app.core.config import settings
+
+# OTLP SpanKind
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# OTLP StatusCode
+STATUS_UNSET = 0
+STATUS_ERROR = 2
+
+
+class Span:
+    """작업 구간 하나 (시간은 epoch 나노초)"""
+
+    __slots__ = ("trace", "span_id", "parent_id", "name", "kind", "start_ns", "end_ns", "attributes", "status")
+
+    def __init__(
+        self,
+        trace: "Trace",
+        name: str,
+        parent_id: Optional[str],
+        kind: int = SPAN_KIND_INTERNAL,
+        start_ns: Optional[int] = None,
+    ):
+        self.trace = trace
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = start_ns if start_ns is not None else time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {}
+        self.status = STATUS_UNSET
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, error: BaseException) -> None:
+        self.status = STATUS_ERROR
+        self.attributes["exception.type"] = type(error).__name__
+
+    def end(self, end_ns: Optional[int] = None) -> None:
+        if self.end_ns is None:
+            self.end_ns = end_ns if end_ns is not None else time.time_ns()
+            self.trace.finish(self)
+
+
+class Trace:
+    """요청 하나의 span 모음
+
+    샘플링은 루트 span 종료 시점에 결정합니다 (tail sampling).
+    확률 샘플링에 걸리지 않았더라도 느리거나 에러가 난 트레이스는 항상 보관합니다.
+    """
+
+    __slots__ = ("trace_id", "spans", "dropped_spans", "sampled", "has_error")
+
+    def __init__(self):
+        self.trace_id = f"{random.getrandbits(128):032x}"
+        self.spans: List[Span] = []
+        self.dropped_spans = 0
+        self.sampled = random.random() < settings.TRACING_SAMPLE_RATE
+        self.has_error = False
+
+    def finish(self, span: Span) -> None:
+        if span.status == STATUS_ERROR:
+            self.has_error = True
+        if span.parent_id is None:
+            # 루트 span 은 가장 마지막에 종료되므로 예약해 둔 자리에 항상 보관하고 버린 span 수를 기록
+            if self.dropped_spans:
+                span.set_attribute("tracing.dropped_spans", self.dropped_spans)
+            self.spans.append(span)
+            return
+        # 트레이스당 span 수 상한 (N+1 쿼리 등으로 메모리가 커지는 것 방지, 루트 span 몫 1개 예약)
+        if len(self.spans) >= settings.TRACING_MAX_SPANS_PER_TRACE - 1:
+            self.dropped_spans += 1
+            return
+        self.spans.append(span)
+
+    def should_export(self, root: Span) -> bool:
+        return self.sampled or self.has_error or root.duration_ms >= settings.TRACING_SLOW_THRESHOLD_MS
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+# 샘플링된 트레이스를 받는 함수 (내보내기)
+_trace_handlers: List[Callable[[Trace], None]] = []
+
+
+def add_trace_handler(handler: Callable[[Trace], None]) -> None:
+    """샘플링된 트레이스 처리 함수 등록"""
+    if handler not in _trace_handlers:
+        _trace_handlers.append(handler)
+
+
+def remove_trace_handler(handler: Callable[[Trace], None]) -> None:
+    if handler in _trace_handlers:
+        _trace_handlers.remove(handler)
+
+
+def current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+def start_trace(name: str, kind: int = SPAN_KIND_SERVER) -> tuple[Span, Token]:
+    """새 트레이스의 루트 span 시작 (요청 단위)"""
+    root = Span(Trace(), name, None, kind)
+    return root, _current_span.set(root)
+
+
+def end_trace(root: Span, token: Token) -> None:
+    """루트 span 종료 후 샘플링 대상이면 핸들러로 전달"""
+    _current_span.reset(token)
+    root.end()
+    trace = root.trace
+    if not trace.should_export(root):
+        return
+    for handler in _trace_handlers:
+        handler(trace)
+
+
+@contextmanager
+def start_span(name: str, kind: int = SPAN_KIND_INTERNAL, **attributes: Any) -> Iterator[Optional[Span]]:
+    """현재 span의 자식 span 시작 (진행 중인 트레이스가 없으면 아무것도 하지 않음)"""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    span = Span(parent.trace, name, parent.span_id, kind)
+    span.attributes.update(attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.record_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+def record_span(name: str, duration_ms: float, kind: int = SPAN_KIND_CLIENT, **attributes: Any) -> None:
+    """이미 끝난 작업을 현재 span의 자식으로 기록 (SQL/Redis 옵저버용)"""
+    parent = _current_span.get()
+    if parent is None:
+        return
+    end_ns = time.time_ns()
+    span = Span(parent.trace, name, parent.span_id, kind, start_ns=end_ns - int(duration_ms * 1_000_000))
+    span.attributes.update(attributes)
+    span.end(end_ns)
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """함수 실행을 span으로 기록하는 데코레이터 (동기/비동기 모두 지원, 시그니처 유지)"""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if _current_span.get() is None:
+                    return await func(*args, **kwargs)
+                with start_span(span_name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return func(*args, **kwargs)
+            with start_span(span_name):
+                return func(*args, **kwargs)
+        return sync_wrapper
+
+    return decorator
+
+
+def traced_methods(cls: type) -> type:
+    """클래스에 직접 정의된 공개 메서드를 모두 span으로 기록하는 클래스 데코레이터"""
+    for attr_name, attr in list(vars(cls).items()):
+        if attr_name.startswith("_"):
+            continue
+        span_name = f"{cls.__name__}.{attr_name}"
+        if isinstance(attr, staticmethod):
+            setattr(cls, attr_name, staticmethod(traced(span_name)(attr.__func__)))
+        elif isinstance(attr, classmethod):
+            setattr(cls, attr_name, classmethod(traced(span_name)(attr.__func__)))
+        elif inspect.isfunction(attr):
+            setattr(cls, attr_name, traced(span_name)(attr))
+    return cls
@@ -0,0 +1,156 @@
+import hashlib
+import hmac
+import json
+import logging
+import queue
+import threading
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+from app.core.security import verify_token
+
+logger = logging.getLogger(__name__)
+
+# 값을 그대로 남기는 쿼리 파라미터 (그 외는 타입/길이만 기록, cursor 는 존재 여부만 기록)
+SAFE_QUERY_PARAMS = frozenset({"sort", "size"})
+CURSOR_PLACEHOLDER = "<cursor>"
+# 인증 주체 (토큰/사용자 ID 대신 서버 비밀키 기반 가명)
+ANONYMOUS = None
+INVALID_PRINCIPAL = "invalid"
+
+
+def principal_for(authorization: Optional[str]) -> Optional[str]:
+    """Authorization 헤더 -> 가명 인증 주체 (같은 사용자는 항상 같은 값, 역산 불가)"""
+    if not authorization:
+        return ANONYMOUS
+    scheme, _, token = authorization.partition(" ")
+    user_id = verify_token(token) if scheme.lower() == "bearer" and token else None
+    if user_id is None:
+        return INVALID_PRINCIPAL
+    digest = hmac.new(settings.SECRET_KEY.encode(), f"user:{user_id}".encode(), hashlib.sha256)
+    return "u:" + digest.hexdigest()[:16]
+
+
+def value_shape(value: Any) -> Any:
+    """JSON 값의 형태 (문자열은 길이, 숫자/불리언은 타입만 남김)"""
+    if isinstance(value, dict):
+        return {key: value_shape(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return {"list": len(value), "item": value_shape(value[0]) if value else None}
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return f"str:{len(value)}"
+    return "null"
+
+
+def body_shape(body: bytes, content_type: str, size: int, truncated: bool) -> Optional[Dict[str, Any]]:
+    """요청 본문 형태 (JSON 이면 필드별 형태, 아니면 크기만)"""
+    if size == 0:
+        return None
+    shape: Dict[str, Any] = {"content_type": content_type.split(";", 1)[0], "bytes": size}
+    if not truncated and shape["content_type"] == "application/json":
+        try:
+            shape["json"] = value_shape(json.loads(body))
+        except ValueError:
+            pass
+    return shape
+
+
+def scrub_query(query: List[tuple]) -> Dict[str, str]:
+    """쿼리 파라미터 정리 (SAFE_QUERY_PARAMS 외의 값은 길이로 치환)"""
+    scrubbed = {}
+    for key, value in query:
+        if key in SAFE_QUERY_PARAMS:
+            scrubbed[key] = value
+        elif key == "cursor":
+            scrubbed[key] = CURSOR_PLACEHOLDER
+        else:
+            scrubbed[key] = f"<str:{len(value)}>"
+    return scrubbed
+
+
+def build_record(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """미들웨어가 넘긴 원본 정보 -> 개인정보를 제거한 캡처 레코드"""
+    return {
+        "ts": round(raw["ts"], 6),
+        "method": raw["method"],
+        "route": raw["route"],
+        "path_params": raw["path_params"],
+        "query": scrub_query(raw["query"]),
+        "body": body_shape(raw["body"], raw["content_type"], raw["body_size"], raw["truncated"]),
+        "principal": principal_for(raw["authorization"]),
+        "status": raw["status"],
+        "duration_ms": round(raw["duration_ms"], 3),
+    }
+
+
+class TrafficCaptureWriter:
+    """캡처 레코드를 큐에 모아 별도 스레드에서 JSON Lines 파일에 기록
+
+    요청 처리 경로에서는 원본 정보를 큐에 넣기만 하고, 토큰 검증/본문 파싱/정리는 기록 스레드에서 합니다.
+    큐가 가득 차면 레코드를 버립니다.
+    """
+
+    def __init__(self, path: str, max_queue_size: int = 4096):
+        self.path = path
+        self.written = 0
+        self.dropped = 0
+        self._queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, raw: Dict[str, Any]) -> None:
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(raw)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="traffic-capture", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            raw = self._queue.get()
+            if raw is None:
+                return
+            lines = []
+            while raw is not None:
+                try:
+                    lines.append(json.dumps(build_record(raw), ensure_ascii=False, separators=(",", ":")))
+                except Exception as e:
+                    logger.error(f"트래픽 캡처 레코드 생성 실패: {e}")
+                try:
+                    raw = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._write(lines)
+            if raw is None:
+                return
+
+    def _write(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+            self.written += len(lines)
+        except OSError as e:
+            logger.error(f"트래픽 캡처 기록 실패 ({len(lines)}건): {e}")
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """남은 레코드를 기록하고 스레드 종료"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join(timeout)
+        self._thread = None
@@ -1,15 +1,45 @@
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.orm import Bundle, Session
+from sqlalchemy import inspect as sa_inspect, select
 from app.db.base import Base
+from app.core.tracing import traced_methods
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
 
+class SchemaBundle(Bundle):
+    """응답 스키마 필드의 컬럼 묶음, 결과 Row 를 ORM 객체 없이 바로 스키마 인스턴스로 변환
+
+    컬럼 키는 필드 이름입니다 (별칭 필드는 별칭 이름의 모델 컬럼을 필드 이름으로 라벨링).
+    sqlakeyset 은 정렬 컬럼을 Bundle 안에서 찾아 getattr(스키마 인스턴스, 필드 이름) 으로 커서 값을 읽습니다.
+    select(*columns) 로 나열하면 정렬 컬럼 탐색과 Row 의 from_attributes 검증이 느려 ORM 조회보다 오히려 느립니다.
+    """
+
+    def __init__(self, schema: Type[BaseModel], model: Type[Base]):
+        columns = model.__mapper__.columns
+        super().__init__(
+            schema.__name__,
+            *(
+                columns[field.alias].label(name) if field.alias else columns[name]
+                for name, field in schema.model_fields.items()
+            ),
+        )
+        self.schema = schema
+
+    def create_row_processor(self, query, procs, labels):
+        validate = self.schema.model_validate
+
+        def proc(row):
+            return validate(dict(zip(labels, [proc(row) for proc in procs])), by_name=True)
+
+        return proc
+
+
+@traced_methods
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def __init__(self, model: Type[ModelType]):
         """
@@ -18,9 +48,30 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         * `schema`: A Pydantic model (schema) class
         """
         self.model = model
+        self._bundles: Dict[Type[BaseModel], SchemaBundle] = {}
+
+    def bundle_for(self, schema: Type[BaseModel]) -> SchemaBundle:
+        """응답 스키마 필드에 대응하는 모델 컬럼 묶음 (캐시)
+
+        목록 조회처럼 ORM 객체가 필요 없는 읽기 경로에서 select(bundle) 로 필요한 컬럼만 조회하고
+        결과 Row 를 바로 응답 스키마 인스턴스로 받을 때 사용합니다.
+        """
+        bundle = self._bundles.get(schema)
+        if bundle is None:
+            bundle = SchemaBundle(schema, self.model)
+            self._bundles[schema] = bundle
+        return bundle
+
+    def _refresh(self, db: Session, db_obj: ModelType) -> None:
+        """flush 후 서버 생성 값 다시 읽기
+
+        지연(deferred) 컬럼은 제외해 방금 설정한 값을 그대로 두고, 응답을 만들 때 다시 조회하지 않도록 합니다.
+        """
+        db.refresh(db_obj, [attr.key for attr in sa_inspect(self.model).column_attrs if not attr.deferred])
 
-    def get(self, db: Session, id: Any) -> Optional[ModelType]:
-        return db.get(self.model, id)
+    def get(self, db: Session, id: Any, for_update: bool = False) -> Optional[ModelType]:
+        """기본 키로 조회 (for_update 면 트랜잭션 끝까지 행 잠금, SELECT ... FOR UPDATE)"""
+        return db.get(self.model, id, with_for_update=for_update or None, populate_existing=for_update)
 
     def list(
         self, db: Session, *, skip: int = 0, limit: int = 100
@@ -34,7 +85,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
         db.flush()
-        db.refresh(db_obj)
+        self._refresh(db, db_obj)
         return db_obj
 
     def update(
@@ -44,17 +95,18 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         db_obj: ModelType,
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
-        obj_data = jsonable_encoder(db_obj)
+        # 로딩되지 않은 지연(deferred) 컬럼도 수정할 수 있도록 객체 값이 아니라 매퍼의 컬럼 목록 기준
+        columns = sa_inspect(self.model).column_attrs.keys()
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
-        for field in obj_data:
+        for field in columns:
             if field in update_data:
                 setattr(db_obj, field, update_data[field])
         db.add(db_obj)
         db.flush()
-        db.refresh(db_obj)
+        self._refresh(db, db_obj)
         return db_obj
 
     def delete(self, db: Session, *, id: int) -> ModelType:
@@ -1,14 +1,90 @@
-from typing import Optional
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+from pydantic import BaseModel
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 import sqlalchemy as sa
 from sqlalchemy import func, or_, select
 
 from app.crud.base import CRUDBase
 from app.models.board import Board
-from app.schemas.board import BoardCreate, BoardUpdate, BoardSortOption
+from app.schemas.board import BoardCreate, BoardUpdate, BoardResponse, BoardSortOption
+from app.schemas.pagination import Descending
 from sqlalchemy import update
+from app.core.etag import as_utc
+from app.core.tracing import traced_methods
 
 
+class BoardSort(NamedTuple):
+    """게시판 목록 정렬 기준 (같은 값이면 id 내림차순)"""
+
+    column: Any                              # 정렬 컬럼 (SQL 식)
+    descending: bool
+    parse: Callable[[Any], Any]              # 커서/캐시의 JSON 값 -> 정렬 값
+
+    def order_key(self, value: Any, board_id: int) -> tuple:
+        """(정렬 값, id) -> 목록 순서대로 오름차순인 비교 키"""
+        return (Descending(value) if self.descending else value, Descending(board_id))
+
+    @staticmethod
+    def dump(value: Any) -> Any:
+        """정렬 값 -> JSON 값"""
+        return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _parse_datetime(value: str) -> datetime:
+    return as_utc(datetime.fromisoformat(value))
+
+
+BOARD_SORTS: Dict[BoardSortOption, BoardSort] = {
+    BoardSortOption.created_at: BoardSort(Board.created_at, True, _parse_datetime),
+    # 수정일순 (수정한 적 없으면 생성일)
+    BoardSortOption.updated_at: BoardSort(func.coalesce(Board.updated_at, Board.created_at), True, _parse_datetime),
+    # 게시글 수로 정렬 (많은순) - posts_count 컬럼 사용
+    BoardSortOption.posts: BoardSort(Board.posts_count, True, int),
+    # 이름 컬럼은 코드 포인트 순서 collation 이므로 DB 정렬/keyset 조건과 Python 문자열 비교가 같음
+    BoardSortOption.name: BoardSort(Board.name, False, str),
+}
+
+
+class BoardListRow(NamedTuple):
+    """게시판 목록 항목 (응답 스키마 인스턴스 + keyset 위치, 공개/비공개 목록을 합치고 커서를 만들 때)"""
+
+    item: BaseModel
+    value: Any      # 정렬 값
+    id: int
+
+
+
+def _keyset_page(stmt, sort: BoardSortOption, after: Optional[Tuple[Any, int]], backwards: bool, limit: int):
+    """정렬 + 경계(after) 이후 조건 + LIMIT (backwards 면 정렬을 뒤집어 경계 이전 항목을 가까운 순으로)"""
+    spec = BOARD_SORTS[sort]
+    descending, id_descending = spec.descending != backwards, not backwards
+    if after is not None:
+        value, board_id = after
+        # 선두 컬럼 범위 조건을 따로 두어 정렬 인덱스 범위 스캔이 되도록
+        stmt = stmt.where(
+            spec.column <= value if descending else spec.column >= value,
+            or_(
+                spec.column < value if descending else spec.column > value,
+                Board.id < board_id if id_descending else Board.id > board_id,
+            ),
+        )
+    return stmt.order_by(
+        spec.column.desc() if descending else spec.column.asc(),
+        Board.id.desc() if id_descending else Board.id.asc(),
+    ).limit(limit)
+
+
+def _list_rows(db: Session, stmt) -> List[BoardListRow]:
+    # SQLite 는 시각을 naive 로 돌려주므로 캐시/커서의 값과 비교할 수 있게 UTC 로
+    return [
+        BoardListRow(item, as_utc(value) if isinstance(value, datetime) else value, board_id)
+        for item, value, board_id in db.execute(stmt)
+    ]
+
+
+@traced_methods
 class CRUDBoard(CRUDBase[Board, BoardCreate, BoardUpdate]):
 
     def get_by_name(self, db: Session, *, name: str) -> Optional[Board]:
@@ -29,41 +105,71 @@ class CRUDBoard(CRUDBase[Board, BoardCreate, BoardUpdate]):
         db.refresh(db_obj)
         return db_obj
 
-    def get_accessible_boards(
-        self, db: Session, user_id: int, sort: BoardSortOption = BoardSortOption.created_at):
-        """사용자가 접근 가능한 게시판들의 Select 반환
-        
+    def get_public_boards(
+        self, db: Session, sort: BoardSortOption, after: Optional[Tuple[Any, int]] = None,
+        backwards: bool = False, limit: int = 20, schema: Type[BaseModel] = BoardResponse
+    ) -> List[BoardListRow]:
+        """공개 게시판 keyset 페이지 (모든 사용자에게 같으므로 서비스에서 캐시)
+
         Args:
             db: 데이터베이스 세션
-            user_id: 사용자 ID
             sort: 정렬 옵션
-            
+            after: 경계 항목의 (정렬 값, id), 없으면 처음부터
+            backwards: True 면 경계 이전 항목을 역순으로 (이전 페이지)
+            limit: 최대 개수
+            schema: 응답 스키마 (schema 컬럼과 정렬 컬럼, id 만 조회)
+
         Returns:
-            SQLAlchemy Select: 본인 생성 + 공개 게시판 (정렬 적용)
+            List[BoardListRow]: 정렬 순서의 게시판 (backwards 면 역순)
         """
-        # 본인이 생성한 게시판 OR 공개 게시판 
-        stmt = select(Board).where(
-            or_(Board.owner_id == user_id, Board.public == True)
+        spec = BOARD_SORTS[sort]
+        stmt = select(self.bundle_for(schema), spec.column, Board.id).where(Board.public == True)
+        return _list_rows(db, _keyset_page(stmt, sort, after, backwards, limit))
+
+    def get_private_boards(
+        self, db: Session, owner_id: int, sort: BoardSortOption, after: Optional[Tuple[Any, int]] = None,
+        backwards: bool = False, limit: int = 20, schema: Type[BaseModel] = BoardResponse
+    ) -> List[BoardListRow]:
+        """사용자의 비공개 게시판 keyset 페이지 (owner_id 인덱스, 인자는 get_public_boards 와 같음)"""
+        spec = BOARD_SORTS[sort]
+        stmt = select(self.bundle_for(schema), spec.column, Board.id).where(
+            Board.owner_id == owner_id, Board.public == False
         )
-        
-        # 정렬 옵션에 따른 처리
-        if sort == BoardSortOption.posts:
-            # 게시글 수로 정렬 (많은순) - 트리거로 관리되는 posts_count 컬럼 사용
-            stmt = stmt.order_by(Board.posts_count.desc(), Board.id.desc())
-        elif sort == BoardSortOption.name:
-            # 이름순 정렬
-            stmt = stmt.order_by(Board.name.asc(), Board.id.desc())
-        elif sort == BoardSortOption.updated_at:
-            # 수정일순 정렬
-            stmt = stmt.order_by(
-                func.coalesce(Board.updated_at, Board.created_at).desc(),
-                Board.id.desc()
-            )
-        else:
-            # 생성일순 정렬 (최신순)
-            stmt = stmt.order_by(Board.created_at.desc(), Board.id.desc())
-        
-        return stmt
+        return _list_rows(db, _keyset_page(stmt, sort, after, backwards, limit))
+
+    def count_public_boards(self, db: Session) -> int:
+        """공개 게시판 수"""
+        return db.execute(select(func.count()).select_from(Board).where(Board.public == True)).scalar_one()
+
+    def count_private_boards(self, db: Session, owner_id: int) -> int:
+        """사용자의 비공개 게시판 수"""
+        return db.execute(
+            select(func.count()).select_from(Board).where(Board.owner_id == owner_id, Board.public == False)
+        ).scalar_one()
+
+    def get_with_access(self, db: Session, board_id: int, schema: Type[BaseModel] = BoardResponse) -> Optional[Row]:
+        """게시판 상세 조회 (schema 컬럼 + 접근 권한 확인용 public, owner_id + ETag 용 updated_at, posts_count)
+
+        Returns:
+            Row: (schema 인스턴스, public, owner_id, updated_at, posts_count), 없으면 None
+        """
+        stmt = select(
+            self.bundle_for(schema), Board.public, Board.owner_id, Board.updated_at, Board.posts_count
+        ).where(Board.id == board_id)
+        return db.execute(stmt).first()
+
+    def get_version(self, db: Session, board_id: int) -> Optional[Row]:
+        """조건부 요청 확인용 버전 조회 (전체 행 대신 접근 권한/버전 컬럼만)
+
+        Returns:
+            Row: (public, owner_id, updated_at, posts_count), 없으면 None
+        """
+        stmt = select(Board.public, Board.owner_id, Board.updated_at, Board.posts_count).where(Board.id == board_id)
+        return db.execute(stmt).first()
+
+    def get_access(self, db: Session, board_id: int):
+        """게시판 접근 확인용 컬럼만 조회 -> Row(public, owner_id) 또는 None"""
+        return db.execute(select(Board.public, Board.owner_id).where(Board.id == board_id)).first()
 
     def check_board_access(self, db: Session, user_id: int, board_id: int) -> bool:
         """게시판 접근 권한 확인"""
@@ -77,7 +183,7 @@ class CRUDBoard(CRUDBase[Board, BoardCreate, BoardUpdate]):
     def change_posts_count(self, db: Session, board_id: int, delta: int = 1) -> None:
         """boards.posts_count 증가/감소 (delta 양수면 증가, 음수면 감소). 음수로 내려가지 않음."""
         new_value = sa.case(
-            [(Board.posts_count + delta < 0, 0)],
+            (Board.posts_count + delta < 0, 0),
             else_=Board.posts_count + delta
         )
         stmt = update(Board).where(Board.id == board_id).values(
@@ -1,13 +1,20 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Type
+from pydantic import BaseModel
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, delete, insert, or_, select
 
 from app.crud.base import CRUDBase
 from app.models.post import Post
 from app.models.board import Board
-from app.schemas.post import PostCreate, PostUpdate, PostSortOption
+from app.models.post_tombstone import PostTombstone
+from app.schemas.post import PostCreate, PostUpdate, PostResponse, PostSummaryResponse, PostSortOption
+from app.schemas.sync import Position
+from app.core.tracing import traced_methods
 
 
+@traced_methods
 class CRUDPost(CRUDBase[Post, PostCreate, PostUpdate]):
     
     def create_with_user(self, db: Session, *, obj_in: PostCreate, owner_id: int, board_id: int) -> Post:
@@ -20,7 +27,7 @@ class CRUDPost(CRUDBase[Post, PostCreate, PostUpdate]):
         )
         db.add(db_obj)
         db.flush()
-        db.refresh(db_obj)
+        self._refresh(db, db_obj)
         return db_obj
 
     def get_accessible_posts(
@@ -28,7 +35,8 @@ class CRUDPost(CRUDBase[Post, PostCreate, PostUpdate]):
         db: Session, 
         user_id: int, 
         board_id: int,
-        sort: PostSortOption = PostSortOption.created_at
+        sort: PostSortOption = PostSortOption.created_at,
+        schema: Type[BaseModel] = PostSummaryResponse
     ):
         """사용자가 접근 가능한 게시글들의 Select 반환
         
@@ -37,12 +45,13 @@ class CRUDPost(CRUDBase[Post, PostCreate, PostUpdate]):
             user_id: 사용자 ID
             board_id: 게시판 ID
             sort: 정렬 옵션
+            schema: 응답 스키마 (?fields= 로 필드를 줄인 스키마면 해당 컬럼만 조회)
             
         Returns:
-            SQLAlchemy Select: 접근 가능한 게시글 (정렬 적용)
+            SQLAlchemy Select: 접근 가능한 게시글 (정렬 적용, schema 컬럼만 조회해 스키마 인스턴스로 반환, 본문 제외)
         """
         # 게시판 접근 권한 확인을 포함한 쿼리
-        stmt = select(Post).join(Board).where(
+        stmt = select(self.bundle_for(schema)).join(Board, Post.board_id == Board.id).where(
             and_(
                 Post.board_id == board_id,
                 or_(
@@ -61,19 +70,92 @@ class CRUDPost(CRUDBase[Post, PostCreate, PostUpdate]):
 
         return stmt
 
-    def get_accessible_post(self, db: Session, user_id: int, post_id: int) -> Optional[Post]:
-        """사용자가 접근 가능한 게시글 조회"""
-        stmt = select(Post).join(Board).where(
-            and_(
-                Post.id == post_id,
-                or_(
-                    Board.owner_id == user_id,
-                    Board.public == True
-                )
+    def get_detail(self, db: Session, post_id: int) -> Optional[PostResponse]:
+        """게시글 상세 (응답 캐시 항목, 접근 권한은 서비스에서 게시판 접근 캐시로 확인)"""
+        return db.execute(select(self.bundle_for(PostResponse)).where(Post.id == post_id)).scalar()
+
+    def get_with_access(self, db: Session, post_id: int, schema: Type[BaseModel] = PostResponse) -> Optional[Row]:
+        """게시글 상세 조회 (schema 컬럼 + ETag 용 updated_at + 접근 권한 확인용 게시판 public, owner_id)
+
+        접근 권한은 서비스에서 확인하므로 권한과 관계없이 조회합니다 (응답 캐시를 끈 경우 한 번에 확인).
+
+        Returns:
+            Row: (schema 인스턴스, updated_at, 게시판 public, 게시판 owner_id), 없으면 None
+        """
+        stmt = select(self.bundle_for(schema), Post.updated_at, Board.public, Board.owner_id).join(
+            Board, Post.board_id == Board.id
+        ).where(Post.id == post_id)
+        return db.execute(stmt).first()
+
+    def get_accessible_version(self, db: Session, user_id: int, post_id: int) -> Optional[datetime]:
+        """조건부 요청 확인용 버전 조회 (본문 없이 접근 권한 확인 + updated_at 만)
+
+        Returns:
+            datetime: 게시글 updated_at, 없거나 접근 권한이 없으면 None
+        """
+        stmt = select(Post.updated_at).join(Board, Post.board_id == Board.id).where(
+            self._accessible(user_id, post_id)
+        )
+        return db.execute(stmt).scalar()
+
+    def get_changes(self, db: Session, board_id: int, after: Position, until: datetime, limit: int) -> List[Row]:
+        """게시판에서 after 이후 until 까지 생성/수정된 게시글 ((updated_at, id) 순, ix_posts_board_id_updated_at)
+
+        Returns:
+            List[Row]: (PostSummaryResponse, updated_at) 최대 limit 개
+        """
+        updated_at, post_id = after
+        stmt = (
+            select(self.bundle_for(PostSummaryResponse), Post.updated_at)
+            .where(
+                Post.board_id == board_id,
+                Post.updated_at >= updated_at,
+                or_(Post.updated_at > updated_at, Post.id > post_id),
+                Post.updated_at <= until,
+            )
+            .order_by(Post.updated_at, Post.id)
+            .limit(limit)
+        )
+        return db.execute(stmt).all()
+
+    def create_tombstone(self, db: Session, post: Post) -> None:
+        """삭제 기록 추가 (게시글 삭제와 같은 트랜잭션에서)"""
+        db.execute(insert(PostTombstone).values(post_id=post.id, board_id=post.board_id))
+
+    def get_tombstones(self, db: Session, board_id: int, after: Position, until: datetime, limit: int) -> List[Row]:
+        """게시판에서 after 이후 until 까지 삭제된 게시글 기록 ((deleted_at, id) 순)
+
+        Returns:
+            List[Row]: (id, post_id, deleted_at) 최대 limit 개
+        """
+        deleted_at, tombstone_id = after
+        stmt = (
+            select(PostTombstone.id, PostTombstone.post_id, PostTombstone.deleted_at)
+            .where(
+                PostTombstone.board_id == board_id,
+                PostTombstone.deleted_at >= deleted_at,
+                or_(PostTombstone.deleted_at > deleted_at, PostTombstone.id > tombstone_id),
+                PostTombstone.deleted_at <= until,
+            )
+            .order_by(PostTombstone.deleted_at, PostTombstone.id)
+            .limit(limit)
+        )
+        return db.execute(stmt).all()
+
+    def purge_tombstones(self, db: Session, before: datetime) -> int:
+        """before 이전 삭제 기록 정리 -> 삭제한 행 수"""
+        return db.execute(delete(PostTombstone).where(PostTombstone.deleted_at < before)).rowcount
+
+    @staticmethod
+    def _accessible(user_id: int, post_id: int):
+        # 게시판 접근 권한 확인을 포함한 게시글 조건
+        return and_(
+            Post.id == post_id,
+            or_(
+                Board.owner_id == user_id,
+                Board.public == True
             )
         )
-        result = db.execute(stmt)
-        return result.scalars().first()
 
 # CRUD 인스턴스 생성
 post = CRUDPost(Post)
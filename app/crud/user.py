@@ -5,8 +5,10 @@ from app.core.security import get_password_hash, verify_password
 from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin
+from app.core.tracing import traced_methods
 
 
+@traced_methods
 class CRUDUser(CRUDBase[User, UserCreate, UserLogin]):
     
     def get_by_email(self, db: Session, *, email: str) -> Optional[User]:
@@ -15,12 +17,12 @@ class CRUDUser(CRUDBase[User, UserCreate, UserLogin]):
         result = db.execute(stmt)
         return result.scalars().first()
     
-    def create(self, db: Session, *, obj_in: UserCreate) -> User:
-        """사용자 생성"""
+    def create(self, db: Session, *, obj_in: UserCreate, hashed_password: Optional[str] = None) -> User:
+        """사용자 생성 (hashed_password가 주어지면 해싱을 생략)"""
         db_obj = User(
             fullname=obj_in.fullname,
             email=obj_in.email,
-            password=get_password_hash(obj_in.password),
+            password=hashed_password or get_password_hash(obj_in.password),
         )
         db.add(db_obj)
         db.flush()
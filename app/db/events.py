@@ -0,0 +1,51 @@
+import logging
+import time
+from typing import Any, Callable, List
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# 쿼리 실행 완료 시 호출되는 옵저버
+# (statement, parameters, context, executemany, duration_ms, rowcount) 를 인자로 받음
+QueryObserver = Callable[[str, Any, Any, bool, float, int], None]
+
+_observers: List[QueryObserver] = []
+
+
+def add_query_observer(observer: QueryObserver) -> None:
+    """쿼리 옵저버 등록 (슬로우 쿼리 로그, 쿼리 통계 등)"""
+    if observer not in _observers:
+        _observers.append(observer)
+
+
+def remove_query_observer(observer: QueryObserver) -> None:
+    """쿼리 옵저버 해제"""
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_started", None)
+    if started is None or not _observers:
+        return
+    duration_ms = (time.perf_counter() - started) * 1000
+    rowcount = cursor.rowcount if cursor.rowcount and cursor.rowcount > 0 else 0
+    for observer in _observers:
+        try:
+            observer(statement, parameters, context, executemany, duration_ms, rowcount)
+        except Exception as e:
+            # 계측 실패가 쿼리 실행에 영향을 주지 않도록 함
+            logger.error(f"쿼리 옵저버 실행 실패 ({observer.__qualname__}): {e}")
+
+
+def register_query_events(engine: Engine) -> None:
+    """엔진에 쿼리 실행 시간 측정 리스너 등록"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,33 @@
+import hashlib
+import re
+from functools import lru_cache
+
+# 문자열/숫자 리터럴, 바인드 파라미터, IN 목록을 하나의 형태로 정규화하기 위한 패턴
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_BIND_PARAM = re.compile(r"%\(\w+\)s|%s|(?<!:):(?!:)\w+|\$\d+|\?")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_POSTCOMPILE = re.compile(r"\(?__\[POSTCOMPILE_\w+\]\)?")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def normalize_sql(statement: str) -> str:
+    """SQL 문을 정규화 (리터럴/파라미터 → ?, IN 목록 축약, 공백 정리)
+
+    SQLAlchemy는 컴파일된 SQL 문자열을 캐시하므로 같은 쿼리는 같은 문자열로 들어옵니다.
+    lru_cache로 매 실행마다 정규식을 다시 돌리지 않도록 합니다.
+    """
+    sql = _STRING_LITERAL.sub("?", statement)
+    sql = _POSTCOMPILE.sub("(?)", sql)
+    sql = _BIND_PARAM.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _IN_LIST.sub("IN (?)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """정규화된 SQL 기준의 짧은 식별자 (동일 구조의 쿼리는 같은 fingerprint)"""
+    normalized = normalize_sql(statement)
+    return hashlib.blake2b(normalized.encode(), digest_size=8).hexdigest()
@@ -2,6 +2,9 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 from app.core.config import settings
+from app.db.events import register_query_events
+from app.db.slow_query import register_slow_query_log
+from app.db.stats import register_statement_stats
 
 engine = create_engine(
     settings.DATABASE_URL,
@@ -9,6 +12,9 @@ engine = create_engine(
     pool_recycle=300,
     future=True,
 )
+register_query_events(engine)
+register_slow_query_log()
+register_statement_stats()
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
@@ -22,4 +28,4 @@ def get_db() -> Generator[Session, None, None]:
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
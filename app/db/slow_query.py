@@ -0,0 +1,129 @@
+import json
+import logging
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional
+
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+from app.db.events import add_query_observer
+from app.db.fingerprint import fingerprint, normalize_sql
+
+logger = logging.getLogger(__name__)
+
+# 호출자 탐색 우선순위: 서비스 메서드 > 엔드포인트 > CRUD
+_CALLER_PRIORITY = ("app.services.", "app.api.", "app.crud.")
+# EXPLAIN 수집 횟수를 추적할 최대 fingerprint 수 (메모리 상한)
+_MAX_TRACKED_FINGERPRINTS = 10_000
+_EXPLAINABLE_PREFIXES = ("SELECT", "WITH")
+
+_explain_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="explain")
+_explain_counts: Counter = Counter()
+_explain_lock = threading.Lock()
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """파라미터 값을 타입 이름으로 치환 (로그에 실제 값이 남지 않도록)"""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            # executemany: 첫 행의 형태와 행 수만 남김
+            return {"rows": len(parameters), "first": redact_parameters(parameters[0])}
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def find_caller() -> Optional[str]:
+    """쿼리를 실행한 앱 코드 위치 (module:qualname) 탐색
+
+    paginate 처럼 라이브러리 내부에서 실행된 쿼리도 호출한 엔드포인트/서비스를 찾을 수 있도록
+    스택을 거슬러 올라가며 app 패키지의 프레임 중 우선순위가 가장 높은 것을 반환합니다.
+    """
+    candidates: dict[str, str] = {}
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        for prefix in _CALLER_PRIORITY:
+            if module.startswith(prefix) and prefix not in candidates:
+                candidates[prefix] = f"{module}:{frame.f_code.co_qualname}"
+        frame = frame.f_back
+    for prefix in _CALLER_PRIORITY:
+        if prefix in candidates:
+            return candidates[prefix]
+    return None
+
+
+def _explain_prefix(dialect_name: str) -> str:
+    if dialect_name == "postgresql":
+        return "EXPLAIN (FORMAT JSON) "
+    if dialect_name == "sqlite":
+        return "EXPLAIN QUERY PLAN "
+    return "EXPLAIN "
+
+
+def _should_explain(statement_fingerprint: str) -> bool:
+    """fingerprint별 최초 SLOW_QUERY_EXPLAIN_LIMIT 회만 EXPLAIN 수집"""
+    with _explain_lock:
+        if (
+            statement_fingerprint not in _explain_counts
+            and len(_explain_counts) >= _MAX_TRACKED_FINGERPRINTS
+        ):
+            return False
+        if _explain_counts[statement_fingerprint] >= settings.SLOW_QUERY_EXPLAIN_LIMIT:
+            return False
+        _explain_counts[statement_fingerprint] += 1
+        return True
+
+
+def _capture_explain(engine: Engine, statement: str, parameters: Any, statement_fingerprint: str) -> None:
+    """별도 스레드에서 EXPLAIN 실행 후 로그 기록
+
+    DBAPI 커넥션을 직접 사용하므로 cursor 이벤트가 다시 발생하지 않습니다 (재귀 방지).
+    """
+    connection = engine.raw_connection()
+    try:
+        cursor = connection.cursor()
+        try:
+            cursor.execute(_explain_prefix(engine.dialect.name) + statement, parameters)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+        connection.rollback()
+        plan = json.dumps([list(row) for row in rows], ensure_ascii=False, default=str)
+        logger.warning(f"slow query plan [{statement_fingerprint}]: {plan}")
+    except Exception as e:
+        logger.error(f"EXPLAIN 수집 실패 [{statement_fingerprint}]: {e}")
+    finally:
+        connection.close()
+
+
+def observe_slow_query(statement, parameters, context, executemany, duration_ms, rowcount):
+    """임계값 이상 걸린 쿼리 로깅 및 EXPLAIN 수집 예약"""
+    if duration_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+        return
+
+    statement_fingerprint = fingerprint(statement)
+    logger.warning(
+        f"slow query {duration_ms:.1f}ms [{statement_fingerprint}] "
+        f"caller={find_caller()} sql={normalize_sql(statement)} "
+        f"params={redact_parameters(parameters)}"
+    )
+    if (
+        settings.SLOW_QUERY_EXPLAIN_LIMIT > 0
+        and not executemany
+        and statement.lstrip().upper().startswith(_EXPLAINABLE_PREFIXES)
+        and _should_explain(statement_fingerprint)
+    ):
+        _explain_executor.submit(
+            _capture_explain, context.root_connection.engine, statement, parameters, statement_fingerprint
+        )
+
+
+def register_slow_query_log() -> None:
+    """슬로우 쿼리 로그 옵저버 등록"""
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        add_query_observer(observe_slow_query)
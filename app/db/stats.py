@@ -0,0 +1,149 @@
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.core.config import settings
+from app.core.histogram import FixedBucketHistogram
+from app.db.events import add_query_observer
+from app.db.fingerprint import fingerprint, normalize_sql
+from app.db.slow_query import find_caller
+
+# 최대 fingerprint 수를 넘어서 들어온 쿼리는 이 항목으로 합산 (메모리 상한 유지)
+OTHER_FINGERPRINT = "__other__"
+# 통계에 보관할 정규화 SQL 최대 길이
+_MAX_QUERY_LENGTH = 2000
+
+
+class StatementEntry:
+    """fingerprint 하나의 누적 통계"""
+
+    __slots__ = ("query", "caller", "calls", "total_ms", "max_ms", "rows", "histogram")
+
+    def __init__(self, query: str, caller: Optional[str]):
+        self.query = query
+        self.caller = caller
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.histogram = FixedBucketHistogram()
+
+    def record(self, duration_ms: float, rows: int) -> None:
+        self.calls += 1
+        self.total_ms += duration_ms
+        if duration_ms > self.max_ms:
+            self.max_ms = duration_ms
+        self.rows += rows
+        self.histogram.record(duration_ms)
+
+    def merge(self, other: "StatementEntry") -> None:
+        self.calls += other.calls
+        self.total_ms += other.total_ms
+        self.max_ms = max(self.max_ms, other.max_ms)
+        self.rows += other.rows
+        self.histogram.merge(other.histogram)
+        if self.caller is None:
+            self.caller = other.caller
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "query": self.query,
+            "caller": self.caller,
+            "calls": self.calls,
+            "total_ms": self.total_ms,
+            "max_ms": self.max_ms,
+            "rows": self.rows,
+            "histogram": self.histogram.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StatementEntry":
+        entry = cls(data["query"], data.get("caller"))
+        entry.calls = data["calls"]
+        entry.total_ms = data["total_ms"]
+        entry.max_ms = data["max_ms"]
+        entry.rows = data["rows"]
+        entry.histogram = FixedBucketHistogram.from_dict(data["histogram"])
+        return entry
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "query": self.query,
+            "caller": self.caller,
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 3),
+            "mean_ms": round(self.total_ms / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 3),
+            "rows": self.rows,
+            # 버킷 보간값이 실제 최대값을 넘지 않도록 제한
+            "p50_ms": round(min(self.histogram.quantile(0.50), self.max_ms), 3),
+            "p95_ms": round(min(self.histogram.quantile(0.95), self.max_ms), 3),
+            "p99_ms": round(min(self.histogram.quantile(0.99), self.max_ms), 3),
+        }
+
+
+class StatementStats:
+    """pg_stat_statements 유사 쿼리 통계 (워커별 고정 메모리)
+
+    fingerprint 수가 max_statements 에 도달하면 이후 새 쿼리는 OTHER_FINGERPRINT 로 합산됩니다.
+    """
+
+    def __init__(self, max_statements: int):
+        self.max_statements = max_statements
+        self._entries: Dict[str, StatementEntry] = {}
+        self._lock = threading.Lock()
+
+    def record(self, statement: str, duration_ms: float, rows: int) -> None:
+        key = fingerprint(statement)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if len(self._entries) >= self.max_statements:
+                    key = OTHER_FINGERPRINT
+                    entry = self._entries.get(key)
+                if entry is None:
+                    # 호출자 탐색(스택 순회)은 fingerprint 최초 등장 시 한 번만 수행
+                    query = "<other statements>" if key == OTHER_FINGERPRINT else normalize_sql(statement)
+                    entry = StatementEntry(query[:_MAX_QUERY_LENGTH], find_caller())
+                    self._entries[key] = entry
+            entry.record(duration_ms, rows)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {key: entry.to_dict() for key, entry in self._entries.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def merge_snapshots(snapshots: Iterable[Dict[str, Dict[str, Any]]]) -> Dict[str, StatementEntry]:
+    """여러 워커의 스냅샷을 fingerprint 기준으로 병합"""
+    merged: Dict[str, StatementEntry] = {}
+    for snapshot in snapshots:
+        for key, data in snapshot.items():
+            entry = StatementEntry.from_dict(data)
+            if key in merged:
+                merged[key].merge(entry)
+            else:
+                merged[key] = entry
+    return merged
+
+
+def summarize(entries: Dict[str, StatementEntry], sort: str = "total_ms", limit: int = 50) -> List[Dict[str, Any]]:
+    """fingerprint별 요약을 정렬 기준 내림차순으로 반환"""
+    summaries = [{"fingerprint": key, **entry.summary()} for key, entry in entries.items()]
+    summaries.sort(key=lambda item: item[sort], reverse=True)
+    return summaries[:limit]
+
+
+statement_stats = StatementStats(settings.DB_STATS_MAX_STATEMENTS)
+
+
+def observe_statement(statement, parameters, context, executemany, duration_ms, rowcount):
+    statement_stats.record(statement, duration_ms, rowcount)
+
+
+def register_statement_stats() -> None:
+    """쿼리 통계 옵저버 등록"""
+    if settings.DB_STATS_ENABLED:
+        add_query_observer(observe_statement)
@@ -1,19 +1,76 @@
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi_pagination import add_pagination
 
+from app.api import health, internal, monitoring
 from app.api.v1.api import api_v1
+from app.core.background import cancel_tasks, run_periodically
+from app.core.cache import invalidation_listener
 from app.core.config import settings
+from app.core.loop_monitor import loop_monitor
+from app.middleware.capture import TrafficCaptureMiddleware, capture_writer
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.metrics import MetricsMiddleware
+from app.middleware.timing import ServerTimingMiddleware, register_timing_observers
+from app.middleware.tracing import TracingMiddleware, exporter, register_tracing
+from app.services.post import purge_expired_tombstones
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """백그라운드 작업 시작/종료"""
+    tasks = [
+        asyncio.create_task(asyncio.to_thread(health.readiness.probe)),
+        asyncio.create_task(run_periodically(settings.READINESS_PROBE_INTERVAL, health.readiness.probe)),
+    ]
+    if settings.DB_STATS_ENABLED:
+        tasks.append(asyncio.create_task(
+            run_periodically(settings.DB_STATS_PUBLISH_INTERVAL, internal.publish_statement_stats)
+        ))
+    if settings.METRICS_ENABLED:
+        tasks.append(asyncio.create_task(
+            run_periodically(settings.METRICS_PUBLISH_INTERVAL, monitoring.publish_metrics)
+        ))
+    tasks.append(asyncio.create_task(
+        run_periodically(settings.SYNC_TOMBSTONE_PURGE_INTERVAL, purge_expired_tombstones)
+    ))
+    if settings.CACHE_LOCAL_ENABLED:
+        invalidation_listener.start()
+    if settings.LOOP_MONITOR_ENABLED:
+        loop_monitor.start()
+    yield
+    await loop_monitor.stop()
+    await asyncio.to_thread(invalidation_listener.stop)
+    await cancel_tasks(tasks)
+    await asyncio.to_thread(exporter.shutdown)
+    await asyncio.to_thread(capture_writer.shutdown)
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    lifespan=lifespan,
 )
+# 가장 안쪽에서 압축해 메트릭/트레이싱은 실제 전송 크기를 기록
+app.add_middleware(CompressionMiddleware)
+register_timing_observers()
+app.add_middleware(ServerTimingMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+register_tracing()
+app.add_middleware(TracingMiddleware)
+app.add_middleware(TrafficCaptureMiddleware)
 add_pagination(app)
 app.include_router(api_v1, prefix=settings.API_PATH)
+app.include_router(health.router)
+app.include_router(internal.router, prefix="/internal")
+if settings.METRICS_ENABLED:
+    app.include_router(monitoring.router)
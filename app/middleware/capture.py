@@ -0,0 +1,80 @@
+import random
+import time
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.traffic_capture import TrafficCaptureWriter
+
+capture_writer = TrafficCaptureWriter(settings.TRAFFIC_CAPTURE_FILE)
+
+
+def _header(scope: Scope, name: bytes) -> str:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
+
+class TrafficCaptureMiddleware:
+    """API 요청을 샘플링해 재생용 캡처 로그(JSON Lines)로 기록
+
+    라우트 템플릿, 경로/쿼리 파라미터, 본문 형태, 상태 코드, 소요 시간, 가명 인증 주체만 남기며
+    토큰과 본문 값은 기록하지 않습니다 (app.core.traffic_capture 참고).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not settings.TRAFFIC_CAPTURE_ENABLED
+            or not scope["path"].startswith(settings.API_PATH)
+            or random.random() >= settings.TRAFFIC_CAPTURE_SAMPLE_RATE
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        body = bytearray()
+        body_size = 0
+        status = 500
+
+        async def receive_wrapper() -> Message:
+            nonlocal body_size
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                body_size += len(chunk)
+                if len(body) < settings.TRAFFIC_CAPTURE_MAX_BODY_BYTES:
+                    body.extend(chunk[:settings.TRAFFIC_CAPTURE_MAX_BODY_BYTES - len(body)])
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        ts = time.time()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            route = scope.get("route")
+            if route is not None:
+                capture_writer.submit({
+                    "ts": ts,
+                    "method": scope["method"],
+                    "route": route.path,
+                    "path_params": scope.get("path_params", {}),
+                    "query": parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True),
+                    "body": bytes(body),
+                    "body_size": body_size,
+                    "truncated": body_size > len(body),
+                    "content_type": _header(scope, b"content-type"),
+                    "authorization": _header(scope, b"authorization"),
+                    "status": status,
+                    "duration_ms": (time.perf_counter() - started) * 1000,
+                })
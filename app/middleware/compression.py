@@ -0,0 +1,156 @@
+import asyncio
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.compression import CODECS, Codec, is_compressible, negotiate_encoding
+from app.core.config import settings
+from app.core.metrics import registry
+
+http_response_compressed_total = registry.counter(
+    "http_response_compressed_total", "압축한 HTTP 응답 수", ("encoding",)
+)
+http_response_compression_input_bytes_total = registry.counter(
+    "http_response_compression_input_bytes_total", "압축 전 응답 본문 크기 합계 (바이트)", ("encoding",)
+)
+http_response_compression_output_bytes_total = registry.counter(
+    "http_response_compression_output_bytes_total", "압축 후 응답 본문 크기 합계 (바이트)", ("encoding",)
+)
+http_response_compression_saved_bytes_total = registry.counter(
+    "http_response_compression_saved_bytes_total", "압축으로 줄어든 응답 본문 크기 합계 (바이트)", ("encoding",)
+)
+
+
+class _EncodingMetrics:
+    """인코딩별 메트릭 child 캐시"""
+
+    __slots__ = ("responses", "input", "output", "saved")
+
+    def __init__(self, encoding: str):
+        self.responses = http_response_compressed_total.labels(encoding)
+        self.input = http_response_compression_input_bytes_total.labels(encoding)
+        self.output = http_response_compression_output_bytes_total.labels(encoding)
+        self.saved = http_response_compression_saved_bytes_total.labels(encoding)
+
+    def observe(self, input_size: int, output_size: int) -> None:
+        self.responses.inc()
+        self.input.inc(input_size)
+        self.output.inc(output_size)
+        self.saved.inc(input_size - output_size)
+
+
+_encoding_metrics: Dict[str, _EncodingMetrics] = {name: _EncodingMetrics(name) for name in CODECS}
+
+
+async def _run(func, data: bytes) -> bytes:
+    """COMPRESSION_THREAD_THRESHOLD 이상이면 스레드에서 실행 (이벤트 루프를 막지 않도록)"""
+    if len(data) >= settings.COMPRESSION_THREAD_THRESHOLD:
+        return await asyncio.to_thread(func, data)
+    return func(data)
+
+
+def _accept_encoding(scope: Scope) -> str:
+    for key, value in scope["headers"]:
+        if key == b"accept-encoding":
+            return value.decode("latin-1")
+    return ""
+
+
+class CompressionMiddleware:
+    """Accept-Encoding 협상으로 응답 본문 압축 (zstd > br > gzip, 설치된 인코딩만)
+
+    한 번에 보내는 응답은 COMPRESSION_MIN_SIZE 이상일 때만 압축하고,
+    스트리밍 응답(more_body)은 청크마다 flush 하며 압축해 그대로 흘려보냅니다.
+    이미 Content-Encoding 이 있거나 Cache-Control: no-transform 인 응답,
+    COMPRESSION_CONTENT_TYPES 에 없는 Content-Type 은 건드리지 않습니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.COMPRESSION_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = _accept_encoding(scope)
+        encoding = negotiate_encoding(accept_encoding, settings.COMPRESSION_ENCODINGS) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        codec = CODECS[encoding]
+        start: Optional[Message] = None
+        stream = None
+        input_size = output_size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, stream, input_size, output_size
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    "content-encoding" in headers
+                    or "no-transform" in headers.get("cache-control", "")
+                    or not is_compressible(headers.get("content-type", ""))
+                ):
+                    await send(message)
+                else:
+                    # 첫 본문을 보고 압축 여부를 정할 때까지 보류
+                    start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if start is None and stream is None:
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if stream is None:
+                if not more_body:
+                    compressed = None
+                    if len(body) >= settings.COMPRESSION_MIN_SIZE:
+                        compressed = await _run(codec.compress, body)
+                    if compressed is None or len(compressed) >= len(body):
+                        # 작거나 압축해도 줄지 않는 본문은 그대로 전송
+                        await send(start)
+                        await send(message)
+                        start = None
+                        return
+                    _set_encoding_headers(start, codec, len(compressed))
+                    await send(start)
+                    await send({"type": "http.response.body", "body": compressed})
+                    start = None
+                    _encoding_metrics[encoding].observe(len(body), len(compressed))
+                    return
+                stream = codec.stream()
+                _set_encoding_headers(start, codec, None)
+                await send(start)
+                start = None
+
+            chunk = await _run(stream.compress, body) if body else b""
+            if not more_body:
+                chunk += stream.finish()
+            input_size += len(body)
+            output_size += len(chunk)
+            if not more_body:
+                _encoding_metrics[encoding].observe(input_size, output_size)
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def _set_encoding_headers(start: Message, codec: Codec, content_length: Optional[int]) -> None:
+    headers = MutableHeaders(scope=start)
+    headers["Content-Encoding"] = codec.name
+    headers.add_vary_header("Accept-Encoding")
+    if content_length is None:
+        del headers["Content-Length"]
+    else:
+        headers["Content-Length"] = str(content_length)
+    # 압축본은 원본과 바이트가 다르므로 강한 ETag 는 약한 ETag 로 바꿈
+    etag = headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
@@ -0,0 +1,87 @@
+import time
+from typing import Dict, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import SIZE_BUCKETS, registry
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+)
+http_requests_in_flight = registry.gauge(
+    "http_requests_in_flight", "처리 중인 HTTP 요청 수"
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간 (초)", ("method", "route")
+)
+http_response_size_bytes = registry.histogram(
+    "http_response_size_bytes", "HTTP 응답 본문 크기 (바이트)", ("method", "route"), buckets=SIZE_BUCKETS
+)
+
+
+class _RouteMetrics:
+    """라우트별 메트릭 child 캐시 (요청마다 라벨 조회를 반복하지 않도록)"""
+
+    __slots__ = ("method", "route", "duration", "size", "statuses")
+
+    def __init__(self, method: str, route: str):
+        self.method = method
+        self.route = route
+        self.duration = http_request_duration_seconds.labels(method, route)
+        self.size = http_response_size_bytes.labels(method, route)
+        self.statuses: Dict[int, object] = {}
+
+    def observe(self, status: int, duration: float, size: int) -> None:
+        counter = self.statuses.get(status)
+        if counter is None:
+            counter = self.statuses[status] = http_requests_total.labels(self.method, self.route, str(status))
+        counter.inc()
+        self.duration.observe(duration)
+        self.size.observe(size)
+
+
+_route_metrics: Dict[Tuple[str, str], _RouteMetrics] = {}
+_in_flight = http_requests_in_flight.labels()
+
+
+def _get_route_metrics(scope: Scope) -> _RouteMetrics:
+    route = scope.get("route")
+    # 라우트 템플릿(/boards/{board_id}/posts) 기준으로 집계해 라벨 수를 제한
+    key = (scope["method"], route.path if route is not None else UNMATCHED_ROUTE)
+    metrics = _route_metrics.get(key)
+    if metrics is None:
+        metrics = _route_metrics[key] = _RouteMetrics(*key)
+    return metrics
+
+
+class MetricsMiddleware:
+    """요청 수, 처리 중 요청 수, 라우트별 처리 시간/응답 크기 기록 (ASGI 미들웨어)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        _in_flight.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _in_flight.dec()
+            _get_route_metrics(scope).observe(status, time.perf_counter() - started, size)
@@ -0,0 +1,61 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.timing import current_timings, record_timing, reset_request_timings, start_request_timings
+from app.db.events import add_query_observer
+from app.redis.session import add_command_listener
+
+DEBUG_TIMING_HEADER = b"x-debug-timing"
+
+
+def _record_db_timing(statement, parameters, context, executemany, duration_ms, rowcount):
+    record_timing("db", duration_ms)
+
+
+def _record_redis_timing(command: str, duration: float) -> None:
+    record_timing("redis", duration * 1000)
+
+
+def register_timing_observers() -> None:
+    """DB 쿼리/Redis 명령 시간을 요청별 타이밍에 누적하도록 옵저버 등록"""
+    add_query_observer(_record_db_timing)
+    add_command_listener(_record_redis_timing)
+
+
+def _timing_requested(scope: Scope) -> bool:
+    """설정으로 항상 켜져 있거나, 허용된 디버그 토큰을 X-Debug-Timing 헤더로 보낸 경우"""
+    if settings.SERVER_TIMING_ENABLED:
+        return True
+    if not settings.SERVER_TIMING_DEBUG_TOKENS:
+        return False
+    for name, value in scope["headers"]:
+        if name == DEBUG_TIMING_HEADER:
+            return value.decode("latin-1") in settings.SERVER_TIMING_DEBUG_TOKENS
+    return False
+
+
+class ServerTimingMiddleware:
+    """요청 구간별 소요 시간(auth, session, redis, db, app, ser)을 Server-Timing 헤더로 반환"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not _timing_requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                timings = current_timings()
+                if timings is not None:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", timings.header_value())
+            await send(message)
+
+        token = start_request_timings()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_request_timings(token)
@@ -0,0 +1,75 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.trace_export import create_exporter
+from app.core.tracing import STATUS_ERROR, add_trace_handler, end_trace, record_span, start_trace
+from app.db.events import add_query_observer
+from app.db.fingerprint import normalize_sql
+from app.redis.session import add_command_listener
+
+# span 속성에 남길 정규화 SQL 최대 길이
+_MAX_STATEMENT_LENGTH = 1000
+
+
+def _record_db_span(statement, parameters, context, executemany, duration_ms, rowcount):
+    # 파라미터 값은 남기지 않고 정규화된 SQL만 기록
+    query = normalize_sql(statement)
+    record_span(
+        query.split(" ", 1)[0],
+        duration_ms,
+        **{
+            "db.system": context.root_connection.engine.dialect.name,
+            "db.statement": query[:_MAX_STATEMENT_LENGTH],
+            "db.rows_affected": rowcount,
+        },
+    )
+
+
+def _record_redis_span(command: str, duration: float) -> None:
+    record_span(command, duration * 1000, **{"db.system": "redis", "db.operation": command})
+
+
+def register_tracing() -> None:
+    """SQL/Redis span 옵저버와 exporter 등록"""
+    add_query_observer(_record_db_span)
+    add_command_listener(_record_redis_span)
+    add_trace_handler(exporter.export)
+
+
+exporter = create_exporter()
+
+
+class TracingMiddleware:
+    """요청마다 루트 span을 열고 하위 span(의존성/서비스/CRUD/SQL/Redis)을 모아 샘플링 후 내보냄"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.TRACING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        root, token = start_trace(method)
+        root.set_attribute("http.method", method)
+        root.set_attribute("http.target", scope["path"])
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                root.set_attribute("http.status_code", message["status"])
+                if message["status"] >= 500:
+                    root.status = STATUS_ERROR
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException as e:
+            root.record_error(e)
+            raise
+        finally:
+            route = scope.get("route")
+            if route is not None:
+                root.name = f"{method} {route.path}"
+                root.set_attribute("http.route", route.path)
+            end_trace(root, token)
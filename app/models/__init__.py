@@ -1,5 +1,6 @@
 from app.models.user import User
 from app.models.board import Board
 from app.models.post import Post
+from app.models.post_tombstone import PostTombstone
 
-__all__ = ["User", "Board", "Post"]
+__all__ = ["User", "Board", "Post", "PostTombstone"]
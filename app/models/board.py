@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, func, Index
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, func, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base_class import Base
@@ -12,9 +12,15 @@ class Board(Base):
     __tablename__ = "boards"
     __table_args__ = (
         Index("ix_boards_posts_count_desc_id_desc", "posts_count", "id"),
+        # 게시판 목록에서 공개 게시판(캐시)과 합칠 사용자별 비공개 게시판 조회용
+        Index("ix_boards_owner_id_private", "owner_id", postgresql_where=text("NOT public"), sqlite_where=text("NOT public")),
     )
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    name: Mapped[str] = mapped_column(String(120), nullable=False, unique=True, index=True)
+    # 게시판 목록 이름순은 캐시한 공개 게시판과 비공개 게시판을 Python 에서 합치므로
+    # PostgreSQL 에서도 코드 포인트 순서 (COLLATE "C", SQLite 기본 BINARY 와 같음) 로 정렬/비교
+    name: Mapped[str] = mapped_column(
+        String(120).with_variant(String(120, collation="C"), "postgresql"), nullable=False, unique=True, index=True
+    )
     public: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="true")
     owner_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
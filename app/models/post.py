@@ -3,15 +3,28 @@ from __future__ import annotations
 from datetime import datetime
 
 from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.db.base_class import Base
 
+# 목록 응답용 본문 요약 최대 길이 (문자 수)
+EXCERPT_LENGTH = 200
+
+
+def make_excerpt(content: str) -> str:
+    """본문 -> 목록용 요약 (공백 정리 후 EXCERPT_LENGTH 자, 잘리면 말줄임표)"""
+    text = " ".join(content.split())
+    if len(text) <= EXCERPT_LENGTH:
+        return text
+    return text[:EXCERPT_LENGTH - 1] + "…"
+
 
 class Post(Base):
     __tablename__ = "posts"
     __table_args__ = (
         Index("ix_posts_board_id_created_at", "board_id", "created_at"),
+        # 변경분 동기화 (게시판별 updated_at 이후 변경된 게시글)
+        Index("ix_posts_board_id_updated_at", "board_id", "updated_at"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -23,11 +36,19 @@ class Post(Base):
     )
 
     title: Mapped[str] = mapped_column(String(200), nullable=False)
-    content: Mapped[str] = mapped_column(Text, nullable=False)
+    # 본문은 상세 조회에서만 필요하므로 기본 로딩에서 제외 (필요하면 undefer)
+    content: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
+    excerpt: Mapped[str] = mapped_column(String(EXCERPT_LENGTH), nullable=False, server_default="")
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
     board: Mapped["Board"] = relationship(back_populates="posts")
-    owner: Mapped["User"] = relationship(back_populates="posts")
\ No newline at end of file
+    owner: Mapped["User"] = relationship(back_populates="posts")
+
+    @validates("content")
+    def _sync_excerpt(self, key: str, content: str) -> str:
+        """본문이 설정될 때마다 (생성/수정) 요약도 함께 갱신"""
+        self.excerpt = make_excerpt(content)
+        return content
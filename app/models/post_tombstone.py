@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+
+
+class PostTombstone(Base):
+    """삭제된 게시글 기록 (변경분 동기화에서 클라이언트가 삭제를 반영하도록)
+
+    게시판이 삭제되면 게시판 단위로 다시 동기화할 필요가 없으므로 함께 삭제합니다 (CASCADE).
+    보관 기간(SYNC_TOMBSTONE_RETENTION_DAYS)이 지나면 정리합니다.
+    """
+
+    __tablename__ = "post_tombstones"
+    __table_args__ = (
+        Index("ix_post_tombstones_board_id_deleted_at", "board_id", "deleted_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    post_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    board_id: Mapped[int] = mapped_column(ForeignKey("boards.id", ondelete="CASCADE"), nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
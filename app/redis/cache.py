@@ -0,0 +1,38 @@
+from app.core.cache import TieredCache
+from app.core.config import settings
+
+
+def detail_key(resource: str, resource_id: int) -> str:
+    """상세 조회 캐시 키 (예: cache:board:12)"""
+    return f"cache:{resource}:{resource_id}"
+
+
+def public_boards_key(sort: str) -> str:
+    """정렬별 공개 게시판 목록 캐시 키 (예: cache:boards:public:created_at)"""
+    return f"cache:boards:public:{sort}"
+
+
+def board_access_key(board_id: int) -> str:
+    """게시판 접근 확인용 공개 여부/소유자 캐시 키"""
+    return f"cache:board_access:{board_id}"
+
+
+def principal_key(user_id: int) -> str:
+    """인증 사용자 정보 캐시 키"""
+    return f"cache:principal:{user_id}"
+
+
+# 게시판/게시글 상세 응답
+detail_cache = TieredCache("detail", lambda: settings.DETAIL_CACHE_ENABLED, lambda: settings.DETAIL_CACHE_TTL)
+# 게시판 목록의 공개 게시판 (정렬별 앞쪽 BOARD_LIST_CACHE_SIZE 개, 모든 사용자 공유)
+board_list_cache = TieredCache(
+    "board_list", lambda: settings.BOARD_LIST_CACHE_ENABLED, lambda: settings.BOARD_LIST_CACHE_TTL
+)
+# 게시판 공개 여부/소유자 (게시글 목록/작성 등의 접근 확인, 게시판 메타데이터라 상세 캐시 설정을 따름)
+board_access_cache = TieredCache(
+    "board_access", lambda: settings.DETAIL_CACHE_ENABLED, lambda: settings.DETAIL_CACHE_TTL
+)
+# 토큰의 사용자 ID -> 인증 사용자 (CurrentUser)
+principal_cache = TieredCache(
+    "principal", lambda: settings.PRINCIPAL_CACHE_ENABLED, lambda: settings.PRINCIPAL_CACHE_TTL
+)
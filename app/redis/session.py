@@ -1,13 +1,46 @@
+import time
 import redis
 import logging
+from typing import Callable, List
 
 from app.core.config import settings
 
-redis_client = redis.Redis.from_url(
+# Redis 명령 실행 완료 시 호출되는 리스너 (command_name, duration_seconds)
+CommandListener = Callable[[str, float], None]
+
+_command_listeners: List[CommandListener] = []
+
+
+def add_command_listener(listener: CommandListener) -> None:
+    """Redis 명령 리스너 등록 (메트릭, 요청별 타이밍 등)"""
+    if listener not in _command_listeners:
+        _command_listeners.append(listener)
+
+
+class InstrumentedRedis(redis.Redis):
+    """명령별 실행 시간을 리스너에 전달하는 Redis 클라이언트"""
+
+    def execute_command(self, *args, **options):
+        if not _command_listeners:
+            return super().execute_command(*args, **options)
+        started = time.perf_counter()
+        try:
+            return super().execute_command(*args, **options)
+        finally:
+            duration = time.perf_counter() - started
+            command = str(args[0]).upper() if args else "UNKNOWN"
+            for listener in _command_listeners:
+                try:
+                    listener(command, duration)
+                except Exception as e:
+                    logging.error(f"Redis 명령 리스너 실행 실패: {e}")
+
+
+redis_client = InstrumentedRedis.from_url(
     settings.REDIS_URL,
     decode_responses=True,
     health_check_interval=30,
 )
 if not redis_client.ping():
     logging.error("Redis server is not reachable")
-    raise ConnectionError("Redis server is not reachable")
\ No newline at end of file
+    raise ConnectionError("Redis server is not reachable")
@@ -0,0 +1,33 @@
+import json
+import logging
+import os
+import socket
+from typing import Any, Dict, List
+
+from app.redis.session import redis_client
+
+logger = logging.getLogger(__name__)
+
+# 워커(프로세스) 식별자: 호스트명 + PID
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _key(name: str, worker_id: str = WORKER_ID) -> str:
+    return f"snapshot:{name}:{worker_id}"
+
+
+def publish_snapshot(name: str, data: Dict[str, Any], ttl: int) -> None:
+    """현재 워커의 스냅샷을 Redis에 저장 (ttl 초 후 만료 → 종료된 워커는 자동으로 집계에서 제외)"""
+    redis_client.set(_key(name), json.dumps(data, ensure_ascii=False), ex=ttl)
+
+
+def collect_snapshots(name: str) -> List[Dict[str, Any]]:
+    """살아있는 모든 워커의 스냅샷 조회"""
+    keys = list(redis_client.scan_iter(match=_key(name, "*"), count=100))
+    if not keys:
+        return []
+    snapshots = []
+    for raw in redis_client.mget(keys):
+        if raw:
+            snapshots.append(json.loads(raw))
+    return snapshots
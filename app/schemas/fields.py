@@ -0,0 +1,41 @@
+from functools import lru_cache
+from typing import Optional, Tuple, Type
+
+from pydantic import BaseModel, create_model
+
+# ?fields= 쿼리 파라미터 설명 (목록/상세 엔드포인트 공통)
+FIELDS_DESCRIPTION = "응답에 포함할 필드 (쉼표로 구분, 예: id,title,created_at). 생략하면 전체 필드"
+
+
+def sparse_schema(schema: Type[BaseModel], fields: Optional[str]) -> Type[BaseModel]:
+    """?fields= 값 -> 요청한 필드만 가진 응답 스키마 (생략하거나 전체 필드면 원래 스키마)
+
+    필드 이름은 JSON 키 기준이며 (별칭 필드는 별칭, 예: posts_count), 순서는 원래 스키마를 따릅니다.
+    CRUD 의 bundle_for 에 넘기면 이 필드에 해당하는 컬럼만 SELECT 합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 필드가 있거나 필드가 비어 있을 때
+    """
+    if fields is None:
+        return schema
+    requested = {name.strip() for name in fields.split(",")} - {""}
+    keys = {field.alias or name: name for name, field in schema.model_fields.items()}
+    unknown = sorted(requested - keys.keys())
+    if unknown:
+        raise ValueError(f"지원하지 않는 필드입니다: {', '.join(unknown)} (가능한 필드: {', '.join(keys)})")
+    if not requested:
+        raise ValueError("fields 에 필드를 하나 이상 지정해야 합니다")
+    if len(requested) == len(keys):
+        return schema
+    return _sparse_schema(schema, tuple(name for key, name in keys.items() if key in requested))
+
+
+@lru_cache(maxsize=256)
+def _sparse_schema(schema: Type[BaseModel], names: Tuple[str, ...]) -> Type[BaseModel]:
+    # 원래 FieldInfo 를 그대로 써서 타입/별칭/기본값을 유지 (같은 필드 조합이면 같은 클래스)
+    return create_model(
+        f"{schema.__name__}[{','.join(names)}]",
+        __config__=schema.model_config,
+        __module__=schema.__module__,
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in names},
+    )
@@ -1,4 +1,7 @@
-from typing import TypeVar
+import base64
+import json
+from functools import total_ordering
+from typing import Any, List, NamedTuple, TypeVar
 from fastapi import Query
 from fastapi_pagination.cursor import CursorPage, CursorParams
 from fastapi_pagination.bases import CursorRawParams
@@ -26,3 +29,46 @@ CursorPageCustom = CustomizedPage[
 )]
 
 
+@total_ordering
+class Descending:
+    """내림차순 정렬 키 (비교를 뒤집어 오름차순 정렬/비교로 내림차순 순서를 표현)"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __eq__(self, other: "Descending") -> bool:
+        return self.value == other.value
+
+    def __lt__(self, other: "Descending") -> bool:
+        return other.value < self.value
+
+
+class KeysetCursor(NamedTuple):
+    """직접 만든 keyset 페이지의 커서 (경계 항목의 정렬 값들, 이전 페이지 방향 여부)
+
+    fastapi-pagination 커서처럼 클라이언트에는 불투명한 토큰으로 줍니다.
+    """
+
+    values: List[Any]
+    backwards: bool = False
+
+    def encode(self) -> str:
+        # 정렬 값 중 datetime 은 ISO 문자열로 (디코딩은 정렬 기준별로)
+        raw = json.dumps([self.values, self.backwards], separators=(",", ":"), default=lambda value: value.isoformat())
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "KeysetCursor":
+        """
+        Raises:
+            ValueError: 형식이 잘못된 커서
+        """
+        try:
+            values, backwards = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        except (TypeError, ValueError) as e:
+            raise ValueError("올바른 커서가 아닙니다") from e
+        if not isinstance(values, list) or not isinstance(backwards, bool):
+            raise ValueError("올바른 커서가 아닙니다")
+        return cls(values, backwards)
@@ -39,4 +39,17 @@ class PostResponse(PostBase):
     model_config = ConfigDict(from_attributes=True)
 
 
-PostListResponse = CursorPageCustom[PostResponse]
\ No newline at end of file
+class PostSummaryResponse(BaseModel):
+    """게시글 목록 항목 스키마 (본문 대신 요약, 본문은 상세 조회에서만 제공)"""
+    title: str
+    excerpt: str
+    id: int
+    owner_id: int
+    board_id: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+PostListResponse = CursorPageCustom[PostSummaryResponse]
\ No newline at end of file
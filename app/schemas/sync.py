@@ -0,0 +1,71 @@
+import base64
+import json
+from datetime import datetime, timezone
+from typing import List, NamedTuple, Tuple
+
+from pydantic import BaseModel
+
+from app.core.etag import as_utc
+from app.schemas.post import PostSummaryResponse
+
+# 동기화 위치: (시각, id) - 같은 시각이면 id 로 순서를 정해 페이지 경계에서 빠지거나 겹치지 않게
+Position = Tuple[datetime, int]
+
+_START: Position = (datetime(1970, 1, 1, tzinfo=timezone.utc), 0)
+
+
+class SyncWatermark(NamedTuple):
+    """변경분 동기화 watermark (게시글, 삭제 기록 각각 마지막으로 받은 위치)
+
+    클라이언트에는 불투명한 토큰(encode)으로 주고, 다음 요청의 since 로 그대로 돌려받습니다.
+    """
+
+    posts: Position
+    tombstones: Position
+
+    @classmethod
+    def initial(cls, tombstones_since: datetime) -> "SyncWatermark":
+        """처음 동기화 (게시글은 처음부터, 삭제 기록은 가진 게시글이 없으므로 tombstones_since 이후만)"""
+        return cls(_START, (as_utc(tombstones_since), 0))
+
+    def encode(self) -> str:
+        payload = [self.posts[0].isoformat(), self.posts[1], self.tombstones[0].isoformat(), self.tombstones[1]]
+        return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "SyncWatermark":
+        """
+        Raises:
+            ValueError: 형식이 잘못된 토큰
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            posts_at, post_id, tombstones_at, tombstone_id = json.loads(raw)
+            return cls(
+                (as_utc(datetime.fromisoformat(posts_at)), int(post_id)),
+                (as_utc(datetime.fromisoformat(tombstones_at)), int(tombstone_id)),
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError("since 가 올바른 watermark 가 아닙니다") from e
+
+
+def advance(position: Position, last: Position, has_more: bool, horizon: datetime) -> Position:
+    """조회한 페이지 -> 다음 위치 (페이지는 horizon 까지만 조회하므로 last 는 horizon 을 넘지 않음)
+
+    마지막 페이지면 horizon (현재 - SYNC_WATERMARK_LAG_SECONDS) 으로 전진합니다.
+    updated_at/deleted_at 은 트랜잭션 안에서 정해지므로 진행 중인 트랜잭션이 더 이른 시각으로
+    나중에 커밋될 수 있고, horizon 이후 구간은 다음 동기화에서 보내 놓치지 않게 합니다.
+    변경분이 없어도 horizon 까지는 전진하므로 자주 동기화하는 클라이언트의 watermark 가
+    삭제 기록 보관 기간 (SYNC_TOMBSTONE_RETENTION_DAYS) 보다 오래되지 않습니다.
+    """
+    if has_more:
+        return (as_utc(last[0]), last[1])
+    return max(position, (horizon, 0))
+
+
+class PostChangesResponse(BaseModel):
+    """게시글 변경분 응답 스키마 (since 이후 생성/수정된 게시글, 삭제된 게시글 ID)"""
+    items: List[PostSummaryResponse]
+    deleted: List[int]
+    watermark: str
+    has_more: bool
@@ -8,13 +8,16 @@ from app.crud.user import CRUDUser
 from app.models.user import User
 from app.schemas.auth import SignUpRequest, LoginRequest, SignUpResponse, LoginResponse, CurrentUser, LogoutResponse, UserInfo
 from app.schemas.user import UserCreate
-from app.core.security import create_access_token
+from app.core.security import create_access_token, get_password_hash_async, verify_password_async
 from app.core.exceptions import AuthenticationError, ConflictError, InternalServerError
 from app.core.session import create_session, delete_session
+from app.core.tracing import traced_methods
+from app.redis.cache import principal_cache, principal_key
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@traced_methods
 class AuthService:
     """인증 관련 서비스"""
     
@@ -43,7 +46,8 @@ class AuthService:
                     fullname=request.fullname,
                     email=request.email,
                     password=request.password
-                )
+                ),
+                hashed_password=await get_password_hash_async(request.password)
             )
             db.commit()
             return SignUpResponse(
@@ -73,8 +77,8 @@ class AuthService:
         Raises:
             HTTPException: 인증 실패 401
         """
-        user = self.user_crud.authenticate(db, email=request.email, password=request.password)
-        if not user:
+        user = self.user_crud.get_by_email(db, email=request.email)
+        if not user or not await verify_password_async(request.password, user.password):
             raise AuthenticationError("이메일 또는 비밀번호가 올바르지 않습니다")
         access_token = create_access_token(data={"user_id": str(user.id)})
         try:
@@ -127,3 +131,20 @@ class AuthService:
             User: 사용자 객체 또는 None
         """
         return self.user_crud.get(db, id=user_id)
+
+    def get_principal(self, user_id: int, db: Session) -> Optional[CurrentUser]:
+        """인증 사용자 조회 (토큰 검증 후 매 요청, principal 캐시에 없을 때만 DB 조회)
+
+        Args:
+            user_id: 토큰의 사용자 ID
+            db: 데이터베이스 세션
+
+        Returns:
+            CurrentUser: 인증 사용자 또는 None (사용자 없음)
+        """
+        def load() -> Optional[dict]:
+            user = self.get_user_by_id(user_id=user_id, db=db)
+            return None if user is None else {"id": user.id, "email": user.email, "fullname": user.fullname}
+
+        cached = principal_cache.get_or_load(principal_key(user_id), load)
+        return None if cached is None else CurrentUser.model_validate(cached)
@@ -1,24 +1,66 @@
+import bisect
 import logging
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type
 
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
-from app.crud.board import CRUDBoard
+from app.core.config import settings
+from app.crud.board import BOARD_SORTS, BoardListRow, CRUDBoard
 from app.schemas.board import (
     BoardCreate,
     BoardUpdate,
     BoardResponse,
     BoardSortOption
 )
+from app.schemas.pagination import CursorPageCustom, KeysetCursor
 from app.schemas.auth import CurrentUser
+from app.core.etag import ResourceVersion, version_matches
 from app.core.exceptions import (
-    NotFoundError, ForbiddenError, ConflictError, InternalServerError
+    NotFoundError, ForbiddenError, ConflictError, BadRequestError, InternalServerError, PreconditionFailedError
+)
+from app.core.tracing import traced_methods
+from app.redis.cache import (
+    board_access_cache, board_access_key, board_list_cache, detail_cache, detail_key, public_boards_key
 )
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def board_version(board_id: int, updated_at: datetime, posts_count: int) -> ResourceVersion:
+    """게시판 버전 (게시글 수가 바뀌어도 다른 ETag)"""
+    return ResourceVersion.of(updated_at, board_id, posts_count)
+
+
+def invalidate_public_boards() -> None:
+    """공개 게시판 목록 캐시 무효화 (공개 게시판 생성/수정/삭제, 게시글 수 변경)"""
+    board_list_cache.invalidate(public_boards_key(sort.value) for sort in BoardSortOption)
+
+
+class BoardAccess(NamedTuple):
+    """게시판 접근 확인에 필요한 값"""
+
+    public: bool
+    owner_id: int
+
+    def allows(self, user_id: int) -> bool:
+        return self.public or self.owner_id == user_id
+
+
+def get_board_access(board_crud: CRUDBoard, db: Session, board_id: int) -> Optional[BoardAccess]:
+    """게시판 공개 여부/소유자 (게시글 목록/작성 등 접근 확인용, 캐시에 없으면 두 컬럼만 조회, 게시판이 없으면 None)"""
+    def load() -> Optional[list]:
+        row = board_crud.get_access(db, board_id)
+        return None if row is None else [row.public, row.owner_id]
+
+    cached = board_access_cache.get_or_load(board_access_key(board_id), load)
+    return None if cached is None else BoardAccess(*cached)
+
+
+@traced_methods
 class BoardService:
     """게시판 관련 서비스"""
 
@@ -48,6 +90,8 @@ class BoardService:
                 db, obj_in=request, owner_id=current_user.id
             )
             db.commit()
+            if new_board.public:
+                invalidate_public_boards()
             return BoardResponse(
                 id=new_board.id,
                 name=new_board.name,
@@ -61,52 +105,206 @@ class BoardService:
             db.rollback()
             raise ConflictError("게시판 생성에 실패했습니다")
 
-    def list(self, current_user: CurrentUser, db: Session, sort: BoardSortOption = BoardSortOption.created_at):
-        """접근 가능한 게시판들의 SQLAlchemy Query 반환 (Cursor Pagination용)
+    def list(
+        self,
+        current_user: CurrentUser,
+        db: Session,
+        sort: BoardSortOption = BoardSortOption.created_at,
+        size: int = settings.DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        schema: Type[BaseModel] = BoardResponse
+    ) -> BaseModel:
+        """접근 가능한 게시판 목록 페이지 (공개 게시판 + 본인 비공개 게시판, 커서 페이지네이션)
+
+        공개 게시판 순서는 모든 사용자에게 같으므로 정렬별 앞쪽 BOARD_LIST_CACHE_SIZE 개를 캐시해 공유하고,
+        사용자별로 다른 비공개 게시판만 owner_id 로 조회해 정렬 순서대로 합칩니다.
+        캐시 범위를 벗어난 페이지는 공개 게시판도 DB 에서 조회합니다.
+        DB 조회는 schema 컬럼만 하고, 캐시한 공개 게시판은 모든 ?fields= 요청이 공유하므로 전체 필드를 담아 필드만 골라 응답합니다.
 
         Args:
             current_user: 현재 사용자
             db: 데이터베이스 세션
             sort: 정렬 옵션
+            size: 페이지당 항목 수
+            cursor: 이전 응답의 next_page/previous_page (없으면 첫 페이지)
+            schema: 응답 스키마 (?fields= 로 필드를 줄인 스키마면 해당 필드만 응답)
+
+        Returns:
+            CursorPageCustom[schema]: 게시판 목록 페이지
+
+        Raises:
+            HTTPException: 잘못된 커서 400
+        """
+        spec = BOARD_SORTS[sort]
+        after, backwards = None, False
+        if cursor is not None:
+            try:
+                decoded = KeysetCursor.decode(cursor)
+                value, board_id = decoded.values
+                after, backwards = (spec.parse(value), int(board_id)), decoded.backwards
+            except (TypeError, ValueError):
+                raise BadRequestError("올바른 커서가 아닙니다")
+
+        # size + 1 개로 다음(이전) 페이지가 있는지 확인
+        public, public_total = self._public_boards(db, sort, after, backwards, size + 1, schema)
+        private = self.board_crud.get_private_boards(db, current_user.id, sort, after, backwards, size + 1, schema)
+        boards = sorted(public + private, key=lambda row: spec.order_key(row.value, row.id), reverse=backwards)
+        has_more = len(boards) > size
+        boards = boards[:size]
+        if backwards:
+            boards.reverse()
+
+        def cursor_at(row: BoardListRow, backwards: bool) -> str:
+            return KeysetCursor([spec.dump(row.value), row.id], backwards).encode()
+
+        has_next = has_more if not backwards else bool(boards)
+        has_previous = has_more if backwards else after is not None and bool(boards)
+        return CursorPageCustom[schema](
+            items=[row.item for row in boards],
+            total=public_total + self.board_crud.count_private_boards(db, current_user.id),
+            current_page=cursor,
+            previous_page=cursor_at(boards[0], True) if has_previous else None,
+            next_page=cursor_at(boards[-1], False) if has_next else None,
+        )
+
+    def _public_boards(
+        self, db: Session, sort: BoardSortOption, after: Optional[Tuple[Any, int]], backwards: bool, limit: int,
+        schema: Type[BaseModel] = BoardResponse
+    ) -> Tuple[List[BoardListRow], int]:
+        """공개 게시판 페이지와 전체 공개 게시판 수 (캐시한 앞쪽 목록으로 되면 캐시, 아니면 DB 에서 schema 컬럼만)
+
+        캐시 항목: {"total": 공개 게시판 수, "items": 전체 필드 게시판 응답 목록, "keys": 항목별 [정렬 값, id]}
+        """
+        if not board_list_cache.enabled:
+            return (
+                self.board_crud.get_public_boards(db, sort, after, backwards, limit, schema),
+                self.board_crud.count_public_boards(db),
+            )
+        spec = BOARD_SORTS[sort]
+
+        def load() -> dict:
+            rows = self.board_crud.get_public_boards(db, sort, limit=settings.BOARD_LIST_CACHE_SIZE)
+            return {
+                "total": self.board_crud.count_public_boards(db),
+                "items": [row.item.model_dump(mode="json", by_alias=True) for row in rows],
+                "keys": [[spec.dump(row.value), row.id] for row in rows],
+            }
+
+        # 모든 사용자가 같은 항목을 읽으므로 만료 직후 동시 요청은 한 번만 조회 (stale-while-revalidate, 조기 갱신)
+        entry = board_list_cache.get_or_load(public_boards_key(sort.value), load)
+        items, keys, total = entry["items"], entry["keys"], entry["total"]
+        complete = len(items) == total
+        if after is None:
+            start, end = 0, limit
+            servable = complete or end <= len(items)
+        else:
+            # 캐시한 목록에서 경계 위치 (정렬 값은 이분 탐색으로 필요한 것만 파싱)
+            target = spec.order_key(*after)
+            order = lambda i: spec.order_key(spec.parse(keys[i][0]), keys[i][1])
+            if backwards:
+                end = bisect.bisect_left(range(len(keys)), target, key=order)
+                start = max(end - limit, 0)
+                # 경계가 캐시 범위 안이면 그 이전 공개 게시판은 모두 캐시에 있음
+                servable = complete or end < len(keys)
+            else:
+                start = bisect.bisect_right(range(len(keys)), target, key=order)
+                end = start + limit
+                servable = complete or end <= len(items)
+        if not servable:
+            return self.board_crud.get_public_boards(db, sort, after, backwards, limit, schema), total
+
+        # ?fields= 로 줄인 스키마면 캐시한 전체 응답에서 해당 필드만 (별칭이 같으므로 그대로 검증)
+        boards = [
+            BoardListRow(schema.model_validate(item), spec.parse(value), board_id)
+            for item, (value, board_id) in zip(items[start:end], keys[start:end])
+        ]
+        if backwards:
+            boards.reverse()
+        return boards, total
+
+    async def get_version(self, board_id: int, current_user: CurrentUser, db: Session) -> ResourceVersion:
+        """게시판 버전 조회 (조건부 요청 확인용, 응답 캐시에 없으면 전체 행 대신 권한/버전 컬럼만 조회)
+
+        Args:
+            board_id: 게시판 ID
+            current_user: 현재 사용자
+            db: 데이터베이스 세션
 
         Returns:
-            SQLAlchemy Query: paginate 함수에서 사용할 쿼리
+            ResourceVersion: 게시판 버전 (ETag, Last-Modified)
+
+        Raises:
+            HTTPException: 권한 없음 시 403, 존재하지 않음 404
         """
-        # 본인이 생성한 게시판 + 공개 게시판 쿼리
-        # Cursor pagination을 위해 정렬 기준과 ID 함께 정렬 (안정적인 정렬 보장)
-        return self.board_crud.get_accessible_boards(db, current_user.id, sort)
+        entry = detail_cache.get(detail_key("board", board_id))
+        if entry is not None:
+            data = entry["data"]
+            public, owner_id, posts_count = data["public"], data["owner_id"], data["posts_count"]
+            updated_at = datetime.fromisoformat(data["updated_at"])
+        else:
+            row = self.board_crud.get_version(db, board_id)
+            if row is None:
+                raise NotFoundError("게시판을 찾을 수 없습니다")
+            public, owner_id, updated_at, posts_count = row
+        if not public and owner_id != current_user.id:
+            raise ForbiddenError("게시판에 접근할 권한이 없습니다")
 
-    async def get(self, board_id: int, current_user: CurrentUser, db: Session) -> BoardResponse:
+        return board_version(board_id, updated_at, posts_count)
+
+    async def get(
+        self, board_id: int, current_user: CurrentUser, db: Session, schema: Type[BaseModel] = BoardResponse
+    ) -> Tuple[BaseModel, ResourceVersion]:
         """게시판 조회
 
+        응답 캐시에 있으면 캐시로 응답하고 (?fields= 는 캐시한 전체 응답에서 필드만 골라),
+        없으면 DB 에서 전체 필드를 조회해 캐시에 저장합니다. 만료 직후 동시 요청은 한 번만 조회합니다.
+        접근 권한은 캐시한 응답의 public, owner_id 로 매번 확인합니다.
+
         Args:
             board_id: 게시판 ID
             current_user: 현재 사용자
             db: 데이터베이스 세션
+            schema: 응답 스키마 (?fields= 로 필드를 줄인 스키마면 캐시를 끈 경우 해당 컬럼만 조회)
 
         Returns:
-            BoardResponse: 게시판 정보
+            Tuple[BoardResponse, ResourceVersion]: 게시판 정보 (schema 인스턴스), 버전
 
         Raises:
             HTTPException: 권한 없음 시 403, 존재하지 않음 404
         """
-        board = self.board_crud.get(db, id=board_id)
-        if not board:
-            raise NotFoundError("게시판을 찾을 수 없습니다")
-        if not board.public and board.owner_id != current_user.id:
+        if detail_cache.enabled:
+            entry = detail_cache.get_or_load(detail_key("board", board_id), lambda: self._detail_entry(db, board_id))
+            if entry is None:
+                raise NotFoundError("게시판을 찾을 수 없습니다")
+            data = entry["data"]
+            board = schema.model_validate(data)
+            public, owner_id, posts_count = data["public"], data["owner_id"], data["posts_count"]
+            updated_at = datetime.fromisoformat(data["updated_at"])
+        else:
+            row = self.board_crud.get_with_access(db, board_id, schema)
+            if row is None:
+                raise NotFoundError("게시판을 찾을 수 없습니다")
+            board, public, owner_id, updated_at, posts_count = row
+        if not public and owner_id != current_user.id:
             raise ForbiddenError("게시판에 접근할 권한이 없습니다")
 
-        return BoardResponse(
-            id=board.id,
-            name=board.name,
-            public=board.public,
-            owner_id=board.owner_id,
-            created_at=board.created_at,
-            updated_at=board.updated_at,
-            post_count=board.posts_count
-        )
+        return board, board_version(board_id, updated_at, posts_count)
 
-    async def update(self, board_id: int, request: BoardUpdate, current_user: CurrentUser, db: Session) -> BoardResponse:
+    def _detail_entry(self, db: Session, board_id: int) -> Optional[Dict[str, Any]]:
+        """상세 캐시 항목 (전체 필드 응답, 게시판이 없으면 None)"""
+        row = self.board_crud.get_with_access(db, board_id)
+        if row is None:
+            return None
+        return {"data": row[0].model_dump(mode="json", by_alias=True)}
+
+    async def update(
+        self,
+        board_id: int,
+        request: BoardUpdate,
+        current_user: CurrentUser,
+        db: Session,
+        if_match: Optional[str] = None
+    ) -> Tuple[BoardResponse, ResourceVersion]:
         """게시판 수정
 
         Args:
@@ -114,26 +312,38 @@ class BoardService:
             request: 게시판 수정 요청 데이터
             current_user: 현재 사용자
             db: 데이터베이스 세션
+            if_match: If-Match 헤더 (있으면 행을 잠그고 버전이 같을 때만 수정)
 
         Returns:
-            BoardResponse: 수정된 게시판 정보
+            Tuple[BoardResponse, ResourceVersion]: 수정된 게시판 정보, 수정 후 버전
 
         Raises:
-            HTTPException: 권한 없음 시 403, 존재하지 않음 404, 중복 시 409
+            HTTPException: 권한 없음 시 403, 존재하지 않음 404, 중복 시 409, 버전 불일치 시 412
         """
-        board = self.board_crud.get(db, id=board_id)
+        board = self.board_crud.get(db, id=board_id, for_update=if_match is not None)
         if not board:
             raise NotFoundError("게시판을 찾을 수 없습니다")
         if board.owner_id != current_user.id:
             raise ForbiddenError("게시판을 수정할 권한이 없습니다")
+        if if_match is not None and not version_matches(
+            if_match, board_version(board.id, board.updated_at, board.posts_count)
+        ):
+            raise PreconditionFailedError("다른 요청으로 게시판이 수정되었습니다. 다시 조회한 뒤 수정하세요")
 
         if request.name and request.name != board.name:
             existing_board = self.board_crud.get_by_name(db, name=request.name)
             if existing_board:
                 raise ConflictError("이미 존재하는 게시판 이름입니다")
+        was_public = board.public
         try:
             updated_board = self.board_crud.update(db, db_obj=board, obj_in=request)
             db.commit()
+            detail_cache.invalidate([detail_key("board", board_id)])
+            if updated_board.public != was_public:
+                # 게시글 조회도 게시판 접근 캐시로 권한을 확인하므로 게시글 캐시는 그대로 둠
+                board_access_cache.invalidate([board_access_key(board_id)])
+            if was_public or updated_board.public:
+                invalidate_public_boards()
             
             return BoardResponse(
                 id=updated_board.id,
@@ -143,7 +353,7 @@ class BoardService:
                 created_at=updated_board.created_at,
                 updated_at=updated_board.updated_at,
                 post_count=updated_board.posts_count
-            )
+            ), board_version(updated_board.id, updated_board.updated_at, updated_board.posts_count)
         except IntegrityError:
             db.rollback()
             raise ConflictError("게시판 수정에 실패했습니다")
@@ -169,9 +379,15 @@ class BoardService:
         # 권한 확인: 게시판 생성자만 삭제 가능
         if board.owner_id != current_user.id:
             raise ForbiddenError("게시판을 삭제할 권한이 없습니다")
+        was_public = board.public
         try:
             self.board_crud.delete(db, id=board_id)
             db.commit()
+            # 게시글도 함께 삭제됨 (CASCADE), 남은 게시글 캐시는 게시판 접근 확인 (게시판 없음) 에서 403 후 TTL 만료
+            detail_cache.invalidate([detail_key("board", board_id)])
+            board_access_cache.invalidate([board_access_key(board_id)])
+            if was_public:
+                invalidate_public_boards()
         except Exception as e:
             db.rollback()
             logger.error(f"게시판 삭제 실패: {e}")
@@ -1,22 +1,52 @@
 import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple, Type
 
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
-from app.crud.post import CRUDPost
+from app.core.config import settings
+from app.crud.post import CRUDPost, post as post_crud
 from app.crud.board import CRUDBoard
+from app.services.board import get_board_access, invalidate_public_boards
 from app.schemas.post import (
     PostCreate,
     PostUpdate,
     PostResponse,
+    PostSummaryResponse,
     PostSortOption
 )
+from app.schemas.sync import PostChangesResponse, SyncWatermark, advance
 from app.schemas.auth import CurrentUser
-from app.core.exceptions import NotFoundError, ForbiddenError, ConflictError, InternalServerError
+from app.db.session import SessionLocal
+from app.redis.cache import detail_cache, detail_key
+from app.core.etag import ResourceVersion, version_matches
+from app.core.exceptions import (
+    NotFoundError, ForbiddenError, ConflictError, GoneError, InternalServerError, PreconditionFailedError
+)
+from app.core.tracing import traced_methods
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def post_version(post_id: int, updated_at: datetime) -> ResourceVersion:
+    """게시글 버전"""
+    return ResourceVersion.of(updated_at, post_id)
+
+
+def purge_expired_tombstones() -> None:
+    """보관 기간(SYNC_TOMBSTONE_RETENTION_DAYS)이 지난 삭제 기록 정리 (lifespan 에서 주기적으로 실행)"""
+    before = datetime.now(timezone.utc) - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    with SessionLocal() as db:
+        purged = post_crud.purge_tombstones(db, before)
+        db.commit()
+    if purged:
+        logger.info(f"만료된 게시글 삭제 기록 {purged}건 정리")
+
+
+@traced_methods
 class PostService:
     """게시글 관련 서비스"""
 
@@ -39,10 +69,10 @@ class PostService:
         Raises:
             HTTPException: 게시판 없음 404, 게시판 접근 권한 없음 시 403
         """
-        board = self.board_crud.get(db, id=board_id)
+        board = get_board_access(self.board_crud, db, board_id)
         if not board:
             raise NotFoundError("존재하지 않는 게시판입니다")
-        if not self.board_crud.check_board_access(db, current_user.id, board_id):
+        if not board.allows(current_user.id):
             raise ForbiddenError("해당 게시판에 게시글을 작성할 권한이 없습니다")
         try:
             db_post = self.post_crud.create_with_user(
@@ -50,6 +80,10 @@ class PostService:
             )
             self.board_crud.change_posts_count(db, board_id=board_id, delta=1)
             db.commit()
+            # 게시판 상세/목록의 게시글 수가 바뀜
+            detail_cache.invalidate([detail_key("board", board_id)])
+            if board.public:
+                invalidate_public_boards()
             return PostResponse(
                 id=db_post.id,
                 title=db_post.title,
@@ -64,7 +98,14 @@ class PostService:
             db.rollback()
             raise ConflictError("게시글 생성에 실패했습니다")
 
-    def list(self, board_id: int, current_user: CurrentUser, db: Session, sort: PostSortOption = PostSortOption.created_at):
+    def list(
+        self,
+        board_id: int,
+        current_user: CurrentUser,
+        db: Session,
+        sort: PostSortOption = PostSortOption.created_at,
+        schema: Type[BaseModel] = PostSummaryResponse
+    ):
         """게시판의 게시글들의 SQLAlchemy Query 반환 (Cursor Pagination용)
 
         Args:
@@ -72,50 +113,170 @@ class PostService:
             current_user: 현재 사용자
             db: 데이터베이스 세션
             sort: 정렬 옵션
+            schema: 응답 스키마 (?fields= 로 필드를 줄인 스키마면 해당 컬럼만 조회)
 
         Returns:
             SQLAlchemy Query: paginate 함수에서 사용할 쿼리
         """
         # 게시판이 존재하고 접근 가능한지 확인
-        board = self.board_crud.get(db, id=board_id)
+        board = get_board_access(self.board_crud, db, board_id)
         if not board:
             raise NotFoundError("존재하지 않는 게시판입니다")
 
         # 비공개 게시판이면서 소유자가 아닌 경우 접근 거부
-        if not board.public and board.owner_id != current_user.id:
+        if not board.allows(current_user.id):
             raise ForbiddenError("해당 게시판에 접근할 권한이 없습니다")
             
-        return self.post_crud.get_accessible_posts(db, current_user.id, board_id, sort)
+        return self.post_crud.get_accessible_posts(db, current_user.id, board_id, sort, schema)
+
+    def changes(
+        self,
+        board_id: int,
+        since: Optional[SyncWatermark],
+        size: int,
+        current_user: CurrentUser,
+        db: Session
+    ) -> PostChangesResponse:
+        """게시판의 변경분 조회 (since 이후 생성/수정된 게시글, 삭제된 게시글 ID)
+
+        게시글과 삭제 기록을 각각 최대 size 개씩 조회하고, 어느 쪽이든 더 남았으면 has_more 로 알립니다.
+        클라이언트는 items 를 id 로 덮어쓰고 deleted 를 지운 뒤 새 watermark 로 다시 요청합니다.
+
+        Args:
+            board_id: 게시판 ID
+            since: 이전 응답의 watermark (없으면 처음부터)
+            size: 한 번에 조회할 최대 개수
+            current_user: 현재 사용자
+            db: 데이터베이스 세션
+
+        Returns:
+            PostChangesResponse: 변경분, 새 watermark
+
+        Raises:
+            HTTPException: 게시판 없음 404, 접근 권한 없음 403, 삭제 기록 보관 기간이 지난 watermark 410
+        """
+        board = get_board_access(self.board_crud, db, board_id)
+        if not board:
+            raise NotFoundError("존재하지 않는 게시판입니다")
+        if not board.allows(current_user.id):
+            raise ForbiddenError("해당 게시판에 접근할 권한이 없습니다")
+
+        now = datetime.now(timezone.utc)
+        horizon = now - timedelta(seconds=settings.SYNC_WATERMARK_LAG_SECONDS)
+        if since is None:
+            since = SyncWatermark.initial(horizon)
+        elif since.tombstones[0] < now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+            raise GoneError("watermark 가 너무 오래되어 삭제 기록이 정리되었습니다. 처음부터 다시 동기화하세요")
+
+        # horizon 이후 변경분은 아직 커밋되지 않은 더 이른 변경이 있을 수 있으므로 다음 동기화에서 보냄
+        # size + 1 개를 조회해 더 남았는지 확인
+        posts = self.post_crud.get_changes(db, board_id, since.posts, horizon, size + 1)
+        tombstones = self.post_crud.get_tombstones(db, board_id, since.tombstones, horizon, size + 1)
+        posts_more, tombstones_more = len(posts) > size, len(tombstones) > size
+        posts, tombstones = posts[:size], tombstones[:size]
+
+        watermark = SyncWatermark(
+            advance(since.posts, (posts[-1][1], posts[-1][0].id) if posts else since.posts, posts_more, horizon),
+            advance(
+                since.tombstones,
+                (tombstones[-1].deleted_at, tombstones[-1].id) if tombstones else since.tombstones,
+                tombstones_more,
+                horizon,
+            ),
+        )
+        return PostChangesResponse(
+            items=[post for post, _ in posts],
+            deleted=[tombstone.post_id for tombstone in tombstones],
+            watermark=watermark.encode(),
+            has_more=posts_more or tombstones_more,
+        )
+
+    async def get_version(self, post_id: int, current_user: CurrentUser, db: Session) -> ResourceVersion:
+        """게시글 버전 조회 (조건부 요청 확인용, 응답 캐시에 없으면 본문 없이 권한 확인 + updated_at 만 조회)
+
+        Args:
+            post_id: 게시글 ID
+            current_user: 현재 사용자
+            db: 데이터베이스 세션
+
+        Returns:
+            ResourceVersion: 게시글 버전 (ETag, Last-Modified)
+
+        Raises:
+            HTTPException: 권한 없음 시 403
+        """
+        entry = detail_cache.get(detail_key("post", post_id))
+        if entry is not None:
+            if not self._board_allows(db, entry["data"]["board_id"], current_user):
+                raise ForbiddenError("게시글을 찾을 수 없거나 접근 권한이 없습니다")
+            return post_version(post_id, datetime.fromisoformat(entry["data"]["updated_at"]))
+
+        updated_at = self.post_crud.get_accessible_version(db, current_user.id, post_id)
+        if updated_at is None:
+            raise ForbiddenError("게시글을 찾을 수 없거나 접근 권한이 없습니다")
+
+        return post_version(post_id, updated_at)
 
-    async def get(self, post_id: int, current_user: CurrentUser, db: Session) -> PostResponse:
+    async def get(
+        self, post_id: int, current_user: CurrentUser, db: Session, schema: Type[BaseModel] = PostResponse
+    ) -> Tuple[BaseModel, ResourceVersion]:
         """게시글 조회
 
+        응답 캐시에 있으면 캐시로 응답하고 (?fields= 는 캐시한 전체 응답에서 필드만 골라),
+        없으면 DB 에서 전체 필드를 조회해 캐시에 저장합니다. 만료 직후 동시 요청은 한 번만 조회합니다.
+        접근 권한은 게시판 접근 캐시 (get_board_access) 로 매번 확인합니다.
+        게시글 캐시에는 게시판 공개 여부를 넣지 않으므로 게시판 공개 여부 변경/삭제 시 게시글 캐시는 지우지 않습니다.
+
         Args:
             post_id: 게시글 ID
             current_user: 현재 사용자
             db: 데이터베이스 세션
+            schema: 응답 스키마 (?fields= 로 필드를 줄인 스키마면 캐시를 끈 경우 해당 컬럼만 조회)
 
         Returns:
-            PostResponse: 게시글 정보
+            Tuple[PostResponse, ResourceVersion]: 게시글 정보 (schema 인스턴스), 버전
 
         Raises:
             HTTPException: 권한 없음 시 403
         """
-        post = self.post_crud.get_accessible_post(db, current_user.id, post_id)
-        if not post:
+        if detail_cache.enabled:
+            entry = detail_cache.get_or_load(detail_key("post", post_id), lambda: self._detail_entry(db, post_id))
+            if entry is None:
+                raise ForbiddenError("게시글을 찾을 수 없거나 접근 권한이 없습니다")
+            post = schema.model_validate(entry["data"])
+            updated_at = datetime.fromisoformat(entry["data"]["updated_at"])
+            allowed = self._board_allows(db, entry["data"]["board_id"], current_user)
+        else:
+            row = self.post_crud.get_with_access(db, post_id, schema)
+            if not row:
+                raise ForbiddenError("게시글을 찾을 수 없거나 접근 권한이 없습니다")
+            post, updated_at, public, board_owner_id = row
+            allowed = public or board_owner_id == current_user.id
+        if not allowed:
             raise ForbiddenError("게시글을 찾을 수 없거나 접근 권한이 없습니다")
 
-        return PostResponse(
-            id=post.id,
-            title=post.title,
-            content=post.content,
-            owner_id=post.owner_id,
-            board_id=post.board_id,
-            created_at=post.created_at,
-            updated_at=post.updated_at
-        )
+        return post, post_version(post_id, updated_at)
+
+    def _board_allows(self, db: Session, board_id: int, current_user: CurrentUser) -> bool:
+        """캐시한 게시글의 게시판 접근 권한 (게시판이 삭제되었으면 False)"""
+        board = get_board_access(self.board_crud, db, board_id)
+        return board is not None and board.allows(current_user.id)
 
-    async def update(self, post_id: int, request: PostUpdate, current_user: CurrentUser, db: Session) -> PostResponse:
+    def _detail_entry(self, db: Session, post_id: int) -> Optional[Dict[str, Any]]:
+        """상세 캐시 항목 (전체 필드 응답, 게시글이 없으면 None)"""
+        post = self.post_crud.get_detail(db, post_id)
+        if post is None:
+            return None
+        return {"data": post.model_dump(mode="json")}
+
+    async def update(
+        self,
+        post_id: int,
+        request: PostUpdate,
+        current_user: CurrentUser,
+        db: Session,
+        if_match: Optional[str] = None
+    ) -> Tuple[PostResponse, ResourceVersion]:
         """게시글 수정
 
         Args:
@@ -123,21 +284,25 @@ class PostService:
             request: 게시글 수정 요청 데이터
             current_user: 현재 사용자
             db: 데이터베이스 세션
+            if_match: If-Match 헤더 (있으면 행을 잠그고 버전이 같을 때만 수정)
 
         Returns:
-            PostResponse: 수정된 게시글 정보
+            Tuple[PostResponse, ResourceVersion]: 수정된 게시글 정보, 수정 후 버전
 
         Raises:
-            HTTPException: 권한 없음 시 403, 존재하지 않음 404
+            HTTPException: 권한 없음 시 403, 존재하지 않음 404, 버전 불일치 시 412
         """
-        post = self.post_crud.get(db, id=post_id)
+        post = self.post_crud.get(db, id=post_id, for_update=if_match is not None)
         if not post:
             raise NotFoundError("게시글을 찾을 수 없습니다")
         if post.owner_id != current_user.id:
             raise ForbiddenError("게시글을 수정할 권한이 없습니다")
+        if if_match is not None and not version_matches(if_match, post_version(post.id, post.updated_at)):
+            raise PreconditionFailedError("다른 요청으로 게시글이 수정되었습니다. 다시 조회한 뒤 수정하세요")
         try:
             updated_post = self.post_crud.update(db, db_obj=post, obj_in=request)
             db.commit()
+            detail_cache.invalidate([detail_key("post", post_id)])
             
             return PostResponse(
                 id=updated_post.id,
@@ -147,7 +312,7 @@ class PostService:
                 board_id=updated_post.board_id,
                 created_at=updated_post.created_at,
                 updated_at=updated_post.updated_at
-            )
+            ), post_version(updated_post.id, updated_post.updated_at)
 
         except IntegrityError:
             db.rollback()
@@ -169,11 +334,16 @@ class PostService:
             raise NotFoundError("게시글을 찾을 수 없습니다")
         if post.owner_id != current_user.id:
             raise ForbiddenError("게시글을 삭제할 권한이 없습니다")
+        board_id, board_public = post.board_id, post.board.public
 
         try:
+            self.post_crud.create_tombstone(db, post)
             self.post_crud.delete(db, id=post_id)
-            self.board_crud.change_posts_count(db, board_id=post.board_id, delta=-1)
+            self.board_crud.change_posts_count(db, board_id=board_id, delta=-1)
             db.commit()
+            detail_cache.invalidate([detail_key("post", post_id), detail_key("board", board_id)])
+            if board_public:
+                invalidate_public_boards()
         except Exception as e:
             db.rollback()
             logger.error(f"게시글 삭제 중 오류 발생: {e}")
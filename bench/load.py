@@ -0,0 +1,449 @@
+"""
+HTTP 부하 테스트 하네스
+
+실행 중인 서버에 시드된 사용자들로 로그인한 뒤, 게시판 목록(정렬별), 게시글 목록과
+깊은 커서 페이징, 상세 조회, 게시글 생성/수정/삭제를 설정한 비율로 섞어 요청합니다.
+부하는 open-loop 방식으로 목표 RPS에 맞춰 발생시키며, 지연시간은 예정된 요청 시각부터
+측정합니다 (서버가 느려져도 요청 간격이 늘어나지 않아 coordinated omission 을 피함).
+
+사용법:
+    python -m bench.load --base-url http://localhost:8000 --users-file users.txt --rps 100 --duration 60
+    python -m bench.load --from-db 50 --rps 200 --duration 120 --output results/build-a.json
+    python -m bench.load --signup 20 --mix list_boards=50,get_post=50 --arrival poisson
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from bench.stats import summarize_latencies
+
+API_PATH = "/api/v1"
+# scripts/create_dummy_data.py 로 생성한 사용자의 비밀번호
+DEFAULT_PASSWORD = "qwer1234"
+BOARD_SORTS = ("created_at", "updated_at", "posts", "name")
+POST_SORTS = ("created_at", "title")
+# 시나리오별 기본 가중치
+DEFAULT_MIX = {
+    "list_boards": 20,
+    "get_board": 5,
+    "list_posts": 20,
+    "page_posts": 10,
+    "get_post": 30,
+    "create_post": 5,
+    "update_post": 5,
+    "delete_post": 5,
+}
+# 사용자별로 기억할 게시판/게시글 ID 최대 수
+_MAX_KNOWN_IDS = 500
+
+
+@dataclass
+class UserSession:
+    """로그인한 부하 테스트 사용자"""
+    email: str
+    token: str
+    boards: List[int] = field(default_factory=list)
+    posts: List[int] = field(default_factory=list)
+    created_posts: List[int] = field(default_factory=list)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+def _remember(ids: List[int], new_ids: List[int]) -> None:
+    ids.extend(i for i in new_ids if i not in ids)
+    del ids[:-_MAX_KNOWN_IDS]
+
+
+def _depth_label(page: int) -> str:
+    """커서 페이지 깊이 구간"""
+    if page <= 4:
+        return "2-4"
+    if page <= 9:
+        return "5-9"
+    return "10+"
+
+
+class Recorder:
+    """엔드포인트별 지연시간/상태 코드 수집"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.dropped = 0
+
+    def record(self, endpoint: str, latency_ms: float, status: str, error: bool) -> None:
+        self.latencies[endpoint].append(latency_ms)
+        self.statuses[endpoint][status] += 1
+        if error:
+            self.errors[endpoint] += 1
+
+    def report(self, duration: float, config: Dict[str, Any]) -> Dict[str, Any]:
+        endpoints = {}
+        for endpoint in sorted(self.latencies):
+            count = len(self.latencies[endpoint])
+            endpoints[endpoint] = {
+                "requests": count,
+                "errors": self.errors[endpoint],
+                "error_rate": round(self.errors[endpoint] / count, 4),
+                "throughput_rps": round(count / duration, 2),
+                "statuses": dict(self.statuses[endpoint]),
+                "latency_ms": summarize_latencies(self.latencies[endpoint]),
+            }
+        total = sum(len(values) for values in self.latencies.values())
+        errors = sum(self.errors.values())
+        return {
+            "config": config,
+            "summary": {
+                "requests": total,
+                "errors": errors,
+                "error_rate": round(errors / total, 4) if total else 0.0,
+                "dropped": self.dropped,
+                "duration_s": round(duration, 3),
+                "throughput_rps": round(total / duration, 2),
+                "latency_ms": summarize_latencies(v for values in self.latencies.values() for v in values),
+            },
+            "endpoints": endpoints,
+        }
+
+
+class LoadTest:
+    """시나리오 실행기 (요청 하나 또는 연속된 페이지 요청을 하나의 작업으로 실행)"""
+
+    def __init__(self, client: httpx.AsyncClient, users: List[UserSession], args: argparse.Namespace):
+        self.client = client
+        self.users = users
+        self.args = args
+        self.recorder = Recorder()
+        self.rng = random.Random(args.seed)
+        self.measure_from = 0.0
+        self.mix = args.mix
+        self.scenarios = {
+            "list_boards": self.list_boards,
+            "get_board": self.get_board,
+            "list_posts": self.list_posts,
+            "page_posts": self.page_posts,
+            "get_post": self.get_post,
+            "create_post": self.create_post,
+            "update_post": self.update_post,
+            "delete_post": self.delete_post,
+        }
+
+    async def request(
+        self, endpoint: str, method: str, url: str, user: UserSession, started: float, **kwargs
+    ) -> Optional[httpx.Response]:
+        """요청 실행 후 기록 (started 는 예정 시각, 워밍업 중이면 기록하지 않음)"""
+        loop = asyncio.get_running_loop()
+        try:
+            response = await self.client.request(method, API_PATH + url, headers=user.headers, **kwargs)
+            status, error = str(response.status_code), response.status_code >= 400
+        except httpx.HTTPError as e:
+            response, status, error = None, type(e).__name__, True
+        if started >= self.measure_from:
+            self.recorder.record(endpoint, (loop.time() - started) * 1000, status, error)
+        return response if response is not None and not error else None
+
+    # 시나리오
+
+    async def list_boards(self, user: UserSession, started: float) -> None:
+        sort = self.rng.choice(BOARD_SORTS)
+        response = await self.request(
+            f"GET /boards?sort={sort}", "GET", "/boards/", user, started,
+            params={"sort": sort, "size": self.args.page_size},
+        )
+        if response is not None:
+            _remember(user.boards, [item["id"] for item in response.json()["items"]])
+
+    async def get_board(self, user: UserSession, started: float) -> None:
+        if not user.boards:
+            return await self.list_boards(user, started)
+        board_id = self.rng.choice(user.boards)
+        await self.request("GET /boards/{board_id}", "GET", f"/boards/{board_id}", user, started)
+
+    async def list_posts(self, user: UserSession, started: float) -> None:
+        if not user.boards:
+            return await self.list_boards(user, started)
+        board_id, sort = self.rng.choice(user.boards), self.rng.choice(POST_SORTS)
+        response = await self.request(
+            f"GET /boards/{{board_id}}/posts?sort={sort}", "GET", f"/boards/{board_id}/posts", user, started,
+            params={"sort": sort, "size": self.args.page_size},
+        )
+        if response is not None:
+            _remember(user.posts, [item["id"] for item in response.json()["items"]])
+
+    async def page_posts(self, user: UserSession, started: float) -> None:
+        """다음 페이지 커서를 따라 page_depth 까지 연속 조회 (2페이지부터는 요청 시점부터 측정)"""
+        if not user.boards:
+            return await self.list_boards(user, started)
+        board_id = self.rng.choice(user.boards)
+        params = {"sort": self.rng.choice(POST_SORTS), "size": self.args.page_size}
+        loop = asyncio.get_running_loop()
+        for page in range(1, self.args.page_depth + 1):
+            endpoint = "GET /boards/{board_id}/posts" + (f" [page {_depth_label(page)}]" if page > 1 else "")
+            response = await self.request(endpoint, "GET", f"/boards/{board_id}/posts", user, started, params=params)
+            if response is None:
+                return
+            data = response.json()
+            if not data.get("next_page"):
+                return
+            params = {**params, "cursor": data["next_page"]}
+            started = max(loop.time(), started)
+
+    async def get_post(self, user: UserSession, started: float) -> None:
+        if not user.posts:
+            return await self.list_posts(user, started)
+        post_id = self.rng.choice(user.posts)
+        await self.request("GET /posts/{post_id}", "GET", f"/posts/{post_id}", user, started)
+
+    async def create_post(self, user: UserSession, started: float) -> None:
+        if not user.boards:
+            return await self.list_boards(user, started)
+        board_id = self.rng.choice(user.boards)
+        body = {
+            "title": f"bench {uuid.uuid4().hex[:8]}",
+            "content": "부하 테스트 게시글 " * self.rng.randint(1, 50),
+        }
+        response = await self.request(
+            "POST /boards/{board_id}/posts", "POST", f"/boards/{board_id}/posts", user, started, json=body
+        )
+        if response is not None:
+            user.created_posts.append(response.json()["id"])
+
+    async def update_post(self, user: UserSession, started: float) -> None:
+        if not user.created_posts:
+            return await self.create_post(user, started)
+        post_id = self.rng.choice(user.created_posts)
+        await self.request(
+            "PUT /posts/{post_id}", "PUT", f"/posts/{post_id}", user, started,
+            json={"title": f"bench updated {uuid.uuid4().hex[:8]}"},
+        )
+
+    async def delete_post(self, user: UserSession, started: float) -> None:
+        if not user.created_posts:
+            return await self.create_post(user, started)
+        post_id = user.created_posts.pop(self.rng.randrange(len(user.created_posts)))
+        await self.request("DELETE /posts/{post_id}", "DELETE", f"/posts/{post_id}", user, started)
+
+    # 실행
+
+    async def prime(self) -> None:
+        """사용자별로 접근 가능한 게시판/게시글 ID 수집 (기록하지 않음)"""
+        self.measure_from = float("inf")
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(self.list_boards(user, loop.time()) for user in self.users))
+        await asyncio.gather(*(self.list_posts(user, loop.time()) for user in self.users))
+
+    def _next_interval(self) -> float:
+        if self.args.arrival == "poisson":
+            return self.rng.expovariate(self.args.rps)
+        return 1 / self.args.rps
+
+    async def run(self) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        names = list(self.mix)
+        weights = [self.mix[name] for name in names]
+        in_flight: set = set()
+
+        start = loop.time()
+        self.measure_from = start + self.args.warmup
+        end = self.measure_from + self.args.duration
+        scheduled = start
+        while scheduled < end:
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= self.args.max_in_flight:
+                # 클라이언트 측 동시 실행 한도 초과 (요청을 미루지 않고 버린 뒤 집계)
+                if scheduled >= self.measure_from:
+                    self.recorder.dropped += 1
+            else:
+                scenario = self.scenarios[self.rng.choices(names, weights)[0]]
+                task = asyncio.create_task(scenario(self.rng.choice(self.users), scheduled))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            scheduled += self._next_interval()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        duration = max(loop.time() - self.measure_from, 1e-9)
+
+        config = {
+            "base_url": self.args.base_url,
+            "rps": self.args.rps,
+            "duration": self.args.duration,
+            "warmup": self.args.warmup,
+            "arrival": self.args.arrival,
+            "users": len(self.users),
+            "page_size": self.args.page_size,
+            "page_depth": self.args.page_depth,
+            "mix": self.mix,
+            "seed": self.args.seed,
+        }
+        return self.recorder.report(duration, config)
+
+
+# 사용자 준비
+
+def _load_users_file(path: str) -> List[tuple]:
+    """한 줄에 `email` 또는 `email:password`"""
+    credentials = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            email, _, password = line.partition(":")
+            credentials.append((email, password or DEFAULT_PASSWORD))
+    return credentials
+
+
+def _load_users_from_db(count: int) -> List[tuple]:
+    """DB에서 시드된 사용자 이메일 조회 (DATABASE_URL 사용)"""
+    from sqlalchemy import select
+
+    from app.db.session import SessionLocal
+    from app.models import User
+
+    with SessionLocal() as db:
+        emails = db.execute(select(User.email).order_by(User.id).limit(count)).scalars().all()
+    return [(email, DEFAULT_PASSWORD) for email in emails]
+
+
+async def _signup_users(client: httpx.AsyncClient, count: int) -> List[tuple]:
+    run_id = uuid.uuid4().hex[:8]
+    credentials = []
+    for i in range(count):
+        email = f"bench_{run_id}_{i}@example.com"
+        response = await client.post(
+            f"{API_PATH}/auth/signup",
+            json={"email": email, "password": DEFAULT_PASSWORD, "fullname": f"bench {i}"},
+        )
+        response.raise_for_status()
+        credentials.append((email, DEFAULT_PASSWORD))
+    return credentials
+
+
+async def login_users(client: httpx.AsyncClient, credentials: List[tuple], concurrency: int = 8) -> List[UserSession]:
+    """사용자 풀 로그인 (bcrypt 부하를 고려해 동시 로그인 수 제한)"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def login(email: str, password: str) -> Optional[UserSession]:
+        async with semaphore:
+            response = await client.post(f"{API_PATH}/auth/login", json={"email": email, "password": password})
+        if response.status_code != 200:
+            print(f"⚠️  로그인 실패: {email} ({response.status_code})", file=sys.stderr)
+            return None
+        return UserSession(email=email, token=response.json()["access_token"])
+
+    sessions = await asyncio.gather(*(login(email, password) for email, password in credentials))
+    return [session for session in sessions if session is not None]
+
+
+# 보고서
+
+def format_report(report: Dict[str, Any]) -> str:
+    """텍스트 요약"""
+    summary = report["summary"]
+    latency = summary["latency_ms"]
+    lines = [
+        "=" * 110,
+        f"요청 {summary['requests']}건 / {summary['duration_s']}s, "
+        f"처리량 {summary['throughput_rps']} rps (목표 {report['config']['rps']}), "
+        f"에러율 {summary['error_rate'] * 100:.2f}%, 버림 {summary['dropped']}건",
+    ]
+    if latency.get("count"):
+        lines.append(
+            f"지연시간(ms) p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  "
+            f"p99.9 {latency['p99.9']}  max {latency['max']}"
+        )
+    lines.append("-" * 110)
+    lines.append(
+        f"{'endpoint':<48}{'reqs':>8}{'err%':>7}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'p99.9':>10}"
+    )
+    for endpoint, stats in report["endpoints"].items():
+        latency = stats["latency_ms"]
+        lines.append(
+            f"{endpoint:<48}{stats['requests']:>8}{stats['error_rate'] * 100:>7.2f}{stats['throughput_rps']:>8}"
+            f"{latency['p50']:>9}{latency['p95']:>9}{latency['p99']:>9}{latency['p99.9']:>10}"
+        )
+    lines.append("=" * 110)
+    return "\n".join(lines)
+
+
+def _parse_mix(value: str) -> Dict[str, float]:
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"알 수 없는 시나리오: {name} (가능: {', '.join(DEFAULT_MIX)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Board API 부하 테스트")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    users = parser.add_mutually_exclusive_group(required=True)
+    users.add_argument("--users-file", help="로그인할 사용자 목록 파일 (email 또는 email:password)")
+    users.add_argument("--from-db", type=int, metavar="N", help="DB에서 시드된 사용자 N명 사용")
+    users.add_argument("--signup", type=int, metavar="N", help="부하 테스트용 사용자 N명 가입 후 사용")
+    parser.add_argument("--rps", type=float, default=50, help="목표 초당 작업 수")
+    parser.add_argument("--duration", type=float, default=30, help="측정 시간 (초)")
+    parser.add_argument("--warmup", type=float, default=5, help="측정에서 제외할 워밍업 시간 (초)")
+    parser.add_argument("--arrival", choices=("constant", "poisson"), default="constant", help="요청 도착 간격 분포")
+    parser.add_argument("--mix", type=_parse_mix, default=DEFAULT_MIX, help="시나리오 가중치 (예: list_boards=20,get_post=30)")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--page-depth", type=int, default=10, help="page_posts 시나리오의 최대 커서 페이지 수")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="클라이언트 측 최대 동시 작업 수")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=42, help="시나리오 선택 난수 시드 (빌드 간 동일 트래픽)")
+    parser.add_argument("--output", help="JSON 결과 파일 경로")
+    return parser.parse_args(argv)
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        if args.users_file:
+            credentials = _load_users_file(args.users_file)
+        elif args.from_db:
+            credentials = _load_users_from_db(args.from_db)
+        else:
+            credentials = await _signup_users(client, args.signup)
+
+        print(f"👤 {len(credentials)}명 로그인 중...")
+        users = await login_users(client, credentials)
+        if not users:
+            raise SystemExit("❌ 로그인한 사용자가 없습니다")
+
+        load_test = LoadTest(client, users, args)
+        await load_test.prime()
+        print(f"🚀 {args.rps} rps로 {args.duration}s 측정 (워밍업 {args.warmup}s)...")
+        started = time.perf_counter()
+        report = await load_test.run()
+        print(f"⏱  완료 ({time.perf_counter() - started:.1f}s)")
+        return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    report = asyncio.run(main_async(args))
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,424 @@
+"""
+핫패스 마이크로 벤치마크
+
+토큰 디코딩, 세션 검증, get_current_user, 게시판 목록(커서 페이지 깊이별),
+PostService.create, 응답 모델 직렬화(JSON/MessagePack, 응답 크기 포함)를 반복 측정하고 JSON 기준값과 비교합니다.
+DB는 기본으로 SQLite(in-memory)를 사용하며, --database-url 로 Postgres 등을 지정할 수 있습니다.
+Redis는 앱 설정(REDIS_URL)을 그대로 사용합니다.
+
+사용법:
+    python -m bench.micro run --save sqlite                    # bench/baselines/sqlite.json 저장
+    python -m bench.micro run --database-url postgresql://... --save postgres
+    python -m bench.micro run --output current.json --filter boards
+    python -m bench.micro compare sqlite current.json --threshold 0.1
+"""
+import argparse
+import asyncio
+import contextvars
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BASELINE_DIR = Path(__file__).resolve().parent / "baselines"
+DEFAULT_DATABASE_URL = "sqlite://"
+# 게시판 목록 커서 페이지 깊이
+PAGINATION_DEPTHS = (1, 10, 50)
+PAGE_SIZE = 20
+# 게시글 목록/직렬화 벤치마크용 페이지 크기 (MAX_PAGE_SIZE)
+POST_PAGE_SIZE = 100
+
+
+class Benchmark:
+    """측정 대상 함수 (동기 또는 async, 직렬화 벤치마크는 응답 본문 크기도 기록)"""
+
+    def __init__(
+        self, name: str, func: Callable[[], Any], is_async: bool = False, payload_bytes: Optional[int] = None
+    ):
+        self.name = name
+        self.func = func
+        self.is_async = is_async
+        self.payload_bytes = payload_bytes
+
+
+def _time_round(benchmark: Benchmark, number: int, loop: asyncio.AbstractEventLoop) -> float:
+    """number 회 실행에 걸린 시간 (초)"""
+    if benchmark.is_async:
+        async def run():
+            for _ in range(number):
+                await benchmark.func()
+        started = time.perf_counter()
+        loop.run_until_complete(run())
+        return time.perf_counter() - started
+    func = benchmark.func
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - started
+
+
+def measure(benchmark: Benchmark, rounds: int, min_round_time: float, loop: asyncio.AbstractEventLoop) -> Dict[str, Any]:
+    """라운드당 실행 횟수를 min_round_time 이상이 되도록 보정한 뒤 라운드별 호출당 시간(us) 측정"""
+    number = 1
+    while True:
+        elapsed = _time_round(benchmark, number, loop)
+        if elapsed >= min_round_time or number >= 1_000_000:
+            break
+        number *= 2 if elapsed < min_round_time / 4 else 1 + int(min_round_time / max(elapsed, 1e-9))
+    per_call = [_time_round(benchmark, number, loop) / number * 1e6 for _ in range(rounds)]
+    return {
+        "unit": "us",
+        "median": round(statistics.median(per_call), 3),
+        "mean": round(statistics.fmean(per_call), 3),
+        "min": round(min(per_call), 3),
+        "max": round(max(per_call), 3),
+        "stdev": round(statistics.stdev(per_call), 3) if len(per_call) > 1 else 0.0,
+        "rounds": rounds,
+        "number": number,
+    }
+
+
+# 픽스처
+
+class Fixture:
+    """벤치마크용 DB/Redis 데이터 준비"""
+
+    def __init__(self, database_url: str, boards: int, posts: int):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+
+        from app.db.base import Base
+
+        options = {"poolclass": StaticPool, "connect_args": {"check_same_thread": False}} \
+            if database_url.startswith("sqlite") else {}
+        self.engine = create_engine(database_url, **options)
+        self.dialect = self.engine.dialect.name
+        Base.metadata.create_all(self.engine)
+        self.db = sessionmaker(bind=self.engine, autoflush=False, expire_on_commit=False)()
+        self._seed(boards, posts)
+
+    def _seed(self, board_count: int, post_count: int) -> None:
+        from sqlalchemy import insert, select
+
+        from app.core.security import create_access_token, get_password_hash
+        from app.core.session import create_session
+        from app.models import Board, Post, User
+        from app.models.post import make_excerpt
+        from app.services.board import invalidate_public_boards
+
+        now = datetime.now(timezone.utc)
+        password = get_password_hash("qwer1234")
+        self.db.execute(insert(User), [
+            {"fullname": f"bench {i}", "email": f"micro_bench_{i}@example.com", "password": password}
+            for i in range(2)
+        ])
+        users = self.db.execute(select(User).order_by(User.id)).scalars().all()
+        self.user, other = users[0], users[1]
+        self.db.execute(insert(Board), [
+            {
+                "name": f"micro_bench_board_{i}",
+                "public": i % 5 != 0,
+                "owner_id": (self.user if i % 2 else other).id,
+                "created_at": now - timedelta(minutes=i),
+                "updated_at": now - timedelta(minutes=i),
+                "posts_count": i % 97,
+            }
+            for i in range(board_count)
+        ])
+        self.board_id = self.db.execute(
+            select(Board.id).where(Board.owner_id == self.user.id).order_by(Board.id)
+        ).scalars().first()
+        content = "벤치마크 게시글 본문입니다. " * 20
+        self.db.execute(insert(Post), [
+            {
+                "title": f"bench post {i}",
+                "content": content,
+                "excerpt": make_excerpt(content),
+                "board_id": self.board_id,
+                "owner_id": self.user.id,
+                "created_at": now - timedelta(seconds=i),
+                "updated_at": now - timedelta(seconds=i),
+            }
+            for i in range(post_count)
+        ])
+        self.db.commit()
+        # 이전 실행에서 남은 공개 게시판 목록 캐시 제거
+        invalidate_public_boards()
+
+        self.token = create_access_token(data={"user_id": str(self.user.id)})
+        create_session(self.user.id, self.token, {"id": self.user.id, "email": self.user.email})
+
+    def close(self) -> None:
+        from app.core.session import delete_session
+        from app.db.base import Base
+        from app.services.board import invalidate_public_boards
+
+        delete_session(self.user.id)
+        invalidate_public_boards()
+        self.db.close()
+        Base.metadata.drop_all(self.engine)
+        self.engine.dispose()
+
+
+def _paginate(fixture: Fixture, sort, cursor: Optional[str]):
+    """게시판 목록 페이지 (BoardService.list, 공개 게시판 캐시는 BOARD_LIST_CACHE_ENABLED 설정대로)"""
+    from app.api.v1.deps import get_board_service
+    from app.schemas.auth import CurrentUser
+
+    current_user = CurrentUser.model_validate(fixture.user, from_attributes=True)
+    return get_board_service().list(current_user, fixture.db, sort, PAGE_SIZE, cursor)
+
+
+def _paginate_posts(fixture: Fixture, size: int):
+    """게시글 목록 첫 페이지 (size 개)"""
+    from fastapi_pagination import set_page
+    from fastapi_pagination.ext.sqlalchemy import paginate
+
+    from app.crud.post import post as post_crud
+    from app.schemas.pagination import TotalCursorParams
+    from app.schemas.post import PostListResponse
+
+    with set_page(PostListResponse):
+        stmt = post_crud.get_accessible_posts(fixture.db, fixture.user.id, fixture.board_id)
+        return paginate(fixture.db, stmt, TotalCursorParams(size=size))
+
+
+def _cursor_at_depth(fixture: Fixture, sort, depth: int) -> Optional[str]:
+    """depth 번째 페이지를 가리키는 커서 (1페이지는 None)"""
+    cursor = None
+    for _ in range(depth - 1):
+        page = _paginate(fixture, sort, cursor)
+        if not page.next_page:
+            break
+        cursor = page.next_page
+    return cursor
+
+
+def build_benchmarks(fixture: Fixture) -> List[Benchmark]:
+    from fastapi.routing import serialize_response
+    from fastapi.security import HTTPAuthorizationCredentials
+    from fastapi.utils import create_model_field
+
+    from app.api.v1.deps import get_auth_service, get_current_user, get_post_service
+    from app.api.routing import TimedRoute, response_media_type
+    from app.core.negotiation import MSGPACK_MEDIA_TYPE
+    from app.core.security import decode_access_token
+    from app.core.session import validate_session
+    from app.schemas.auth import CurrentUser
+    from app.schemas.board import BoardListResponse, BoardSortOption
+    from app.schemas.post import PostCreate, PostListResponse, PostResponse
+
+    db, user, token = fixture.db, fixture.user, fixture.token
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    auth_service, post_service = get_auth_service(), get_post_service()
+    current_user = CurrentUser.model_validate(user, from_attributes=True)
+
+    async def resolve_current_user():
+        return await get_current_user(credentials=credentials, db=db, auth_service=auth_service)
+
+    post_request = PostCreate(title="bench post", content="벤치마크 게시글 본문입니다. " * 20)
+
+    async def create_post():
+        return await post_service.create(fixture.board_id, post_request, current_user, db)
+
+    benchmarks = [
+        Benchmark("security.decode_access_token", lambda: decode_access_token(token)),
+        Benchmark("session.validate_session", lambda: validate_session(user.id, token)),
+        Benchmark("deps.get_current_user", resolve_current_user, is_async=True),
+    ]
+    for sort in BoardSortOption:
+        for depth in PAGINATION_DEPTHS:
+            cursor = _cursor_at_depth(fixture, sort, depth)
+            benchmarks.append(Benchmark(
+                f"boards.paginate[sort={sort.value},depth={depth}]",
+                lambda sort=sort, cursor=cursor: _paginate(fixture, sort, cursor),
+            ))
+    benchmarks.append(Benchmark(
+        f"posts.paginate[size={POST_PAGE_SIZE}]", lambda: _paginate_posts(fixture, POST_PAGE_SIZE)
+    ))
+    benchmarks.append(Benchmark("services.PostService.create", create_post, is_async=True))
+
+    # 엔드포인트가 response_model 로 수행하는 검증 + JSON 변환과 동일한 경로 (FastAPI 기본)
+    # 와 TimedRoute 의 fast path (검증된 응답 모델을 바로 JSON 바이트로 직렬화),
+    # Accept: application/msgpack 요청의 MessagePack 인코딩 (fast path 와 응답 크기 비교)
+    msgpack_context = contextvars.copy_context()
+    msgpack_context.run(response_media_type.set, MSGPACK_MEDIA_TYPE)
+    post = PostResponse.model_validate(post_service.post_crud.get(db, id=1), from_attributes=True)
+    responses = {
+        "board_page": (BoardListResponse, _paginate(fixture, BoardSortOption.created_at, None)),
+        f"post_page[{POST_PAGE_SIZE}]": (PostListResponse, _paginate_posts(fixture, POST_PAGE_SIZE)),
+        "post_detail": (PostResponse, post),
+    }
+    for name, (model, content) in responses.items():
+        field = create_model_field(name="Response", type_=model, mode="serialization")
+        route = TimedRoute("/bench", lambda: None, response_model=model)
+
+        async def serialize_default(field=field, content=content):
+            return json.dumps(await serialize_response(field=field, response_content=content), ensure_ascii=False)
+
+        def serialize_msgpack(route=route, content=content):
+            return msgpack_context.run(route.serialize, content)
+
+        benchmarks.append(Benchmark(f"serialize.{name}", serialize_default, is_async=True))
+        benchmarks.append(Benchmark(
+            f"serialize.{name}[fast]",
+            lambda route=route, content=content: route.serialize(content),
+            payload_bytes=len(route.serialize(content).body),
+        ))
+        benchmarks.append(Benchmark(
+            f"serialize.{name}[msgpack]", serialize_msgpack, payload_bytes=len(serialize_msgpack().body)
+        ))
+    return benchmarks
+
+
+# 실행/비교
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    fixture = Fixture(args.database_url, args.boards, args.posts)
+    loop = asyncio.new_event_loop()
+    results: Dict[str, Any] = {}
+    try:
+        for benchmark in build_benchmarks(fixture):
+            if args.filter and args.filter not in benchmark.name:
+                continue
+            results[benchmark.name] = measure(benchmark, args.rounds, args.min_round_time, loop)
+            result = results[benchmark.name]
+            size = ""
+            if benchmark.payload_bytes is not None:
+                result["payload_bytes"] = benchmark.payload_bytes
+                size = f"  {benchmark.payload_bytes} B"
+            print(f"  {benchmark.name:<50} {result['median']:>12.3f} us  (±{result['stdev']:.3f}, n={result['number']}){size}")
+    finally:
+        loop.close()
+        fixture.close()
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "database": fixture.dialect,
+            "boards": args.boards,
+            "posts": args.posts,
+        },
+        "benchmarks": results,
+    }
+
+
+def _resolve_path(value: str) -> Path:
+    """경로 또는 bench/baselines/ 아래 기준값 이름"""
+    path = Path(value)
+    if path.suffix != ".json":
+        path = BASELINE_DIR / f"{value}.json"
+    return path
+
+
+def _load_result(value: str) -> Dict[str, Any]:
+    """결과/기준값 JSON 읽기 (없으면 저장 방법 안내 후 종료)"""
+    path = _resolve_path(value)
+    if not path.exists():
+        if path.parent == BASELINE_DIR:
+            hint = f"python -m bench.micro run --save {value}"
+        else:
+            hint = f"python -m bench.micro run --output {value}"
+        raise SystemExit(f"❌ 벤치마크 결과가 없습니다: {path}\n   먼저 `{hint}` 로 저장하세요")
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[Dict[str, Any]]:
+    """중앙값 기준 비교
+
+    변화율이 threshold 와 두 측정의 라운드 간 편차(노이즈) 중 큰 값을 넘으면 회귀/개선으로 표시합니다.
+    """
+    rows = []
+    for name, base in baseline["benchmarks"].items():
+        cur = current["benchmarks"].get(name)
+        if cur is None:
+            continue
+        change = (cur["median"] - base["median"]) / base["median"] if base["median"] else 0.0
+        noise = max(
+            (base["max"] - base["min"]) / base["median"] if base["median"] else 0.0,
+            (cur["max"] - cur["min"]) / cur["median"] if cur["median"] else 0.0,
+        )
+        limit = max(threshold, noise)
+        status = "regression" if change > limit else "improvement" if change < -limit else "ok"
+        rows.append({
+            "name": name,
+            "baseline_us": base["median"],
+            "current_us": cur["median"],
+            "change": round(change, 4),
+            "noise": round(noise, 4),
+            "status": status,
+        })
+    return rows
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Board API 마이크로 벤치마크")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="벤치마크 실행")
+    run_parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL,
+                            help="벤치마크 DB (테이블을 생성/삭제하므로 전용 DB 사용)")
+    run_parser.add_argument("--boards", type=int, default=2000)
+    run_parser.add_argument("--posts", type=int, default=2000)
+    run_parser.add_argument("--rounds", type=int, default=7)
+    run_parser.add_argument("--min-round-time", type=float, default=0.1, help="라운드당 최소 측정 시간 (초)")
+    run_parser.add_argument("--filter", help="이름에 포함된 벤치마크만 실행")
+    run_parser.add_argument("--save", metavar="NAME", help="bench/baselines/NAME.json 으로 저장")
+    run_parser.add_argument("--output", help="결과 JSON 경로")
+
+    compare_parser = commands.add_parser("compare", help="기준값과 비교")
+    compare_parser.add_argument("baseline", help="기준값 JSON 경로 또는 bench/baselines/ 아래 이름")
+    compare_parser.add_argument("current", help="비교할 JSON 경로 또는 이름")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="회귀로 볼 최소 변화율 (기본 10%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.command == "run":
+        print(f"🏁 마이크로 벤치마크 실행 ({args.database_url})")
+        result = run(args)
+        paths = [Path(args.output)] if args.output else []
+        if args.save:
+            BASELINE_DIR.mkdir(exist_ok=True)
+            paths.append(_resolve_path(args.save))
+        for path in paths:
+            path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+            print(f"💾 결과 저장: {path}")
+        return
+
+    baseline = _load_result(args.baseline)
+    current = _load_result(args.current)
+    rows = compare(baseline, current, args.threshold)
+    print(f"{'benchmark':<50}{'baseline':>12}{'current':>12}{'change':>10}{'noise':>9}  status")
+    for row in rows:
+        print(
+            f"{row['name']:<50}{row['baseline_us']:>12.3f}{row['current_us']:>12.3f}"
+            f"{row['change'] * 100:>9.1f}%{row['noise'] * 100:>8.1f}%  {row['status']}"
+        )
+    regressions = [row for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"❌ 회귀 {len(regressions)}건")
+        sys.exit(1)
+    print("✅ 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""
+캡처한 트래픽 재생기
+
+TrafficCaptureMiddleware 가 기록한 JSON Lines 를 읽어 원래 요청 간격(또는 --speed 배율)대로
+테스트 인스턴스에 다시 보냅니다. 캡처의 가명 인증 주체는 등장 순서대로 시드된 계정에 매핑하며,
+경로의 게시판/게시글 ID 는 각 계정이 조회할 수 있는 ID 로 일관되게 치환합니다
+(같은 원본 ID 는 항상 같은 ID 로 바뀌어 인기 게시판 쏠림이 유지됨, --keep-ids 로 원본 유지).
+지연시간은 load.py 와 같이 예정된 요청 시각부터 측정합니다.
+
+사용법:
+    python -m bench.replay --capture traffic.jsonl --from-db 50
+    python -m bench.replay --capture traffic.jsonl --users-file users.txt --speed 2 --output results/replay.json
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+import zlib
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from bench.load import (
+    API_PATH,
+    DEFAULT_PASSWORD,
+    Recorder,
+    UserSession,
+    _load_users_file,
+    _load_users_from_db,
+    _remember,
+    _signup_users,
+    format_report,
+    login_users,
+)
+
+INVALID_PRINCIPAL = "invalid"
+# ID 치환 대상 경로 파라미터 -> 계정별 ID 풀 이름
+ID_POOLS = {"board_id": "boards", "post_id": "posts"}
+# 계정별 ID 수집 시 게시글 목록을 조회할 게시판 수
+_PRIME_BOARDS = 5
+
+
+def load_capture(path: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """캡처 파일 로드 (시각순 정렬)"""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                records.append(json.loads(line))
+    records.sort(key=lambda record: record["ts"])
+    return records[:limit] if limit else records
+
+
+def synthesize(shape: Any) -> Any:
+    """본문 형태 -> 같은 형태의 합성 값"""
+    if isinstance(shape, dict):
+        if "list" in shape and "item" in shape:
+            return [synthesize(shape["item"]) for _ in range(shape["list"])]
+        return {key: synthesize(value) for key, value in shape.items()}
+    if isinstance(shape, str):
+        kind, _, length = shape.partition(":")
+        if kind == "str":
+            return ("replay " * (int(length) // 7 + 1))[:int(length)]
+        return {"bool": True, "int": 1, "float": 1.0}.get(kind)
+    return None
+
+
+def _stable_index(key: str, size: int) -> int:
+    return zlib.crc32(key.encode()) % size
+
+
+class Replay:
+    """캡처 레코드를 원래 간격대로 재생"""
+
+    def __init__(self, client: httpx.AsyncClient, users: List[UserSession], passwords: Dict[str, str], args: argparse.Namespace):
+        self.client = client
+        self.users = users
+        self.passwords = passwords
+        self.args = args
+        self.recorder = Recorder()
+        self.principals: Dict[Optional[str], UserSession] = {}
+        # (계정, 라우트, 경로 파라미터, 정렬) -> 마지막으로 받은 next_page 커서
+        self.cursors: Dict[tuple, str] = {}
+        self.login_users: List[UserSession] = []
+        self.logins = 0
+        self.unmapped = 0
+
+    def user_for(self, principal: str) -> UserSession:
+        """가명 인증 주체 -> 계정 (등장 순서대로 라운드 로빈)"""
+        if principal not in self.principals:
+            self.principals[principal] = self.users[len(self.principals) % len(self.users)]
+        return self.principals[principal]
+
+    def map_path_params(self, record: Dict[str, Any], user: UserSession) -> Optional[Dict[str, Any]]:
+        params = dict(record["path_params"])
+        if self.args.keep_ids:
+            return params
+        for name, value in params.items():
+            pool_name = ID_POOLS.get(name)
+            if pool_name is None:
+                continue
+            pool = getattr(user, pool_name)
+            # 수정/삭제는 재생 중 해당 계정이 만든 게시글을 우선 사용 (권한 오류 방지)
+            if pool_name == "posts" and record["method"] in ("PUT", "DELETE") and user.created_posts:
+                pool = user.created_posts
+            if not pool:
+                return None
+            params[name] = pool[_stable_index(f"{name}:{value}", len(pool))]
+        return params
+
+    async def login(self, user: UserSession) -> None:
+        response = await self.client.post(
+            f"{API_PATH}/auth/login", json={"email": user.email, "password": self.passwords[user.email]}
+        )
+        if response.status_code == 200:
+            user.token = response.json()["access_token"]
+
+    def assign_principals(self, records: List[Dict[str, Any]]) -> None:
+        """인증 주체를 등장 순서대로 계정에 매핑하고, 남는 계정은 로그인 재생용으로 사용
+
+        로그인하면 기존 세션이 교체되므로 다른 주체의 요청에 쓰이는 계정으로는 로그인을 재생하지 않습니다.
+        """
+        for record in records:
+            if record["principal"] not in (None, INVALID_PRINCIPAL):
+                self.user_for(record["principal"])
+        self.login_users = self.users[len(self.principals):]
+
+    def account_for(self, record: Dict[str, Any]) -> Optional[UserSession]:
+        """요청을 보낼 계정 (로그인은 인증 주체가 없으므로 로그인용 계정을 돌아가며 사용)"""
+        if record["route"].endswith("/auth/login"):
+            if not self.login_users:
+                return None
+            self.logins += 1
+            return self.login_users[self.logins % len(self.login_users)]
+        if record["principal"] in (None, INVALID_PRINCIPAL):
+            return None
+        return self.user_for(record["principal"])
+
+    def build(self, record: Dict[str, Any], user: Optional[UserSession]) -> Optional[Dict[str, Any]]:
+        """레코드 -> httpx 요청 인자 (재생할 수 없으면 None)"""
+        path_params = self.map_path_params(record, user) if user else dict(record["path_params"])
+        if path_params is None:
+            return None
+        route = record["route"]
+
+        # 가려진 값(<...>)은 버리고, 커서는 같은 목록을 앞서 조회하며 받은 next_page 사용
+        params = {key: value for key, value in record["query"].items() if not value.startswith("<")}
+        cursor_key = None
+        if record["method"] == "GET" and user is not None:
+            cursor_key = (user.email, route, tuple(sorted(path_params.items())), params.get("sort"))
+            if "cursor" in record["query"] and cursor_key in self.cursors:
+                params["cursor"] = self.cursors[cursor_key]
+
+        body = record.get("body") or {}
+        json_body = synthesize(body["json"]) if "json" in body else None
+        if route.endswith("/auth/login"):
+            json_body = {"email": user.email, "password": self.passwords[user.email]}
+        elif route.endswith("/auth/signup"):
+            email = f"replay_{uuid.uuid4().hex[:12]}@example.com"
+            json_body = {"email": email, "password": DEFAULT_PASSWORD, "fullname": "replay"}
+
+        headers = {}
+        if record["principal"] == INVALID_PRINCIPAL:
+            headers["Authorization"] = "Bearer invalid"
+        elif record["principal"] is not None:
+            headers = user.headers
+        return {
+            "method": record["method"],
+            "url": route.format(**path_params),
+            "params": params,
+            "json": json_body,
+            "headers": headers,
+            "cursor_key": cursor_key,
+        }
+
+    async def send(self, record: Dict[str, Any], started: float) -> None:
+        user = self.account_for(record)
+        if user is None and record["route"].endswith("/auth/login"):
+            self.unmapped += 1
+            return
+        request = self.build(record, user)
+        if request is None:
+            self.unmapped += 1
+            return
+
+        endpoint = f"{record['method']} {record['route'].removeprefix(API_PATH)}"
+        cursor_key = request.pop("cursor_key")
+        loop = asyncio.get_running_loop()
+        try:
+            response = await self.client.request(**request)
+            status, error = str(response.status_code), response.status_code >= 400
+        except httpx.HTTPError as e:
+            response, status, error = None, type(e).__name__, True
+        self.recorder.record(endpoint, (loop.time() - started) * 1000, status, error)
+        if response is not None and not error and user is not None:
+            await self.after_response(record, user, response, cursor_key)
+
+    async def after_response(self, record: Dict[str, Any], user: UserSession, response: httpx.Response, cursor_key) -> None:
+        """응답으로 계정 상태 갱신 (토큰, 생성된 게시글, 다음 페이지 커서)"""
+        route, method = record["route"], record["method"]
+        if route.endswith("/auth/login"):
+            user.token = response.json()["access_token"]
+        elif route.endswith("/auth/logout"):
+            # 세션이 삭제되므로 같은 계정의 이후 요청을 위해 다시 로그인 (측정하지 않음)
+            await self.login(user)
+        elif method == "POST" and route.endswith("/posts"):
+            user.created_posts.append(response.json()["id"])
+        elif method == "DELETE" and route.endswith("/posts/{post_id}"):
+            post_id = int(response.request.url.path.rsplit("/", 1)[-1])
+            if post_id in user.created_posts:
+                user.created_posts.remove(post_id)
+        elif cursor_key is not None and route.endswith(("/boards/", "/posts")):
+            next_page = response.json().get("next_page")
+            if next_page:
+                self.cursors[cursor_key] = next_page
+
+    async def prime(self) -> None:
+        """계정별로 접근 가능한 게시판/게시글 ID 수집 (기록하지 않음)"""
+        async def prime_user(user: UserSession) -> None:
+            response = await self.client.get(f"{API_PATH}/boards/", params={"size": 100}, headers=user.headers)
+            if response.status_code != 200:
+                return
+            _remember(user.boards, [item["id"] for item in response.json()["items"]])
+            for board_id in user.boards[:_PRIME_BOARDS]:
+                response = await self.client.get(
+                    f"{API_PATH}/boards/{board_id}/posts", params={"size": 100}, headers=user.headers
+                )
+                if response.status_code == 200:
+                    _remember(user.posts, [item["id"] for item in response.json()["items"]])
+
+        await asyncio.gather(*(prime_user(user) for user in self.users))
+
+    async def run(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        in_flight: set = set()
+        self.assign_principals(records)
+        origin = records[0]["ts"]
+        start = loop.time()
+        for record in records:
+            scheduled = start + (record["ts"] - origin) / self.args.speed
+            delay = scheduled - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(in_flight) >= self.args.max_in_flight:
+                self.recorder.dropped += 1
+                continue
+            task = asyncio.create_task(self.send(record, scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        duration = max(loop.time() - start, 1e-9)
+
+        captured_span = max(records[-1]["ts"] - origin, 1e-9)
+        config = {
+            "base_url": self.args.base_url,
+            "capture": self.args.capture,
+            "records": len(records),
+            "speed": self.args.speed,
+            "rps": round(len(records) / captured_span * self.args.speed, 2),
+            "principals": len(self.principals),
+            "users": len(self.users),
+            "keep_ids": self.args.keep_ids,
+            "unmapped": self.unmapped,
+        }
+        return self.recorder.report(duration, config)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="캡처한 트래픽 재생")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--capture", required=True, help="TrafficCaptureMiddleware 가 기록한 JSON Lines 파일")
+    users = parser.add_mutually_exclusive_group(required=True)
+    users.add_argument("--users-file", help="인증 주체를 매핑할 사용자 목록 파일 (email 또는 email:password)")
+    users.add_argument("--from-db", type=int, metavar="N", help="DB에서 시드된 사용자 N명 사용")
+    users.add_argument("--signup", type=int, metavar="N", help="재생용 사용자 N명 가입 후 사용")
+    parser.add_argument("--speed", type=float, default=1.0, help="재생 속도 배율 (2 = 원래 간격의 절반)")
+    parser.add_argument("--limit", type=int, help="앞에서부터 재생할 최대 레코드 수")
+    parser.add_argument("--keep-ids", action="store_true", help="경로의 게시판/게시글 ID 를 치환하지 않음 (운영 스냅샷 복원 DB 용)")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="클라이언트 측 최대 동시 요청 수")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--output", help="JSON 결과 파일 경로")
+    return parser.parse_args(argv)
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    records = load_capture(args.capture, args.limit)
+    if not records:
+        raise SystemExit("❌ 재생할 레코드가 없습니다")
+
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        if args.users_file:
+            credentials = _load_users_file(args.users_file)
+        elif args.from_db:
+            credentials = _load_users_from_db(args.from_db)
+        else:
+            credentials = await _signup_users(client, args.signup)
+
+        print(f"👤 {len(credentials)}명 로그인 중...")
+        users = await login_users(client, credentials)
+        if not users:
+            raise SystemExit("❌ 로그인한 사용자가 없습니다")
+        principals = {record["principal"] for record in records} - {None, INVALID_PRINCIPAL}
+        if len(principals) >= len(users):
+            print(
+                f"⚠️  인증 주체 {len(principals)}명을 계정 {len(users)}개에 나눠 매핑하며, "
+                f"로그인 재생용 계정이 없어 로그인 요청은 건너뜁니다",
+                file=sys.stderr,
+            )
+
+        replay = Replay(client, users, dict(credentials), args)
+        await replay.prime()
+        span = records[-1]["ts"] - records[0]["ts"]
+        print(f"🔁 {len(records)}건 재생 (원본 {span:.1f}s, 배율 {args.speed}x)...")
+        started = time.perf_counter()
+        report = await replay.run(records)
+        print(f"⏱  완료 ({time.perf_counter() - started:.1f}s)")
+        return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = parse_args(argv)
+    report = asyncio.run(main_async(args))
+    print(format_report(report))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+벤치마크 공통 통계 유틸리티
+"""
+import math
+from typing import Dict, Iterable, List
+
+# 보고서에 포함할 백분위수
+PERCENTILES = {"p50": 50.0, "p95": 95.0, "p99": 99.0, "p99.9": 99.9}
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """nearest-rank 방식 백분위수 (정렬된 값 기준)"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def summarize_latencies(values: Iterable[float]) -> Dict[str, float]:
+    """지연시간(ms) 요약: 평균/최소/최대와 p50/p95/p99/p99.9"""
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0}
+    summary = {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), 3),
+        "min": round(ordered[0], 3),
+        "max": round(ordered[-1], 3),
+    }
+    for name, pct in PERCENTILES.items():
+        summary[name] = round(percentile(ordered, pct), 3)
+    return summary
@@ -0,0 +1,45 @@
+"""add_post_excerpt
+
+Revision ID: 04e942466f74
+Revises: 3050c1f1b9a0
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '04e942466f74'
+down_revision: Union[str, Sequence[str], None] = '3050c1f1b9a0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add posts.excerpt (목록 응답용 본문 요약) and backfill it from content."""
+
+    op.add_column(
+        'posts',
+        sa.Column('excerpt', sa.String(length=200), server_default='', nullable=False)
+    )
+
+    # app.models.post.make_excerpt 와 같은 규칙: 공백 정리 후 200자, 잘리면 199자 + 말줄임표
+    op.execute("""
+        UPDATE posts
+        SET excerpt = CASE
+            WHEN char_length(normalized.text) <= 200 THEN normalized.text
+            ELSE left(normalized.text, 199) || '…'
+        END
+        FROM (
+            SELECT id, btrim(regexp_replace(content, '\\s+', ' ', 'g')) AS text FROM posts
+        ) AS normalized
+        WHERE posts.id = normalized.id
+    """)
+
+
+def downgrade() -> None:
+    """Drop posts.excerpt."""
+    op.drop_column('posts', 'excerpt')
@@ -0,0 +1,54 @@
+"""add_post_tombstones_and_updated_at_index
+
+Revision ID: 7c1e5a9d3b20
+Revises: 04e942466f74
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1e5a9d3b20'
+down_revision: Union[str, Sequence[str], None] = '04e942466f74'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add post_tombstones and posts (board_id, updated_at) index for delta sync."""
+
+    # 게시판별 updated_at 이후 변경된 게시글 조회용
+    op.create_index(
+        'ix_posts_board_id_updated_at',
+        'posts',
+        ['board_id', 'updated_at'],
+        unique=False
+    )
+
+    # 삭제된 게시글 기록 (변경분 동기화에서 삭제 반영용)
+    op.create_table(
+        'post_tombstones',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('post_id', sa.Integer(), nullable=False),
+        sa.Column('board_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['board_id'], ['boards.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_post_tombstones_board_id_deleted_at',
+        'post_tombstones',
+        ['board_id', 'deleted_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Drop post_tombstones and posts (board_id, updated_at) index."""
+    op.drop_index('ix_post_tombstones_board_id_deleted_at', table_name='post_tombstones')
+    op.drop_table('post_tombstones')
+    op.drop_index('ix_posts_board_id_updated_at', table_name='posts')
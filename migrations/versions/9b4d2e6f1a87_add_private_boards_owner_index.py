@@ -0,0 +1,36 @@
+"""add_private_boards_owner_index
+
+Revision ID: 9b4d2e6f1a87
+Revises: 7c1e5a9d3b20
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4d2e6f1a87'
+down_revision: Union[str, Sequence[str], None] = '7c1e5a9d3b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add partial owner_id index for private boards."""
+
+    # 게시판 목록: 공개 게시판은 캐시에서, 사용자 비공개 게시판만 DB 에서 조회
+    op.create_index(
+        'ix_boards_owner_id_private',
+        'boards',
+        ['owner_id'],
+        unique=False,
+        postgresql_where=sa.text('NOT public')
+    )
+
+
+def downgrade() -> None:
+    """Drop partial owner_id index for private boards."""
+    op.drop_index('ix_boards_owner_id_private', table_name='boards')
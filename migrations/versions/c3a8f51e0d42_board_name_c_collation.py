@@ -0,0 +1,47 @@
+"""board_name_c_collation
+
+Revision ID: c3a8f51e0d42
+Revises: 9b4d2e6f1a87
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a8f51e0d42'
+down_revision: Union[str, Sequence[str], None] = '9b4d2e6f1a87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Sort board names by code point (COLLATE "C")."""
+
+    # 게시판 목록 이름순: DB 정렬/keyset 조건과 공개 게시판 캐시 병합(Python 문자열 비교)의 순서를 맞춤
+    # (ix_boards_name 은 컬럼 collation 으로 다시 만들어짐, SQLite 는 기본이 코드 포인트 순서)
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column(
+        'boards',
+        'name',
+        existing_type=sa.String(length=120),
+        type_=sa.String(length=120, collation='C'),
+        existing_nullable=False
+    )
+
+
+def downgrade() -> None:
+    """Restore the database default collation for board names."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.alter_column(
+        'boards',
+        'name',
+        existing_type=sa.String(length=120, collation='C'),
+        type_=sa.String(length=120),
+        existing_nullable=False
+    )
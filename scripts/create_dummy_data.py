@@ -1,31 +1,91 @@
 """
 더미 데이터 생성 스크립트
 """
+import argparse
 import asyncio
+import csv
+import io
+import multiprocessing
 import random
 import sys
 import os
-import uuid
-from datetime import datetime, timedelta
+import time
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
+from sqlalchemy import create_engine, insert, text
 from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
 from faker import Faker
 
+from app.core.config import settings
 from app.db.session import SessionLocal
 from app.core.security import get_password_hash
 from app.models import User, Board, Post
+from app.models.post import make_excerpt
+from distributions import Distributions, build_content, gini, top_share
 
 
 # 한국어 locale 사용
 fake = Faker('ko_KR')
 
+# 더미 데이터 공통 비밀번호
+DEFAULT_PASSWORD = "qwer1234"
+# 기본 게시판 카테고리 후보
+BOARD_CATEGORIES = [
+    "자유게시판", "질문답변", "공지사항", "개발이야기",
+    "취업정보", "스터디모집", "프로젝트 공유", "기술토론",
+    "일상잡담", "맛집추천", "여행후기", "독서모임",
+    "운동모임", "게임이야기", "영화리뷰", "음악감상",
+    "취미생활", "사진공유", "애완동물", "기타",
+    "연애상담", "자유", "질문", "공지", "개발",
+    "일상", "맛집", "여행", "독서", "운동", "게임"
+]
+# 다양한 게시글 제목 템플릿
+TITLE_TEMPLATES = [
+    "{}에 대해 질문이 있습니다.",
+    "{} 어떻게 생각하세요?",
+    "{} 관련 정보 공유합니다.",
+    "{} 후기 공유해요!",
+    "{}를 추천합니다.",
+    "{} 문제 해결 방법",
+    "{} 경험담을 나눕니다.",
+    "{}에 대한 의견을 듣고 싶어요.",
+    "{} 관련 팁 공유!",
+    "{}를 시작하려는데 조언 부탁드려요."
+]
+# 주제별 키워드
+TOPICS = [
+    "Python 프로그래밍", "웹 개발", "데이터베이스 설계", "API 개발",
+    "프론트엔드 개발", "백엔드 개발", "클라우드 서비스", "DevOps",
+    "머신러닝", "인공지능", "알고리즘", "자료구조",
+    "취업 준비", "면접 경험", "포트폴리오 제작", "이력서 작성",
+    "독서 경험", "영화 감상", "여행 후기", "맛집 추천",
+    "운동 루틴", "다이어트 방법", "건강 관리", "스트레스 해소"
+]
+
+
+def sync_posts_count(db: Session) -> None:
+    """boards.posts_count 를 실제 게시글 수로 맞춤 (게시판별 COUNT 대신 집계 쿼리 한 번)"""
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(text("""
+            UPDATE boards SET posts_count = counts.cnt
+            FROM (SELECT board_id, count(*) AS cnt FROM posts GROUP BY board_id) AS counts
+            WHERE boards.id = counts.board_id AND boards.posts_count <> counts.cnt
+        """))
+    else:
+        db.execute(text(
+            "UPDATE boards SET posts_count = (SELECT count(*) FROM posts WHERE posts.board_id = boards.id)"
+        ))
+    db.commit()
+
 
 class DummyDataGenerator:
     """더미 데이터 생성기"""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, distributions: Distributions):
         self.db = db
+        self.distributions = distributions
         self.users = []
         self.boards = []
         self.posts = []
@@ -35,6 +95,8 @@ class DummyDataGenerator:
         print(f"📝 {count}명의 사용자 생성 중...")
         users = []
         base_domains = ['gmail.com', 'naver.com', 'kakao.com']
+        # bcrypt 해싱은 느리므로 공통 비밀번호는 한 번만 해싱
+        hashed_password = get_password_hash(DEFAULT_PASSWORD)
         for i in range(count):
             fullname = fake.name()
             # 이메일 중복 방지
@@ -45,7 +107,7 @@ class DummyDataGenerator:
             user = User(
                 fullname=fullname,
                 email=email,
-                password=get_password_hash("qwer1234")
+                password=hashed_password
             )
             # 생성일을 다양하게 설정 (최근 6개월 내)
             if i > 0:  # 첫 번째 사용자는 현재 시간
@@ -81,29 +143,20 @@ class DummyDataGenerator:
         existing_names = {name[0] for name in self.db.query(Board.name).all()}
         used_names = set(existing_names)  # 기존 + 신규 이름 모두 관리
         
-        # 기본 카테고리 후보
-        board_categories = [
-            "자유게시판", "질문답변", "공지사항", "개발이야기",
-            "취업정보", "스터디모집", "프로젝트 공유", "기술토론",
-            "일상잡담", "맛집추천", "여행후기", "독서모임",
-            "운동모임", "게임이야기", "영화리뷰", "음악감상",
-            "취미생활", "사진공유", "애완동물", "기타",
-            "연애상담", "자유", "질문", "공지", "개발",
-            "일상", "맛집", "여행", "독서", "운동", "게임"
-        ]
-        
         attempts = 0
         max_attempts = count * 10  # 무한루프 방지
+        # 게시판 소유자도 작성자 활동량 분포를 따름
+        owner_sampler = self.distributions.author_sampler(len(self.users))
         
         while len(boards) < count and attempts < max_attempts:
             attempts += 1
-            base_name = random.choice(board_categories)
+            base_name = random.choice(BOARD_CATEGORIES)
             
             # 유니크한 이름 생성 (UUID 뒷자리 사용으로 완전 유니크 보장)
             if random.random() < 0.3:  # 30% 확률로 Faker 단어 추가
                 candidate = f"{fake.word().capitalize()} {base_name}"
             else:  # 70% 확률로 UUID 일부 추가 (완전 유니크)
-                uuid_suffix = str(uuid.uuid4())[:8]
+                uuid_suffix = f"{random.getrandbits(32):08x}"
                 candidate = f"{base_name}_{uuid_suffix}"
             
             # 중복 체크
@@ -111,7 +164,7 @@ class DummyDataGenerator:
                 continue
                 
             used_names.add(candidate)
-            owner = random.choice(self.users)
+            owner = self.users[owner_sampler.index(random)]
             public = random.random() < 0.8
             
             board = Board(
@@ -157,42 +210,21 @@ class DummyDataGenerator:
         if not self.users or not self.boards:
             raise ValueError("먼저 사용자와 게시판을 생성해야 합니다.")
         posts = []
-        # 다양한 게시글 제목 템플릿
-        title_templates = [
-            "{}에 대해 질문이 있습니다.",
-            "{} 어떻게 생각하세요?",
-            "{} 관련 정보 공유합니다.",
-            "{} 후기 공유해요!",
-            "{}를 추천합니다.",
-            "{} 문제 해결 방법",
-            "{} 경험담을 나눕니다.",
-            "{}에 대한 의견을 듣고 싶어요.",
-            "{} 관련 팁 공유!",
-            "{}를 시작하려는데 조언 부탁드려요."
-        ]
-        # 주제별 키워드
-        topics = [
-            "Python 프로그래밍", "웹 개발", "데이터베이스 설계", "API 개발",
-            "프론트엔드 개발", "백엔드 개발", "클라우드 서비스", "DevOps",
-            "머신러닝", "인공지능", "알고리즘", "자료구조",
-            "취업 준비", "면접 경험", "포트폴리오 제작", "이력서 작성",
-            "독서 경험", "영화 감상", "여행 후기", "맛집 추천",
-            "운동 루틴", "다이어트 방법", "건강 관리", "스트레스 해소"
-        ]
+        board_sampler = self.distributions.board_sampler(len(self.boards))
+        author_sampler = self.distributions.author_sampler(len(self.users))
+        time_sampler = self.distributions.time_sampler()
+        length_sampler = self.distributions.length_sampler()
+        sentences = [fake.sentence() for _ in range(200)]
         for i in range(count):
-            # 랜덤한 게시판과 사용자 선택
-            board = random.choice(self.boards)
-            author = random.choice(self.users)
+            # 분포에 따라 게시판과 사용자 선택 (소수 게시판/작성자에 집중)
+            board = self.boards[board_sampler.index(random)]
+            author = self.users[author_sampler.index(random)]
             # 제목 생성
-            topic = random.choice(topics)
-            title_template = random.choice(title_templates)
+            topic = random.choice(TOPICS)
+            title_template = random.choice(TITLE_TEMPLATES)
             title = title_template.format(topic)
-            # 내용 생성 (1-5 문단)
-            paragraph_count = random.randint(1, 5)
-            content_paragraphs = []
-            for _ in range(paragraph_count):
-                content_paragraphs.append(fake.text(max_nb_chars=200))
-            content = "\n\n".join(content_paragraphs)
+            # 내용 생성 (길이 분포에 맞춰 문장 조합)
+            content = build_content(random, sentences, length_sampler.sample(random))
             post = Post(
                 title=title,
                 content=content,
@@ -210,12 +242,8 @@ class DummyDataGenerator:
             try:
                 max_days = (now - board_created).days
                 if max_days > 0:
-                    created_days_after = random.randint(0, max_days)
-                    post.created_at = board_created + timedelta(
-                        days=created_days_after,
-                        hours=random.randint(0, 23),
-                        minutes=random.randint(0, 59)
-                    )
+                    # 작성 시각은 시간대별 활동량 분포를 따름
+                    post.created_at = time_sampler.sample(random, board_created, now)
                     post.updated_at = post.created_at
                     # 10% 확률로 수정됨
                     if random.random() < 0.1:
@@ -240,10 +268,9 @@ class DummyDataGenerator:
     def update_board_post_counts(self):
         """게시판별 게시글 수 업데이트 (트리거가 있다면 자동으로 되지만 확실히 하기 위해)"""
         print("🔄 게시판별 게시글 수 업데이트 중...")
+        sync_posts_count(self.db)
         for board in self.boards:
-            post_count = self.db.query(Post).filter(Post.board_id == board.id).count()
-            board.posts_count = post_count
-        self.db.commit()
+            self.db.refresh(board)
         print("✅ 게시판 게시글 수 업데이트 완료")
     
     def print_summary(self):
@@ -266,25 +293,261 @@ class DummyDataGenerator:
             user_posts = [p for p in self.posts if p.owner_id == user.id]
             print(f"  • {user.fullname} ({user.email})")
             print(f"    - 게시판: {len(user_boards)}개, 게시글: {len(user_posts)}개")
+        print_distribution_summary(self.db)
+        print("\n" + "="*50)
+
+
+# 대량 생성 모드 (--bulk)
+# 게시글은 여러 프로세스에서 청크 단위로 생성해 각자 COPY(PostgreSQL) 또는 executemany 로 적재
+
+POST_COPY_SQL = (
+    "COPY posts (board_id, owner_id, title, content, excerpt, created_at, updated_at) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
+# 워커 프로세스 전역 상태 (initializer 에서 한 번만 전달)
+_worker = {}
+
+
+def _init_post_worker(
+    database_url: str, board_ids: list, board_created: list, user_ids: list, distributions: Distributions
+):
+    _worker["engine"] = create_engine(database_url, poolclass=NullPool)
+    _worker["board_ids"] = board_ids
+    _worker["board_created"] = board_created
+    _worker["user_ids"] = user_ids
+    # 샘플러는 시드로 만들어지므로 모든 워커에서 동일
+    _worker["board_sampler"] = distributions.board_sampler(len(board_ids))
+    _worker["author_sampler"] = distributions.author_sampler(len(user_ids))
+    _worker["time_sampler"] = distributions.time_sampler()
+    _worker["length_sampler"] = distributions.length_sampler()
+    # Faker 문장 생성은 느리므로 워커마다 문장 풀을 만들어 조합
+    worker_fake = Faker('ko_KR')
+    worker_fake.seed_instance(distributions.seed)
+    _worker["sentences"] = [worker_fake.sentence() for _ in range(500)]
+
+
+def _generate_post_rows(chunk_index: int, count: int, seed: int, now: datetime) -> list:
+    """청크 하나의 게시글 행 생성 (청크별 시드로 워커 수와 무관하게 재현 가능)"""
+    rng = random.Random(seed * 1_000_003 + chunk_index)
+    board_ids, board_created = _worker["board_ids"], _worker["board_created"]
+    user_ids, sentences = _worker["user_ids"], _worker["sentences"]
+    board_sampler, author_sampler = _worker["board_sampler"], _worker["author_sampler"]
+    time_sampler, length_sampler = _worker["time_sampler"], _worker["length_sampler"]
+    rows = []
+    for _ in range(count):
+        board_index = board_sampler.index(rng)
+        title = rng.choice(TITLE_TEMPLATES).format(rng.choice(TOPICS))
+        content = build_content(rng, sentences, length_sampler.sample(rng))
+        created_at = time_sampler.sample(rng, board_created[board_index], now)
+        author_id = user_ids[author_sampler.index(rng)]
+        rows.append((board_ids[board_index], author_id, title, content, make_excerpt(content), created_at, created_at))
+    return rows
+
+
+def _insert_post_chunk(task: tuple) -> int:
+    chunk_index, count, seed, now = task
+    rows = _generate_post_rows(chunk_index, count, seed, now)
+    engine = _worker["engine"]
+    if engine.dialect.name == "postgresql":
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+        raw = engine.raw_connection()
+        try:
+            with raw.cursor() as cursor:
+                # 시드 데이터는 유실돼도 다시 생성하면 되므로 커밋 대기를 생략
+                cursor.execute("SET synchronous_commit = off")
+                cursor.copy_expert(POST_COPY_SQL, buffer)
+            raw.commit()
+        finally:
+            raw.close()
+    else:
+        keys = ("board_id", "owner_id", "title", "content", "excerpt", "created_at", "updated_at")
+        with engine.begin() as conn:
+            conn.execute(insert(Post), [dict(zip(keys, row)) for row in rows])
+    return count
+
+
+class BulkDataGenerator:
+    """대량 더미 데이터 생성기
+
+    사용자/게시판은 청크 단위 executemany + RETURNING, 게시글은 멀티프로세스 COPY 로 적재하고
+    posts_count 는 마지막에 집계 쿼리 한 번으로 맞춥니다.
+    """
+
+    def __init__(self, db: Session, distributions: Distributions, workers: int, chunk_size: int):
+        self.db = db
+        self.distributions = distributions
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.seed = distributions.seed
+        self.rng = random.Random(self.seed)
+        self.now = datetime.now(timezone.utc)
+        self.user_ids: list[int] = []
+        self.board_ids: list[int] = []
+        self.board_created: list[datetime] = []
+        self.post_count = 0
+
+    def _insert_returning(self, model, rows: list[dict], *columns) -> list:
+        result = []
+        for start in range(0, len(rows), self.chunk_size):
+            chunk = rows[start:start + self.chunk_size]
+            stmt = insert(model).returning(*columns, sort_by_parameter_order=True)
+            result.extend(self.db.execute(stmt, chunk).all())
+        self.db.commit()
+        return result
+
+    def create_users(self, count: int) -> None:
+        print(f"📝 {count}명의 사용자 생성 중...")
+        hashed_password = get_password_hash(DEFAULT_PASSWORD)
+        fake.seed_instance(self.seed)
+        run_id = f"{self.rng.getrandbits(32):08x}"
+        base_domains = ['gmail.com', 'naver.com', 'kakao.com']
+        rows = []
+        for i in range(count):
+            created_at = self.now - timedelta(days=self.rng.uniform(0, 180))
+            rows.append({
+                "fullname": fake.name(),
+                "email": f"user{i}_{run_id}@{self.rng.choice(base_domains)}",
+                "password": hashed_password,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+        self.user_ids = [row.id for row in self._insert_returning(User, rows, User.id)]
+        self.user_created = {row_id: row["created_at"] for row_id, row in zip(self.user_ids, rows)}
+        print(f"✅ {len(self.user_ids)}명의 사용자 생성 완료")
+
+    def create_boards(self, count: int) -> None:
+        print(f"📋 {count}개의 게시판 생성 중...")
+        run_id = f"{self.rng.getrandbits(32):08x}"
+        owner_sampler = self.distributions.author_sampler(len(self.user_ids))
+        rows = []
+        for i in range(count):
+            owner_id = self.user_ids[owner_sampler.index(self.rng)]
+            owner_created = self.user_created[owner_id]
+            created_at = owner_created + (self.now - owner_created) * self.rng.random()
+            rows.append({
+                "name": f"{self.rng.choice(BOARD_CATEGORIES)}_{run_id}_{i}",
+                "public": self.rng.random() < 0.8,
+                "owner_id": owner_id,
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+        self.board_ids = [row.id for row in self._insert_returning(Board, rows, Board.id)]
+        self.board_created = [row["created_at"] for row in rows]
+        print(f"✅ {len(self.board_ids)}개의 게시판 생성 완료")
+
+    def create_posts(self, count: int) -> None:
+        print(f"📝 {count}개의 게시글 생성 중 (워커 {self.workers}개, 청크 {self.chunk_size}개)...")
+        tasks = [
+            (index, min(self.chunk_size, count - start), self.seed, self.now)
+            for index, start in enumerate(range(0, count, self.chunk_size))
+        ]
+        initargs = (settings.DATABASE_URL, self.board_ids, self.board_created, self.user_ids, self.distributions)
+        started = time.perf_counter()
+        if self.workers <= 1:
+            _init_post_worker(*initargs)
+            results = map(_insert_post_chunk, tasks)
+            self._collect(results, count, started)
+        else:
+            with multiprocessing.get_context("spawn").Pool(
+                self.workers, initializer=_init_post_worker, initargs=initargs
+            ) as pool:
+                self._collect(pool.imap_unordered(_insert_post_chunk, tasks), count, started)
+        print(f"✅ {self.post_count}개의 게시글 생성 완료 ({time.perf_counter() - started:.1f}s)")
+
+    def _collect(self, results, total: int, started: float) -> None:
+        for inserted in results:
+            self.post_count += inserted
+            elapsed = time.perf_counter() - started
+            print(f"  … {self.post_count}/{total} ({self.post_count / max(elapsed, 1e-9):,.0f} rows/s)")
+
+    def update_board_post_counts(self) -> None:
+        print("🔄 게시판별 게시글 수 업데이트 중...")
+        sync_posts_count(self.db)
+        print("✅ 게시판 게시글 수 업데이트 완료")
+
+    def print_summary(self) -> None:
         print("\n" + "="*50)
+        print("📊 대량 더미 데이터 생성 완료!")
+        print("="*50)
+        print(f"👤 사용자: {len(self.user_ids)}명")
+        print(f"📋 게시판: {len(self.board_ids)}개")
+        print(f"📝 게시글: {self.post_count}개")
+        print(f"🔑 비밀번호: {DEFAULT_PASSWORD}")
+        print_distribution_summary(self.db)
+        print("="*50)
+
+
+def print_distribution_summary(db: Session) -> None:
+    """생성된 데이터의 쏠림 정도 출력 (게시판별/작성자별 게시글 수, 시간대, 본문 길이)"""
+    board_counts = [row[0] for row in db.execute(text("SELECT posts_count FROM boards"))]
+    author_counts = [row[0] for row in db.execute(text("SELECT count(*) FROM posts GROUP BY owner_id"))]
+    lengths = db.execute(text("SELECT min(length(content)), avg(length(content)), max(length(content)) FROM posts")).one()
+    print("\n📈 분포 요약:")
+    if board_counts:
+        empty = sum(1 for value in board_counts if value == 0)
+        print(
+            f"  • 게시판: 상위 1% 가 게시글의 {top_share(board_counts, 0.01) * 100:.1f}%, "
+            f"빈 게시판 {empty / len(board_counts) * 100:.1f}%, gini {gini(board_counts):.2f}"
+        )
+    if author_counts:
+        print(
+            f"  • 작성자: 상위 10% 가 게시글의 {top_share(author_counts, 0.1) * 100:.1f}%, "
+            f"gini {gini(author_counts):.2f}"
+        )
+    if lengths[0] is not None:
+        print(f"  • 본문 길이: 최소 {lengths[0]}, 평균 {float(lengths[1]):.0f}, 최대 {lengths[2]}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="더미 데이터 생성")
+    parser.add_argument("users", nargs="?", type=int, default=10, help="사용자 수")
+    parser.add_argument("boards", nargs="?", type=int, default=100, help="게시판 수")
+    parser.add_argument("posts", nargs="?", type=int, default=1000, help="게시글 수")
+    parser.add_argument("--bulk", action="store_true", help="대량 생성 모드 (COPY/executemany, 멀티프로세스)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="게시글 생성 프로세스 수 (--bulk)")
+    parser.add_argument("--chunk-size", type=int, default=50_000, help="한 번에 적재할 행 수 (--bulk)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (같은 시드면 같은 데이터)")
+    # 분포 설정 (scripts/distributions.py 참고)
+    parser.add_argument("--board-dist", default="zipf:1.1", help="게시판 인기도 분포 (zipf:s | uniform)")
+    parser.add_argument("--author-dist", default="powerlaw:1.2",
+                        help="작성자 활동량 분포 (powerlaw:a | zipf:s | uniform)")
+    parser.add_argument("--time-dist", default="diurnal", help="작성 시각 분포 (diurnal | uniform)")
+    parser.add_argument("--length-dist", default="lognormal:6.2,0.9",
+                        help="본문 길이(문자 수) 분포 (lognormal:mu,sigma | uniform:min,max)")
+    return parser.parse_args()
 
 
 def main():
     """메인 함수"""
     print("🚀 더미 데이터 생성을 시작합니다...")
-    # 명령행 인수로 개수 조정 가능
-    user_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
-    board_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
-    post_count = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    args = parse_args()
+    user_count, board_count, post_count = args.users, args.boards, args.posts
+    distributions = Distributions(
+        board=args.board_dist, author=args.author_dist, time=args.time_dist,
+        length=args.length_dist, seed=args.seed,
+    )
+    random.seed(args.seed)
+    fake.seed_instance(args.seed)
 
     print(f"📋 생성할 데이터: 사용자 {user_count}명, 게시판 {board_count}개, 게시글 {post_count}개")
+    print(f"🎲 분포: {distributions.describe()}")
     
     # 데이터베이스 연결
     db = SessionLocal()
     
     try:
         # 더미 데이터 생성기 초기화
-        generator = DummyDataGenerator(db)
+        if args.bulk:
+            workers = args.workers
+            if db.get_bind().dialect.name == "sqlite":
+                # SQLite 는 동시 쓰기가 불가능하므로 단일 프로세스로 적재
+                workers = 1
+            generator = BulkDataGenerator(db, distributions, workers, args.chunk_size)
+        else:
+            generator = DummyDataGenerator(db, distributions)
         
         # 데이터 생성
         generator.create_users(user_count)
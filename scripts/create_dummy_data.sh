@@ -1,14 +1,16 @@
 #!/bin/bash
 # 사용법:
-#   bash scripts/create_dummy_data.sh [사용자수] [게시판수] [게시글수]
+#   bash scripts/create_dummy_data.sh [사용자수] [게시판수] [게시글수] [추가 옵션...]
 # 예시:
 #   bash scripts/create_dummy_data.sh 10 100 1000
+#   bash scripts/create_dummy_data.sh 10000 100000 10000000 --bulk --workers 8
 
 set -e
 # 기본값 설정
 USER_COUNT=${1:-10}
 BOARD_COUNT=${2:-100}
 POST_COUNT=${3:-1000}
+EXTRA_ARGS=("${@:4}")
 
 echo "🐳 Docker 컨테이너에서 더미 데이터 생성"
 echo "📋 생성할 데이터: 사용자 ${USER_COUNT}명, 게시판 ${BOARD_COUNT}개, 게시글 ${POST_COUNT}개"
@@ -22,7 +24,7 @@ echo ""
 
 # 더미 데이터 생성 실행
 echo "🚀 더미 데이터 생성 시작..."
-docker-compose exec api python scripts/create_dummy_data.py ${USER_COUNT} ${BOARD_COUNT} ${POST_COUNT}
+docker-compose exec api python scripts/create_dummy_data.py ${USER_COUNT} ${BOARD_COUNT} ${POST_COUNT} "${EXTRA_ARGS[@]}"
 
 echo ""
 echo "✅ 더미 데이터 생성 완료!"
@@ -0,0 +1,171 @@
+"""
+더미 데이터 분포 (게시판 인기도, 작성자 활동량, 작성 시각, 게시글 길이)
+
+모든 분포는 시드로 재현 가능하며 "종류:파라미터" 형식의 문자열로 지정합니다.
+    board:  zipf:1.1 | uniform
+    author: powerlaw:1.2 | zipf:1.0 | uniform
+    time:   diurnal | uniform
+    length: lognormal:6.2,0.9 | uniform:100,1000
+"""
+import bisect
+import itertools
+import math
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+# 한국 시간 기준 시간대별 활동량 (0시 ~ 23시, 점심과 저녁 9~10시에 몰림)
+DIURNAL_PROFILE = [
+    3.0, 2.0, 1.2, 0.8, 0.6, 0.7, 1.2, 2.0, 3.0, 4.0, 4.5, 5.0,
+    6.0, 5.5, 5.0, 5.0, 5.0, 5.0, 5.5, 6.0, 7.0, 8.0, 7.5, 5.0,
+]
+KST = timezone(timedelta(hours=9))
+# 게시글 본문 길이 범위 (문자 수)
+MIN_CONTENT_LENGTH = 20
+MAX_CONTENT_LENGTH = 20_000
+
+
+def parse_spec(spec: str) -> tuple[str, list[float]]:
+    """'zipf:1.1' -> ('zipf', [1.1])"""
+    kind, _, params = spec.partition(":")
+    return kind, [float(value) for value in params.split(",") if value]
+
+
+class WeightedSampler:
+    """가중치 비례 인덱스 샘플러 (누적합 + 이분 탐색)"""
+
+    def __init__(self, weights: list[float]):
+        self.cumulative = list(itertools.accumulate(weights))
+        self.total = self.cumulative[-1]
+
+    def index(self, rng: random.Random) -> int:
+        return bisect.bisect_right(self.cumulative, rng.random() * self.total)
+
+
+def index_sampler(spec: str, n: int, seed: int) -> WeightedSampler:
+    """n 개 항목 중 하나를 고르는 샘플러
+
+    zipf:s       순위 k 의 가중치 k^-s (순위는 시드로 섞어 생성 순서와 무관하게 배정)
+    powerlaw:a   항목마다 Pareto(a) 활동량 (a 가 작을수록 소수에 집중)
+    uniform      균등
+    """
+    kind, params = parse_spec(spec)
+    rng = random.Random(seed)
+    if kind == "zipf":
+        s = params[0] if params else 1.1
+        weights = [rank ** -s for rank in range(1, n + 1)]
+        rng.shuffle(weights)
+    elif kind == "powerlaw":
+        alpha = params[0] if params else 1.2
+        weights = [rng.paretovariate(alpha) for _ in range(n)]
+    elif kind == "uniform":
+        weights = [1.0] * n
+    else:
+        raise ValueError(f"알 수 없는 분포: {spec}")
+    return WeightedSampler(weights)
+
+
+class TimeSampler:
+    """[start, end] 사이 시각 샘플러 (diurnal: 날짜는 균등, 시간대는 DIURNAL_PROFILE 비례)"""
+
+    def __init__(self, spec: str):
+        kind, _ = parse_spec(spec)
+        if kind not in ("diurnal", "uniform"):
+            raise ValueError(f"알 수 없는 분포: {spec}")
+        self.diurnal = kind == "diurnal"
+        self.hours = WeightedSampler(DIURNAL_PROFILE)
+
+    def sample(self, rng: random.Random, start: datetime, end: datetime) -> datetime:
+        span = max((end - start).total_seconds(), 0)
+        uniform = start + timedelta(seconds=rng.random() * span)
+        if not self.diurnal or span < 86400:
+            return uniform
+        # naive datetime 은 UTC 로 간주하고, 한국 시간 기준으로 시간대를 바꾼 뒤 원래 형식으로 되돌림
+        tzinfo = uniform.tzinfo or timezone.utc
+        local = uniform.replace(tzinfo=tzinfo).astimezone(KST)
+        clustered = local.replace(hour=self.hours.index(rng), minute=rng.randrange(60), second=rng.randrange(60))
+        clustered = clustered.astimezone(tzinfo)
+        if uniform.tzinfo is None:
+            clustered = clustered.replace(tzinfo=None)
+        # 시간대를 바꾸면서 범위를 벗어나면 균등 샘플 사용
+        return clustered if start <= clustered <= end else uniform
+
+
+class LengthSampler:
+    """게시글 본문 길이(문자 수) 샘플러 (lognormal:mu,sigma 또는 uniform:min,max)"""
+
+    def __init__(self, spec: str):
+        self.kind, params = parse_spec(spec)
+        if self.kind == "lognormal":
+            self.mu, self.sigma = (params + [6.2, 0.9][len(params):])[:2]
+        elif self.kind == "uniform":
+            self.low, self.high = (params + [100, 1000][len(params):])[:2]
+        else:
+            raise ValueError(f"알 수 없는 분포: {spec}")
+
+    def sample(self, rng: random.Random) -> int:
+        if self.kind == "lognormal":
+            length = rng.lognormvariate(self.mu, self.sigma)
+        else:
+            length = rng.uniform(self.low, self.high)
+        return int(min(max(length, MIN_CONTENT_LENGTH), MAX_CONTENT_LENGTH))
+
+
+def build_content(rng: random.Random, sentences: list[str], length: int) -> str:
+    """문장을 이어 붙여 length 문자 이상 본문 생성 (3~5 문장마다 문단 구분)"""
+    paragraphs, current, size = [], [], 0
+    while size < length:
+        sentence = rng.choice(sentences)
+        current.append(sentence)
+        size += len(sentence) + 1
+        if len(current) >= rng.randint(3, 5):
+            paragraphs.append(" ".join(current))
+            current = []
+    if current:
+        paragraphs.append(" ".join(current))
+    return "\n\n".join(paragraphs)[:max(length, MIN_CONTENT_LENGTH)]
+
+
+@dataclass
+class Distributions:
+    """차원별 분포 설정"""
+    board: str = "zipf:1.1"
+    author: str = "powerlaw:1.2"
+    time: str = "diurnal"
+    length: str = "lognormal:6.2,0.9"
+    seed: int = 42
+
+    def board_sampler(self, n: int) -> WeightedSampler:
+        return index_sampler(self.board, n, self.seed + 1)
+
+    def author_sampler(self, n: int) -> WeightedSampler:
+        return index_sampler(self.author, n, self.seed + 2)
+
+    def time_sampler(self) -> TimeSampler:
+        return TimeSampler(self.time)
+
+    def length_sampler(self) -> LengthSampler:
+        return LengthSampler(self.length)
+
+    def describe(self) -> str:
+        return f"board={self.board}, author={self.author}, time={self.time}, length={self.length}, seed={self.seed}"
+
+
+def gini(values: list[int]) -> float:
+    """분포 쏠림 정도 (0: 균등, 1: 한 곳에 집중)"""
+    ordered = sorted(values)
+    n, total = len(ordered), sum(ordered)
+    if n == 0 or total == 0:
+        return 0.0
+    weighted = sum((i + 1) * value for i, value in enumerate(ordered))
+    return (2 * weighted) / (n * total) - (n + 1) / n
+
+
+def top_share(values: list[int], fraction: float) -> float:
+    """상위 fraction 비율 항목이 차지하는 합계 비율"""
+    ordered = sorted(values, reverse=True)
+    total = sum(ordered)
+    if total == 0:
+        return 0.0
+    top = max(math.ceil(len(ordered) * fraction), 1)
+    return sum(ordered[:top]) / total
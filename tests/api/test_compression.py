@@ -0,0 +1,91 @@
+"""응답 압축 미들웨어 테스트"""
+import asyncio
+import zlib
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+
+from app.core.compression import negotiate_encoding
+from app.core.config import settings
+from app.middleware.compression import CompressionMiddleware
+from app.models import Board, Post
+
+PREFERENCE = ("zstd", "br", "gzip")
+
+
+class TestNegotiation:
+    """Accept-Encoding 협상 테스트"""
+
+    def test_prefers_server_order_on_tie(self):
+        """q 값이 같으면 서버 선호 순서, 설치되지 않은 인코딩은 건너뜀"""
+        assert negotiate_encoding("gzip, unknown", PREFERENCE) == "gzip"
+        assert negotiate_encoding("gzip, deflate", ("gzip",)) == "gzip"
+
+    def test_q_values(self):
+        """q=0 은 거부, * 는 명시하지 않은 인코딩에 적용"""
+        assert negotiate_encoding("gzip;q=0", PREFERENCE) is None
+        assert negotiate_encoding("identity", PREFERENCE) is None
+        assert negotiate_encoding("*;q=0.5", PREFERENCE) is not None
+        assert negotiate_encoding("*, gzip;q=0", ("gzip",)) is None
+
+
+class TestCompression:
+    """API 응답 압축 테스트"""
+
+    def test_compresses_large_json(self, authenticated_client: TestClient, test_board: Board, test_posts: list[Post]):
+        """최소 크기 이상 JSON 응답은 gzip 으로 압축하고 크기 메트릭 기록"""
+        url = f"/api/v1/boards/{test_board.id}/posts"
+        plain = authenticated_client.get(url, headers={"Accept-Encoding": "identity"})
+        with patch.object(settings, "COMPRESSION_MIN_SIZE", 64):
+            response = authenticated_client.get(url, headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert int(response.headers["content-length"]) < len(plain.content)
+        assert response.json() == plain.json()
+        assert "content-encoding" not in plain.headers
+
+        metrics = authenticated_client.get("/metrics", headers={"Accept-Encoding": "identity"})
+        assert 'http_response_compression_saved_bytes_total{encoding="gzip"}' in metrics.text
+
+    def test_skips_small_response(self, authenticated_client: TestClient, test_board: Board):
+        """최소 크기 미만이면 압축하지 않음"""
+        with patch.object(settings, "COMPRESSION_MIN_SIZE", 1 << 20):
+            response = authenticated_client.get(f"/api/v1/boards/{test_board.id}", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+    def test_large_body_compressed_in_thread(self, authenticated_client: TestClient, test_board: Board):
+        """COMPRESSION_THREAD_THRESHOLD 이상이면 스레드에서 압축"""
+        with patch.object(settings, "COMPRESSION_MIN_SIZE", 64), \
+                patch.object(settings, "COMPRESSION_THREAD_THRESHOLD", 64), \
+                patch("app.middleware.compression.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            response = authenticated_client.get(f"/api/v1/boards/{test_board.id}", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert to_thread.called
+
+
+def test_streaming_response_compressed_per_chunk():
+    """스트리밍 응답은 Content-Length 없이 청크별로 압축"""
+    chunks = [b"line %d\n" % i * 50 for i in range(5)]
+
+    async def stream(request):
+        async def body():
+            for chunk in chunks:
+                yield chunk
+        return StreamingResponse(body(), media_type="text/plain")
+
+    app = Starlette(routes=[Route("/stream", stream)])
+    app.add_middleware(CompressionMiddleware)
+    with TestClient(app) as client, client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        raw = b"".join(response.iter_raw())
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "content-length" not in response.headers
+    assert zlib.decompress(raw, 31) == b"".join(chunks)
@@ -0,0 +1,302 @@
+"""내부(운영) API 엔드포인트 테스트"""
+import asyncio
+import json
+import threading
+import time
+import uuid
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.internal import STATS_SNAPSHOT_NAME
+from app.core.cache import TieredCache, lease_key
+from app.core.config import settings
+from app.core.loop_monitor import LoopMonitor, loop_monitor
+from app.db.stats import StatementStats, statement_stats
+from app.redis import snapshots
+from app.redis.session import redis_client
+
+
+@pytest.fixture
+def recorded_statements():
+    """쿼리 통계에 테스트용 관측치 기록."""
+    statement_stats.reset()
+    for i in range(1, 101):
+        statement_stats.record("SELECT boards.id FROM boards WHERE boards.owner_id = ? LIMIT ?", float(i), 20)
+    statement_stats.record("SELECT count(*) AS count_1 FROM posts WHERE posts.board_id = ?", 1.0, 1)
+    yield
+    statement_stats.reset()
+
+
+class TestStatementStats:
+    """쿼리 fingerprint 통계 엔드포인트 테스트"""
+
+    def test_list_statement_stats(self, client: TestClient, recorded_statements):
+        """fingerprint별 통계 조회"""
+        response = client.get("/internal/db/statements")
+
+        assert response.status_code == 200
+        statements = response.json()["statements"]
+        assert len(statements) == 2
+
+        top = statements[0]
+        assert top["query"] == "SELECT boards.id FROM boards WHERE boards.owner_id = ? LIMIT ?"
+        assert top["calls"] == 100
+        assert top["rows"] == 2000
+        assert top["max_ms"] == 100.0
+        assert 40 <= top["p50_ms"] <= 60
+        assert 90 <= top["p99_ms"] <= 100
+
+    def test_statement_literals_share_fingerprint(self, client: TestClient, recorded_statements):
+        """리터럴만 다른 쿼리는 같은 fingerprint로 집계"""
+        statement_stats.record("SELECT * FROM posts WHERE id = 1", 1.0, 1)
+        statement_stats.record("SELECT * FROM posts WHERE id = 2", 1.0, 1)
+
+        response = client.get("/internal/db/statements?sort=calls&limit=10")
+
+        queries = {item["query"]: item["calls"] for item in response.json()["statements"]}
+        assert queries["SELECT * FROM posts WHERE id = ?"] == 2
+
+    def test_merge_worker_snapshots(self, client: TestClient, recorded_statements):
+        """merge=true 면 Redis에 발행된 다른 워커의 스냅샷과 병합"""
+        other = StatementStats(settings.DB_STATS_MAX_STATEMENTS)
+        for _ in range(100):
+            other.record("SELECT boards.id FROM boards WHERE boards.owner_id = ? LIMIT ?", 900.0, 5)
+        other_key = snapshots._key(STATS_SNAPSHOT_NAME, "other-host:1")
+        redis_client.set(other_key, json.dumps(other.snapshot()), ex=60)
+        try:
+            response = client.get("/internal/db/statements?merge=true")
+        finally:
+            redis_client.delete(other_key, snapshots._key(STATS_SNAPSHOT_NAME))
+
+        assert response.status_code == 200
+        statements = {item["query"]: item for item in response.json()["statements"]}
+        assert len(statements) == 2
+        # 현재 워커에만 있는 fingerprint 는 그대로 유지
+        assert statements["SELECT count(*) AS count_1 FROM posts WHERE posts.board_id = ?"]["calls"] == 1
+
+        merged = statements["SELECT boards.id FROM boards WHERE boards.owner_id = ? LIMIT ?"]
+        assert merged["calls"] == 200
+        assert merged["rows"] == 100 * 20 + 100 * 5
+        assert merged["total_ms"] == sum(range(1, 101)) + 100 * 900.0
+        assert merged["max_ms"] == 900.0
+        # 분위수는 워커별 분위수의 평균이 아니라 합산된 히스토그램에서 계산
+        # (하위 절반은 현재 워커의 1~100ms, 상위 절반은 다른 워커의 900ms)
+        assert 90 <= merged["p50_ms"] <= 110
+        assert 800 <= merged["p95_ms"] <= 900
+        assert 800 <= merged["p99_ms"] <= 900
+
+    def test_reset_statement_stats(self, client: TestClient, recorded_statements):
+        """통계 초기화"""
+        response = client.delete("/internal/db/statements")
+
+        assert response.status_code == 204
+        assert client.get("/internal/db/statements").json()["statements"] == []
+
+    def test_internal_api_requires_token(self, client: TestClient):
+        """토큰이 설정된 경우 토큰 없이 접근 시 403"""
+        with patch.object(settings, "INTERNAL_API_TOKEN", "internal-secret"):
+            response = client.get("/internal/db/statements")
+            assert response.status_code == 403
+
+            response = client.get(
+                "/internal/db/statements", headers={"X-Internal-Token": "internal-secret"}
+            )
+            assert response.status_code == 200
+
+
+class TestLoopMonitor:
+    """이벤트 루프 블로킹 감지 테스트"""
+
+    def test_blocking_call_captures_stack(self):
+        """루프를 막는 동기 호출이 있으면 해당 위치의 스택을 캡처"""
+        monitor = LoopMonitor(interval=0.01, threshold_ms=50)
+
+        def blocking_call():
+            time.sleep(0.2)
+
+        async def run():
+            monitor.start()
+            await asyncio.sleep(0.05)
+            blocking_call()
+            await asyncio.sleep(0.05)
+            await monitor.stop()
+
+        asyncio.run(run())
+
+        assert len(monitor.events) == 1
+        event = monitor.events[0]
+        assert "blocking_call" in event["location"]
+        assert event["duration_ms"] >= 150
+
+    def test_toggle_loop_monitor(self, client: TestClient):
+        """런타임에 감지 on/off 및 임계값 변경"""
+        threshold_ms = loop_monitor.threshold_ms
+        try:
+            response = client.put("/internal/loop-monitor?enabled=false&threshold_ms=250")
+            assert response.status_code == 200
+            assert response.json()["enabled"] is False
+            assert response.json()["threshold_ms"] == 250
+
+            response = client.put("/internal/loop-monitor?enabled=true")
+            assert response.json()["enabled"] is True
+            assert client.get("/internal/loop-monitor").json()["enabled"] is True
+        finally:
+            loop_monitor.threshold_ms = threshold_ms
+
+
+@pytest.fixture
+def tiered_cache():
+    """테스트용 네임스페이스 캐시 (키는 테스트 후 삭제)."""
+    cache = TieredCache(f"test-{uuid.uuid4().hex[:8]}", lambda: True, lambda: 60)
+    key = f"cache:{cache.namespace}:1"
+    yield cache, key
+    redis_client.delete(key, lease_key(key))
+
+
+def _write_from_other_worker(key: str, value, fresh_for: float = 60, delta: float = 0) -> None:
+    """다른 워커가 저장한 캐시 항목 ([값, 만료 시각, 로드 소요 시간])"""
+    redis_client.set(key, json.dumps([value, time.time() + fresh_for, delta]))
+
+
+def _wait_for(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestTieredCache:
+    """프로세스 내 LRU + Redis 캐시 테스트"""
+
+    def test_remote_invalidation(self, client: TestClient, tiered_cache):
+        """다른 워커가 발행한 무효화 메시지를 받으면 L1 에서 지우고 Redis 의 새 값을 조회"""
+        cache, key = tiered_cache
+        cache.set(key, {"value": 1})
+        assert cache.get(key) == {"value": 1}
+
+        # 다른 워커의 쓰기: Redis 값 변경 후 무효화 발행
+        _write_from_other_worker(key, {"value": 2})
+        assert cache.get(key) == {"value": 1}
+        redis_client.publish(
+            settings.CACHE_INVALIDATION_CHANNEL,
+            json.dumps({"origin": "other-worker", "namespace": cache.namespace, "keys": [key]}),
+        )
+
+        assert _wait_for(lambda: cache.get(key) == {"value": 2})
+
+    def test_staleness_bound(self, tiered_cache):
+        """무효화 메시지를 놓쳐도 CACHE_LOCAL_MAX_STALENESS 초 후에는 Redis 의 값을 조회"""
+        cache, key = tiered_cache
+        with patch.object(settings, "CACHE_LOCAL_MAX_STALENESS", 0.1):
+            cache.set(key, {"value": 1})
+            _write_from_other_worker(key, {"value": 2})
+            assert cache.get(key) == {"value": 1}
+            time.sleep(0.15)
+            assert cache.get(key) == {"value": 2}
+
+    def test_lru_bound_and_stats(self, client: TestClient):
+        """최대 항목 수를 넘으면 오래 쓰지 않은 항목부터 제거, 네임스페이스별 적중률 조회"""
+        cache = TieredCache(f"test-{uuid.uuid4().hex[:8]}", lambda: True, lambda: 60, max_entries=lambda: 2)
+        keys = [f"cache:{cache.namespace}:{i}" for i in range(3)]
+        try:
+            for i, key in enumerate(keys):
+                cache.set(key, i)
+            assert cache.stats()["local_entries"] == 2
+            assert [cache.get(key) for key in reversed(keys)] == [2, 1, 0]
+            assert cache.get(f"cache:{cache.namespace}:missing") is None
+
+            stats = client.get("/internal/cache").json()["namespaces"][cache.namespace]
+            assert (stats["local_hits"], stats["redis_hits"], stats["misses"]) == (2, 1, 1)
+            assert stats["hit_ratio"] == 0.75
+        finally:
+            redis_client.delete(*keys)
+
+
+class TestCacheStampede:
+    """get_or_load 스탬피드 방지 테스트"""
+
+    def test_single_flight(self, tiered_cache):
+        """워커 안 동시 미스는 한 번만 로드하고 결과 공유"""
+        cache, key = tiered_cache
+        calls, barrier = [], threading.Barrier(8)
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"value": 1}
+
+        results = []
+
+        def request():
+            barrier.wait()
+            results.append(cache.get_or_load(key, loader))
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert results == [{"value": 1}] * 8
+        assert cache.stats()["loads"]["coalesced"] == 7
+
+    def test_stale_while_revalidate(self, tiered_cache):
+        """다른 워커가 갱신 중(lease)이면 만료된 이전 값을 바로 응답, 갱신이 끝나면 새 값"""
+        cache, key = tiered_cache
+        _write_from_other_worker(key, {"value": 1}, fresh_for=-1)
+        redis_client.set(lease_key(key), "other-worker", px=5000)
+
+        assert cache.get(key) is None
+        assert cache.get_or_load(key, lambda: pytest.fail("lease 가 있으면 로드하지 않음")) == {"value": 1}
+
+        redis_client.delete(lease_key(key))
+        assert cache.get_or_load(key, lambda: {"value": 2}) == {"value": 2}
+
+    def test_waits_for_other_worker(self, tiered_cache):
+        """이전 값이 없으면 lease 를 가진 다른 워커가 저장할 때까지 기다림"""
+        cache, key = tiered_cache
+        redis_client.set(lease_key(key), "other-worker", px=5000)
+        threading.Timer(0.1, _write_from_other_worker, (key, {"value": 1})).start()
+
+        assert cache.get_or_load(key, lambda: pytest.fail("다른 워커가 로드 중")) == {"value": 1}
+        assert cache.stats()["loads"]["lease_wait"] == 1
+
+    def test_no_wait_on_event_loop(self, tiered_cache):
+        """이벤트 루프 스레드에서는 다른 워커의 로드를 기다리지 않고 직접 로드"""
+        cache, key = tiered_cache
+        redis_client.set(lease_key(key), "other-worker", px=5000)
+
+        async def request():
+            started = time.monotonic()
+            value = cache.get_or_load(key, lambda: {"value": 1})
+            return value, time.monotonic() - started
+
+        value, elapsed = asyncio.run(request())
+        assert value == {"value": 1}
+        assert elapsed < 1
+        assert cache.stats()["loads"]["lease_wait"] == 0
+
+    def test_early_refresh(self, tiered_cache):
+        """만료 전이라도 남은 시간이 로드 소요 시간보다 충분히 짧으면 미리 갱신"""
+        cache, key = tiered_cache
+        _write_from_other_worker(key, {"value": 1}, fresh_for=0.5, delta=1000)
+
+        assert cache.get_or_load(key, lambda: {"value": 2}) == {"value": 2}
+        assert cache.stats()["loads"]["early"] == 1
+
+    def test_invalidated_during_load(self, tiered_cache):
+        """로드 중 무효화되면 무효화 전에 읽은 값은 저장하지 않음"""
+        cache, key = tiered_cache
+
+        def loader():
+            cache.invalidate([key])
+            return {"value": 1}
+
+        assert cache.get_or_load(key, loader) == {"value": 1}
+        assert not redis_client.exists(key)
+        assert cache.get_or_load(key, lambda: {"value": 2}) == {"value": 2}
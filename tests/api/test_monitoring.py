@@ -0,0 +1,222 @@
+"""모니터링 엔드포인트 테스트"""
+import json
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.api import health
+from app.api.health import ReadinessProber
+from app.core.config import settings
+from app.core.tracing import add_trace_handler, remove_trace_handler
+from app.middleware.capture import capture_writer
+from app.middleware.tracing import exporter
+from app.models import Board
+
+
+class TestMetrics:
+    """Prometheus 메트릭 엔드포인트 테스트"""
+
+    def test_metrics_format(self, client: TestClient):
+        """Prometheus text format으로 응답"""
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE http_requests_total counter" in response.text
+        assert "# TYPE http_request_duration_seconds histogram" in response.text
+        assert "db_pool_checked_out" in response.text
+        assert "bcrypt_executor_queue_depth" in response.text
+
+    def test_metrics_use_route_template(self, authenticated_client: TestClient, test_board: Board):
+        """요청 경로가 아닌 라우트 템플릿 기준으로 집계"""
+        authenticated_client.get(f"/api/v1/boards/{test_board.id}")
+
+        response = authenticated_client.get("/metrics")
+
+        assert 'route="/api/v1/boards/{board_id}",status="200"' in response.text
+        assert f'route="/api/v1/boards/{test_board.id}"' not in response.text
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/api/v1/boards/{board_id}",le="+Inf"}' in response.text
+
+
+class TestServerTiming:
+    """Server-Timing 헤더 테스트"""
+
+    def test_server_timing_disabled_by_default(self, authenticated_client: TestClient, test_board: Board):
+        """설정/디버그 헤더가 없으면 Server-Timing 헤더 없음"""
+        response = authenticated_client.get(f"/api/v1/boards/{test_board.id}")
+
+        assert response.status_code == 200
+        assert "server-timing" not in response.headers
+
+    def test_server_timing_with_debug_token(self, authenticated_client: TestClient, test_board: Board):
+        """허용된 디버그 토큰을 보내면 구간별 시간 반환"""
+        with patch.object(settings, "SERVER_TIMING_DEBUG_TOKENS", ["debug-token"]):
+            response = authenticated_client.get(
+                f"/api/v1/boards/{test_board.id}", headers={"X-Debug-Timing": "debug-token"}
+            )
+
+        assert response.status_code == 200
+        entries = {item.split(";")[0].strip() for item in response.headers["server-timing"].split(",")}
+        assert {"auth", "session", "app", "ser", "total"} <= entries
+
+    def test_server_timing_rejects_unknown_token(self, authenticated_client: TestClient, test_board: Board):
+        """허용되지 않은 토큰은 무시"""
+        with patch.object(settings, "SERVER_TIMING_DEBUG_TOKENS", ["debug-token"]):
+            response = authenticated_client.get(
+                f"/api/v1/boards/{test_board.id}", headers={"X-Debug-Timing": "other"}
+            )
+
+        assert "server-timing" not in response.headers
+
+
+class TestTracing:
+    """트레이싱 span 수집 테스트"""
+
+    def _collect(self, client: TestClient, path: str, **overrides):
+        traces = []
+        # 앱이 등록한 exporter 대신 수집 (저장소의 TRACING_EXPORT_FILE 에 기록하지 않도록)
+        remove_trace_handler(exporter.export)
+        add_trace_handler(traces.append)
+        try:
+            with patch.object(settings, "TRACING_ENABLED", True), \
+                    patch.multiple(settings, **overrides):
+                response = client.get(path)
+        finally:
+            remove_trace_handler(traces.append)
+            add_trace_handler(exporter.export)
+        assert response.status_code == 200
+        return traces
+
+    def test_spans_follow_call_hierarchy(self, authenticated_client: TestClient, test_board: Board):
+        """루트 요청 span 아래에 의존성/서비스/CRUD span이 부모-자식으로 연결"""
+        traces = self._collect(
+            authenticated_client, f"/api/v1/boards/{test_board.id}", TRACING_SAMPLE_RATE=1.0
+        )
+
+        assert len(traces) == 1
+        spans = {span.name: span for span in traces[0].spans}
+        root = spans["GET /api/v1/boards/{board_id}"]
+        assert root.parent_id is None
+        assert spans["get_current_user"].parent_id == root.span_id
+        assert spans["BoardService.get"].parent_id == root.span_id
+        assert any(
+            span.parent_id == spans["BoardService.get"].span_id and span.name.startswith("CRUD")
+            for span in traces[0].spans
+        )
+
+    def test_slow_traces_kept_regardless_of_rate(self, authenticated_client: TestClient, test_board: Board):
+        """확률 샘플링에 걸리지 않아도 임계값 이상 느린 트레이스는 보관"""
+        path = f"/api/v1/boards/{test_board.id}"
+
+        kept = self._collect(authenticated_client, path, TRACING_SAMPLE_RATE=0.0, TRACING_SLOW_THRESHOLD_MS=0.0)
+        dropped = self._collect(authenticated_client, path, TRACING_SAMPLE_RATE=0.0, TRACING_SLOW_THRESHOLD_MS=1e9)
+
+        assert len(kept) == 1
+        assert dropped == []
+
+    def test_root_span_kept_at_span_limit(self, authenticated_client: TestClient, test_board: Board):
+        """span 수 상한에 걸려도 루트 span 은 보관하고 버린 span 수를 기록"""
+        traces = self._collect(
+            authenticated_client,
+            f"/api/v1/boards/{test_board.id}",
+            TRACING_SAMPLE_RATE=1.0,
+            TRACING_MAX_SPANS_PER_TRACE=2,
+        )
+
+        [trace] = traces
+        assert len(trace.spans) == 2
+        assert trace.dropped_spans > 0
+        root = trace.spans[-1]
+        assert root.name == "GET /api/v1/boards/{board_id}"
+        assert root.parent_id is None
+        assert root.attributes["tracing.dropped_spans"] == trace.dropped_spans
+
+
+class TestTrafficCapture:
+    """트래픽 캡처 미들웨어 테스트"""
+
+    def test_captures_scrubbed_request(self, authenticated_client: TestClient, test_board: Board, tmp_path):
+        """라우트 템플릿/본문 형태/가명 주체만 기록하고 토큰과 본문 값은 남기지 않음"""
+        path = tmp_path / "traffic.jsonl"
+        with patch.object(settings, "TRAFFIC_CAPTURE_ENABLED", True), \
+                patch.object(settings, "TRAFFIC_CAPTURE_SAMPLE_RATE", 1.0), \
+                patch.object(capture_writer, "path", str(path)):
+            response = authenticated_client.post(
+                f"/api/v1/boards/{test_board.id}/posts?cursor=abc&q=secret",
+                json={"title": "비밀 제목", "content": "비밀 내용입니다"},
+            )
+            authenticated_client.get("/health")
+            capture_writer.shutdown()
+
+        assert response.status_code == 201
+        records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert len(records) == 1
+        record = records[0]
+        assert record["route"] == "/api/v1/boards/{board_id}/posts"
+        assert record["path_params"] == {"board_id": str(test_board.id)}
+        assert record["query"] == {"cursor": "<cursor>", "q": "<str:6>"}
+        assert record["body"]["json"] == {"title": "str:5", "content": "str:8"}
+        assert record["status"] == 201
+        assert record["principal"].startswith("u:")
+        raw = path.read_text(encoding="utf-8")
+        assert "비밀" not in raw and "secret" not in raw
+        assert authenticated_client.headers["Authorization"].split()[1] not in raw
+
+    def test_disabled_by_default(self, authenticated_client: TestClient, test_board: Board, tmp_path):
+        """설정이 꺼져 있으면 기록하지 않음"""
+        path = tmp_path / "traffic.jsonl"
+        with patch.object(capture_writer, "path", str(path)):
+            authenticated_client.get(f"/api/v1/boards/{test_board.id}")
+            capture_writer.shutdown()
+
+        assert not path.exists()
+
+
+class TestHealth:
+    """liveness/readiness 엔드포인트 테스트"""
+
+    def test_health(self, client: TestClient):
+        """liveness는 의존성과 무관하게 200"""
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    def test_ready_before_first_probe(self, client: TestClient):
+        """첫 확인 전에는 503"""
+        with patch.object(health, "readiness", ReadinessProber()):
+            response = client.get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["reason"] == "starting"
+
+    def test_ready_uses_cached_probe_result(self, client: TestClient):
+        """캐시된 확인 결과와 풀 사용률 반환"""
+        prober = ReadinessProber()
+        with patch.object(health, "readiness", prober), \
+                patch.object(health, "_probe_database", lambda: None):
+            prober.probe()
+            response = client.get("/ready")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["ready"] is True
+        assert body["checks"]["database"]["ok"] is True
+        assert body["checks"]["redis"]["ok"] is True
+        assert 0 <= body["pool"]["utilization"] <= 1
+
+    def test_ready_reports_unavailable_dependency(self, client: TestClient):
+        """의존성 확인 실패 시 503"""
+        prober = ReadinessProber()
+
+        def fail():
+            raise ConnectionError("connection refused")
+
+        with patch.object(health, "readiness", prober), \
+                patch.object(health, "_probe_database", fail):
+            prober.probe()
+            response = client.get("/ready")
+
+        assert response.status_code == 503
+        assert response.json()["reason"] == "dependency_unavailable"
+        assert response.json()["checks"]["database"]["ok"] is False
@@ -0,0 +1,122 @@
+"""응답 직렬화 fast path 테스트"""
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import msgpack
+from fastapi import Response
+from fastapi.testclient import TestClient
+
+from app.api.routing import TimedRoute
+from app.core.negotiation import JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, negotiate_media_type
+from app.main import app
+from app.models import Board, Post
+from app.schemas.board import BoardListResponse
+from app.schemas.post import PostResponse
+
+MSGPACK_HEADERS = {"Accept": MSGPACK_MEDIA_TYPE}
+
+
+@contextmanager
+def fastapi_serialization():
+    """모든 TimedRoute 의 fast path 를 끄고 FastAPI 기본 검증/직렬화 사용"""
+    routes = [route for route in app.routes if isinstance(route, TimedRoute)]
+    for route in routes:
+        route.__dict__["fast_path_model"] = None
+    try:
+        yield
+    finally:
+        for route in routes:
+            route.__dict__.pop("fast_path_model", None)
+
+
+class TestResponseFastPath:
+    """response_model 인스턴스를 바로 JSON 으로 직렬화해도 응답이 같은지 테스트"""
+
+    def _compare(self, client: TestClient, method: str, url: str, **kwargs):
+        with patch("app.api.routing.Response", wraps=Response) as fast_response:
+            fast = client.request(method, url, **kwargs)
+        assert fast_response.called
+        with fastapi_serialization():
+            default = client.request(method, url, **kwargs)
+        assert fast.status_code == default.status_code
+        assert fast.headers["content-type"] == default.headers["content-type"]
+        assert fast.json() == default.json()
+        return fast
+
+    def test_detail_responses(self, authenticated_client: TestClient, test_board: Board, test_post: Post):
+        """상세 응답 (별칭 posts_count, datetime 포맷 포함)"""
+        response = self._compare(authenticated_client, "GET", f"/api/v1/boards/{test_board.id}")
+        assert "posts_count" in response.json()
+        self._compare(authenticated_client, "GET", f"/api/v1/posts/{test_post.id}")
+
+    def test_page_responses(self, authenticated_client: TestClient, test_boards: list[Board], test_posts: list[Post]):
+        """커서 페이지 응답"""
+        response = self._compare(authenticated_client, "GET", "/api/v1/boards/?size=2")
+        assert response.json()["next_page"]
+        self._compare(authenticated_client, "GET", f"/api/v1/boards/{test_posts[0].board_id}/posts?size=2")
+
+    def test_created_status_code(self, authenticated_client: TestClient, test_board: Board):
+        """라우트의 status_code(201) 유지"""
+        response = authenticated_client.post(
+            f"/api/v1/boards/{test_board.id}/posts", json={"title": "제목", "content": "내용"}
+        )
+
+        assert response.status_code == 201
+        assert response.json()["title"] == "제목"
+
+
+class TestMsgpack:
+    """Accept/Content-Type: application/msgpack 협상 테스트"""
+
+    def test_negotiate_media_type(self):
+        """MessagePack 을 더 선호할 때만 MessagePack, 기본은 JSON"""
+        assert negotiate_media_type("") == JSON_MEDIA_TYPE
+        assert negotiate_media_type("*/*") == JSON_MEDIA_TYPE
+        assert negotiate_media_type("application/msgpack") == MSGPACK_MEDIA_TYPE
+        assert negotiate_media_type("application/msgpack, */*") == MSGPACK_MEDIA_TYPE
+        assert negotiate_media_type("application/json, application/msgpack") == JSON_MEDIA_TYPE
+        assert negotiate_media_type("application/json;q=0.5, application/x-msgpack") == MSGPACK_MEDIA_TYPE
+        assert negotiate_media_type("application/msgpack;q=0") == JSON_MEDIA_TYPE
+
+    def test_page_response(self, authenticated_client: TestClient, test_boards: list[Board]):
+        """같은 응답 모델로 검증되는 MessagePack 페이지 응답"""
+        default = authenticated_client.get("/api/v1/boards/?size=2")
+        response = authenticated_client.get("/api/v1/boards/?size=2", headers=MSGPACK_HEADERS)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        content = msgpack.unpackb(response.content)
+        assert content == default.json()
+        assert BoardListResponse.model_validate(content).next_page
+        # 같은 URL 이 Accept 에 따라 다른 형식이므로 두 응답 모두 Vary: Accept
+        assert default.headers["vary"] == response.headers["vary"] == "Accept"
+
+    def test_sparse_and_default_serialization(self, authenticated_client: TestClient, test_post: Post):
+        """?fields= 응답과 fast path 를 거치지 않은 응답도 MessagePack 으로 변환"""
+        url = f"/api/v1/posts/{test_post.id}"
+        sparse = authenticated_client.get(f"{url}?fields=id,title", headers=MSGPACK_HEADERS)
+        assert msgpack.unpackb(sparse.content) == {"id": test_post.id, "title": test_post.title}
+
+        with fastapi_serialization():
+            response = authenticated_client.get(url, headers=MSGPACK_HEADERS)
+        assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        assert msgpack.unpackb(response.content) == authenticated_client.get(url).json()
+
+    def test_msgpack_request_body(self, authenticated_client: TestClient, test_board: Board):
+        """Content-Type: application/msgpack 본문을 JSON 본문과 같이 검증"""
+        url = f"/api/v1/boards/{test_board.id}/posts"
+        response = authenticated_client.post(
+            url,
+            content=msgpack.packb({"title": "제목", "content": "내용"}),
+            headers={"Content-Type": MSGPACK_MEDIA_TYPE, **MSGPACK_HEADERS},
+        )
+
+        assert response.status_code == 201
+        assert PostResponse.model_validate(msgpack.unpackb(response.content)).title == "제목"
+
+        invalid = authenticated_client.post(
+            url, content=msgpack.packb({"title": "제목"}), headers={"Content-Type": MSGPACK_MEDIA_TYPE}
+        )
+        assert invalid.status_code == 422
+        malformed = authenticated_client.post(url, content=b"\xc1", headers={"Content-Type": MSGPACK_MEDIA_TYPE})
+        assert malformed.status_code == 400
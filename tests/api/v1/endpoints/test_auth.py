@@ -1,8 +1,13 @@
+import threading
+from unittest.mock import patch
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.core import security
 from app.core.security import create_access_token
+from app.core.session import validate_session
 from app.models import User
 
 
@@ -247,3 +252,71 @@ class TestAuthEndpoints:
         headers = {"Authorization": f"Bearer {token}"}
         response = client.post("/api/v1/auth/logout", headers=headers)
         assert response.status_code == 200
+
+    def test_session_validated_after_login(self, client: TestClient, test_user: User):
+        """세션 검증을 모킹하지 않고 로그인 -> 인증 요청 -> 로그아웃 후 거부 테스트."""
+        # conftest 의 전역 모킹 대신 실제 세션 검증 (모듈 import 시점의 원본 함수)
+        with patch("app.api.v1.deps.validate_session", validate_session):
+            login_response = client.post(
+                "/api/v1/auth/login",
+                json={"email": test_user.email, "password": "testpassword123"},
+            )
+            assert login_response.status_code == 200
+            headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+            response = client.get("/api/v1/boards/", headers=headers)
+            assert response.status_code == 200
+
+            response = client.post("/api/v1/auth/logout", headers=headers)
+            assert response.status_code == 200
+
+            response = client.get("/api/v1/boards/", headers=headers)
+            assert response.status_code == 401
+
+
+class TestPasswordHashing:
+    """bcrypt 해싱/검증을 전용 스레드풀에서 실행하는지 테스트."""
+
+    @staticmethod
+    def _record_thread(func, threads: list):
+        def wrapper(*args):
+            threads.append(threading.current_thread().name)
+            return func(*args)
+        return wrapper
+
+    def test_signup_hashes_in_bcrypt_pool(self, client: TestClient, db: Session):
+        """회원가입 시 해싱은 bcrypt 스레드풀에서 한 번만 수행하고 CRUD 에서 다시 해싱하지 않음."""
+        threads = []
+        signup_data = {"fullname": "Test User", "email": "test@example.com", "password": "testpassword123"}
+
+        with patch.object(security, "get_password_hash", self._record_thread(security.get_password_hash, threads)), \
+                patch("app.crud.user.get_password_hash") as crud_hash:
+            response = client.post("/api/v1/auth/signup", json=signup_data)
+
+        assert response.status_code == 200
+        assert len(threads) == 1
+        assert threads[0].startswith("bcrypt")
+        crud_hash.assert_not_called()
+        assert security.bcrypt_pending_tasks() == 0
+
+        # 저장된 해시로 로그인 가능
+        user = db.query(User).filter(User.email == signup_data["email"]).first()
+        assert security.verify_password(signup_data["password"], user.password)
+        response = client.post(
+            "/api/v1/auth/login", json={"email": signup_data["email"], "password": signup_data["password"]}
+        )
+        assert response.status_code == 200
+
+    def test_login_verifies_in_bcrypt_pool(self, client: TestClient, test_user: User):
+        """로그인 시 비밀번호 검증은 bcrypt 스레드풀에서 수행."""
+        threads = []
+
+        with patch.object(security, "verify_password", self._record_thread(security.verify_password, threads)):
+            success = client.post("/api/v1/auth/login", json={"email": test_user.email, "password": "testpassword123"})
+            failure = client.post("/api/v1/auth/login", json={"email": test_user.email, "password": "wrongpassword"})
+
+        assert success.status_code == 200
+        assert failure.status_code == 401
+        assert len(threads) == 2
+        assert all(name.startswith("bcrypt") for name in threads)
+        assert security.bcrypt_pending_tasks() == 0
@@ -2,9 +2,12 @@
 import pytest
 from unittest.mock import patch
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
-from app.models import Board, User
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models import Board, Post, User
 from tests.utils import assert_board_response, assert_pagination_response, assert_error_response
 
 
@@ -327,6 +330,17 @@ class TestListBoards:
         data = response.json()
         assert "items" in data
 
+    def test_list_boards_sort_posts_with_cursor(self, authenticated_client: TestClient, test_boards: list[Board]):
+        """게시글 수 순 커서 페이지 (별칭 필드 posts_count 가 커서 값)"""
+        first = authenticated_client.get("/api/v1/boards/?sort=posts&size=2").json()
+        assert first["next_page"]
+
+        second = authenticated_client.get(f"/api/v1/boards/?sort=posts&size=2&cursor={first['next_page']}").json()
+        first_ids = {item["id"] for item in first["items"]}
+        assert second["items"]
+        assert all(item["id"] not in first_ids for item in second["items"])
+        assert first["items"][-1]["posts_count"] >= second["items"][0]["posts_count"]
+
     def test_list_boards_invalid_sort(self, authenticated_client: TestClient):
         """잘못된 정렬 옵션으로 게시판 목록 조회"""
         response = authenticated_client.get("/api/v1/boards/?sort=invalid_sort")
@@ -470,6 +484,200 @@ class TestUpdateBoard:
         assert_error_response(response.json(), 401)
 
 
+class TestConditionalBoard:
+    """게시판 ETag 조건부 요청 테스트"""
+
+    def test_not_modified(self, authenticated_client: TestClient, test_board: Board):
+        """같은 ETag 면 304, 게시글 수가 바뀌면 ETag 도 바뀜"""
+        response = authenticated_client.get(f"/api/v1/boards/{test_board.id}")
+        etag = response.headers["etag"]
+
+        not_modified = authenticated_client.get(f"/api/v1/boards/{test_board.id}", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == etag
+
+        authenticated_client.post(f"/api/v1/boards/{test_board.id}/posts", json={"title": "제목", "content": "내용"})
+        modified = authenticated_client.get(f"/api/v1/boards/{test_board.id}", headers={"If-None-Match": etag})
+        assert modified.status_code == 200
+        assert modified.json()["posts_count"] == 1
+        assert modified.headers["etag"] != etag
+
+    def test_update_if_match(self, authenticated_client: TestClient, test_board: Board):
+        """If-Match 가 현재 버전과 다르면 412"""
+        etag = authenticated_client.get(f"/api/v1/boards/{test_board.id}").headers["etag"]
+
+        stale = authenticated_client.put(
+            f"/api/v1/boards/{test_board.id}", json={"public": False}, headers={"If-Match": '"0-0-0"'}
+        )
+        response = authenticated_client.put(
+            f"/api/v1/boards/{test_board.id}", json={"public": False}, headers={"If-Match": etag}
+        )
+
+        assert stale.status_code == 412
+        assert response.status_code == 200
+        assert response.json()["public"] is False
+
+
+class TestPublicBoardListCache:
+    """공개 게시판 목록 캐시 + 본인 비공개 게시판 병합 테스트"""
+
+    @pytest.fixture
+    def boards(self, db: Session, test_boards: list[Board], test_user: User) -> list[Board]:
+        """이름순 기대 순서 (공개 게시판 + 본인 비공개 게시판, 다른 사용자 비공개 게시판 제외)
+
+        대소문자가 섞인 이름은 코드 포인트 순서 ("Banana" < "apple") 로 DB 와 캐시 병합이 같은 순서여야 함
+        """
+        for name in ["가 비공개", "하 비공개", "Cherry 비공개", "banana 비공개"]:
+            db.add(Board(name=name, public=False, owner_id=test_user.id))
+        for name in ["apple", "Banana", "cherry"]:
+            db.add(Board(name=name, public=True, owner_id=test_user.id))
+        db.commit()
+        visible = db.query(Board).filter((Board.public == True) | (Board.owner_id == test_user.id)).all()
+        return sorted(visible, key=lambda board: (board.name, -board.id))
+
+    @pytest.mark.parametrize("cache_size", [2, 200], ids=["beyond_cache", "cached"])
+    def test_pages_merge_private_boards(self, response_cache, authenticated_client: TestClient, boards: list[Board], cache_size: int):
+        """다음/이전 페이지가 DB 조회 결과와 같은 순서 (캐시 범위를 벗어난 페이지 포함)"""
+        pages = []
+        with patch.object(settings, "BOARD_LIST_CACHE_SIZE", cache_size):
+            page = authenticated_client.get("/api/v1/boards/", params={"sort": "name", "size": 2}).json()
+            pages.append(page)
+            while page["next_page"]:
+                page = authenticated_client.get(
+                    "/api/v1/boards/", params={"sort": "name", "size": 2, "cursor": page["next_page"]}
+                ).json()
+                pages.append(page)
+            previous = authenticated_client.get(
+                "/api/v1/boards/", params={"sort": "name", "size": 2, "cursor": pages[-1]["previous_page"]}
+            ).json()
+
+        assert [item["id"] for page in pages for item in page["items"]] == [board.id for board in boards]
+        assert pages[0]["total"] == len(boards)
+        assert pages[0]["previous_page"] is None
+        assert previous["items"] == pages[-2]["items"]
+
+    def test_public_boards_served_from_cache(self, response_cache, authenticated_client: TestClient, boards: list[Board], db_engine):
+        """두 번째 요청부터 공개 게시판은 캐시에서, DB 는 본인 비공개 게시판만 조회"""
+        first = authenticated_client.get("/api/v1/boards/", params={"sort": "name"}).json()
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            cached = authenticated_client.get("/api/v1/boards/", params={"sort": "name"}).json()
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+
+        assert cached == first
+        board_queries = [sql for sql in statements if "FROM boards" in sql]
+        assert board_queries and all("boards.owner_id = " in sql for sql in board_queries)
+
+    def test_invalidated_on_write(self, response_cache, authenticated_client: TestClient, boards: list[Board]):
+        """공개 게시판 생성/게시글 작성 시 공유 캐시 무효화"""
+        authenticated_client.get("/api/v1/boards/", params={"sort": "posts"})
+
+        created = authenticated_client.post("/api/v1/boards/", json={"name": "새 게시판", "public": True}).json()
+        authenticated_client.post(f"/api/v1/boards/{created['id']}/posts", json={"title": "제목", "content": "내용"})
+        items = authenticated_client.get("/api/v1/boards/", params={"sort": "posts"}).json()["items"]
+
+        assert items[0]["id"] == created["id"]
+        assert items[0]["posts_count"] == 1
+
+    def test_sparse_fields(self, response_cache, authenticated_client: TestClient, boards: list[Board]):
+        """?fields= 는 캐시한 전체 응답에서 필드만 골라 응답"""
+        authenticated_client.get("/api/v1/boards/", params={"sort": "name"})
+        data = authenticated_client.get("/api/v1/boards/", params={"sort": "name", "fields": "id,posts_count"}).json()
+
+        assert [item["id"] for item in data["items"]] == [board.id for board in boards]
+        assert all(set(item) == {"id", "posts_count"} for item in data["items"])
+
+    @pytest.mark.parametrize("cached", [False, True])
+    def test_sparse_fields_select_columns(self, request, authenticated_client: TestClient, boards: list[Board], db_engine, cached):
+        """?fields= 면 DB 에서 조회하는 목록 (비공개 게시판, 캐시를 끄면 공개 게시판도) 은 지정한 필드와 정렬 컬럼만 SELECT"""
+        if cached:
+            request.getfixturevalue("response_cache")
+            authenticated_client.get("/api/v1/boards/", params={"sort": "name"})
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            data = authenticated_client.get("/api/v1/boards/", params={"sort": "name", "fields": "id"}).json()
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+
+        assert [item["id"] for item in data["items"]] == [board.id for board in boards]
+        page_sql = [sql for sql in statements if "ORDER BY" in sql]
+        assert len(page_sql) == (1 if cached else 2)
+        assert all("boards.owner_id," not in sql and "posts_count" not in sql for sql in page_sql)
+
+    def test_invalid_cursor(self, authenticated_client: TestClient):
+        """잘못된 커서는 400"""
+        response = authenticated_client.get("/api/v1/boards/", params={"cursor": "invalid"})
+
+        assert response.status_code == 400
+
+
+class TestBoardDetailCache:
+    """게시판 상세 조회 캐시 테스트"""
+
+    @pytest.mark.parametrize("local, expected_commands", [(True, []), (False, ["GET", "GET"])])
+    def test_cache_hit_single_get(
+        self, response_cache, authenticated_client: TestClient, test_board: Board, db_engine, local, expected_commands
+    ):
+        """캐시에 있으면 DB 조회 없이 같은 응답 (L1 에 있으면 Redis 명령도 없음, L1 을 끄면 인증 사용자/게시판 GET 각 한 번)"""
+        first = authenticated_client.get(f"/api/v1/boards/{test_board.id}")
+
+        statements, commands = [], []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            with patch("app.redis.session._command_listeners", [lambda command, duration: commands.append(command)]), \
+                    patch.object(settings, "CACHE_LOCAL_ENABLED", local):
+                cached = authenticated_client.get(f"/api/v1/boards/{test_board.id}")
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+
+        assert cached.json() == first.json()
+        assert cached.headers["etag"] == first.headers["etag"]
+        assert commands == expected_commands
+        assert not statements
+
+    def test_cache_invalidation(
+        self, response_cache, authenticated_client: TestClient, test_board: Board, test_post: Post, another_user: User
+    ):
+        """게시글 생성/게시판 수정 시 무효화, 공개 여부가 바뀌면 게시글 캐시는 두고 게시판 접근 캐시로 권한 확인"""
+        url = f"/api/v1/boards/{test_board.id}"
+        posts_count = authenticated_client.get(url).json()["posts_count"]
+        authenticated_client.get(f"/api/v1/posts/{test_post.id}")
+
+        authenticated_client.post(f"{url}/posts", json={"title": "제목", "content": "내용"})
+        assert authenticated_client.get(url).json()["posts_count"] == posts_count + 1
+
+        authenticated_client.put(url, json={"name": "수정된 게시판"})
+        assert authenticated_client.get(url).json()["name"] == "수정된 게시판"
+        assert response_cache.exists(f"cache:post:{test_post.id}")
+
+        other = {"Authorization": f"Bearer {create_access_token(data={'user_id': str(another_user.id)})}"}
+        assert authenticated_client.get(f"/api/v1/posts/{test_post.id}", headers=other).status_code == 200
+
+        authenticated_client.put(url, json={"public": False})
+        assert response_cache.exists(f"cache:post:{test_post.id}")
+        assert authenticated_client.get(f"/api/v1/posts/{test_post.id}", headers=other).status_code == 403
+        assert authenticated_client.get(f"/api/v1/posts/{test_post.id}").status_code == 200
+
+        post_id = test_post.id
+        authenticated_client.delete(url)
+        assert response_cache.exists(f"cache:post:{post_id}")
+        assert authenticated_client.get(f"/api/v1/posts/{post_id}").status_code == 403
+
+    def test_cached_access_check(self, response_cache, authenticated_client: TestClient, another_board: Board):
+        """캐시한 응답도 public, owner_id 로 접근 권한 확인"""
+        responses = [authenticated_client.get(f"/api/v1/boards/{another_board.id}") for _ in range(2)]
+
+        assert response_cache.exists(f"cache:board:{another_board.id}")
+        assert [response.status_code for response in responses] == [403, 403]
+
+
 class TestDeleteBoard:
     """게시판 삭제 엔드포인트 테스트"""
 
@@ -1,11 +1,16 @@
 """Post API 엔드포인트 테스트"""
 import pytest
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.models import Board, Post, User
-from tests.utils import assert_post_response, assert_pagination_response, assert_error_response
+from app.models.post import EXCERPT_LENGTH
+from app.schemas.sync import SyncWatermark
+from tests.utils import assert_post_response, assert_post_summary_response, assert_pagination_response, assert_error_response
 
 
 class TestCreatePost:
@@ -89,7 +94,23 @@ class TestListPosts:
 
         # 각 게시글 데이터 검증
         for post in data["items"]:
-            assert_post_response(post)
+            assert_post_summary_response(post)
+
+    def test_list_posts_excerpt(self, authenticated_client: TestClient, test_board: Board):
+        """목록은 공백을 정리한 요약만 반환하고, 본문은 상세 조회에서 반환"""
+        content = "긴  본문\n" * 100
+        created = authenticated_client.post(
+            f"/api/v1/boards/{test_board.id}/posts", json={"title": "긴 게시글", "content": content}
+        ).json()
+
+        item = authenticated_client.get(f"/api/v1/boards/{test_board.id}/posts").json()["items"][0]
+        assert item["id"] == created["id"]
+        assert len(item["excerpt"]) == EXCERPT_LENGTH
+        assert item["excerpt"].startswith("긴 본문 긴 본문")
+        assert item["excerpt"].endswith("…")
+
+        detail = authenticated_client.get(f"/api/v1/posts/{created['id']}").json()
+        assert detail["content"] == content
 
     def test_list_posts_with_limit(self, authenticated_client: TestClient, test_posts: list[Post]):
         """제한된 개수로 게시글 목록 조회"""
@@ -192,6 +213,49 @@ class TestGetPost:
         assert_error_response(response.json(), 403)
 
 
+class TestSparseFields:
+    """?fields= 로 응답 필드와 조회 컬럼을 줄이는 기능 테스트"""
+
+    def test_list_posts_fields(self, authenticated_client: TestClient, test_posts: list[Post], db_engine):
+        """목록: 지정한 필드만 응답하고 SELECT 에도 해당 컬럼만 포함 (정렬 컬럼 title 은 커서용으로만 추가)"""
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            response = authenticated_client.get(
+                f"/api/v1/boards/{test_posts[0].board_id}/posts?fields=id,owner_id&sort=title&size=2"
+            )
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [set(item) for item in data["items"]] == [{"id", "owner_id"}] * 2
+        assert data["total"] == len(test_posts)
+        page_sql = next(sql for sql in statements if "ORDER BY" in sql)
+        assert "posts.excerpt" not in page_sql and "posts.board_id," not in page_sql
+
+        next_page = authenticated_client.get(
+            f"/api/v1/boards/{test_posts[0].board_id}/posts?fields=id,owner_id&sort=title&size=2&cursor={data['next_page']}"
+        ).json()
+        seen = {item["id"] for item in data["items"]}
+        assert next_page["items"] and not seen & {item["id"] for item in next_page["items"]}
+
+    def test_get_post_fields(self, authenticated_client: TestClient, test_post: Post):
+        """상세: 본문처럼 지연 로딩 컬럼도 지정하면 조회"""
+        response = authenticated_client.get(f"/api/v1/posts/{test_post.id}?fields=id,content")
+
+        assert response.status_code == 200
+        assert response.json() == {"id": test_post.id, "content": test_post.content}
+
+    def test_fields_invalid(self, authenticated_client: TestClient, test_post: Post):
+        """목록에는 본문(content)이 없으므로 400"""
+        response = authenticated_client.get(f"/api/v1/boards/{test_post.board_id}/posts?fields=id,content")
+
+        assert response.status_code == 400
+        assert "content" in response.json()["detail"]
+
+
 class TestUpdatePost:
     """게시글 수정 엔드포인트 테스트"""
 
@@ -213,6 +277,10 @@ class TestUpdatePost:
         assert data["content"] == update_data["content"]
         assert data["id"] == test_post.id
 
+        # 목록 요약도 함께 갱신
+        items = authenticated_client.get(f"/api/v1/boards/{test_post.board_id}/posts").json()["items"]
+        assert items[0]["excerpt"] == update_data["content"]
+
     def test_update_post_partial(self, authenticated_client: TestClient, test_post: Post):
         """게시글 부분 수정"""
         update_data = {"title": "부분 수정된 제목"}
@@ -256,6 +324,194 @@ class TestUpdatePost:
         assert response.status_code == 404
         assert_error_response(response.json(), 404, "게시글을 찾을 수 없습니다")
 
+class TestConditionalRequests:
+    """ETag/Last-Modified 조건부 요청 테스트"""
+
+    def test_not_modified_without_loading_content(self, authenticated_client: TestClient, test_post: Post, db_engine):
+        """If-None-Match 가 현재 ETag 와 같으면 본문을 조회하지 않고 304"""
+        response = authenticated_client.get(f"/api/v1/posts/{test_post.id}")
+        etag = response.headers["etag"]
+        assert response.headers["last-modified"]
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            not_modified = authenticated_client.get(f"/api/v1/posts/{test_post.id}", headers={"If-None-Match": etag})
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+
+        assert not_modified.status_code == 304
+        assert not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+        assert not any("posts.content" in sql for sql in statements)
+
+    def test_modified_since(self, authenticated_client: TestClient, test_post: Post):
+        """If-Modified-Since 이후 수정되지 않았으면 304, 다른 ETag 면 전체 응답"""
+        response = authenticated_client.get(f"/api/v1/posts/{test_post.id}")
+
+        not_modified = authenticated_client.get(
+            f"/api/v1/posts/{test_post.id}", headers={"If-Modified-Since": response.headers["last-modified"]}
+        )
+        stale = authenticated_client.get(f"/api/v1/posts/{test_post.id}", headers={"If-None-Match": '"stale"'})
+
+        assert not_modified.status_code == 304
+        assert stale.status_code == 200
+        assert stale.json() == response.json()
+
+    def test_etag_per_representation(self, authenticated_client: TestClient, test_post: Post):
+        """?fields= 응답은 다른 ETag (전체 응답의 ETag 로는 304 가 아님)"""
+        full = authenticated_client.get(f"/api/v1/posts/{test_post.id}")
+        sparse = authenticated_client.get(
+            f"/api/v1/posts/{test_post.id}?fields=id,title", headers={"If-None-Match": full.headers["etag"]}
+        )
+
+        assert sparse.status_code == 200
+        assert sparse.headers["etag"] != full.headers["etag"]
+
+    def test_not_modified_requires_access(self, authenticated_client: TestClient, another_board: Board, db: Session):
+        """비공개 게시판의 게시글은 If-None-Match: * 여도 403"""
+        post = Post(title="비공개", content="내용", board_id=another_board.id, owner_id=another_board.owner_id)
+        db.add(post)
+        db.commit()
+
+        response = authenticated_client.get(f"/api/v1/posts/{post.id}", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 403
+
+    def test_update_if_match(self, authenticated_client: TestClient, test_post: Post):
+        """If-Match 가 현재 버전과 다르면 412, 같으면 (약한 태그 포함) 수정"""
+        etag = authenticated_client.get(f"/api/v1/posts/{test_post.id}").headers["etag"]
+
+        stale = authenticated_client.put(
+            f"/api/v1/posts/{test_post.id}", json={"title": "수정"}, headers={"If-Match": '"0-0"'}
+        )
+        assert stale.status_code == 412
+        assert_error_response(stale.json(), 412)
+
+        response = authenticated_client.put(
+            f"/api/v1/posts/{test_post.id}", json={"title": "수정"}, headers={"If-Match": f"W/{etag}"}
+        )
+        assert response.status_code == 200
+        assert response.json()["title"] == "수정"
+        assert response.headers["etag"]
+
+class TestPostDetailCache:
+    """게시글 상세 조회 캐시 테스트"""
+
+    def test_cache_hit_and_invalidation(self, response_cache, authenticated_client: TestClient, test_post: Post, db_engine):
+        """캐시에 있으면 ?fields= 요청도 DB 조회 없이 응답, 수정/삭제 시 무효화"""
+        url = f"/api/v1/posts/{test_post.id}"
+        full = authenticated_client.get(url).json()
+
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            sparse = authenticated_client.get(url, params={"fields": "id,content"})
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+        assert sparse.json() == {"id": full["id"], "content": full["content"]}
+        assert not any("FROM posts" in sql for sql in statements)
+
+        authenticated_client.put(url, json={"title": "수정"})
+        assert authenticated_client.get(url).json()["title"] == "수정"
+
+        authenticated_client.get(f"/api/v1/boards/{test_post.board_id}")
+        authenticated_client.delete(url)
+        assert not response_cache.exists(f"cache:post:{test_post.id}", f"cache:board:{test_post.board_id}")
+        assert authenticated_client.get(url).status_code == 403
+
+class TestPostChanges:
+    """게시글 변경분 동기화 테스트"""
+
+    def test_sync_changes_and_deletions(self, authenticated_client: TestClient, test_posts: list[Post], db: Session):
+        """watermark 이후 수정된 게시글과 삭제된 게시글 ID, 최근 변경분은 SYNC_WATERMARK_LAG_SECONDS 후 전송"""
+        synced_at = datetime.now(timezone.utc) - timedelta(hours=2)
+        for i, post in enumerate(test_posts):
+            post.updated_at = synced_at + timedelta(seconds=i)
+        db.commit()
+        url = f"/api/v1/boards/{test_posts[0].board_id}/posts/changes"
+
+        with patch.object(settings, "SYNC_WATERMARK_LAG_SECONDS", 3600):
+            first = authenticated_client.get(url, params={"size": 3}).json()
+            rest = authenticated_client.get(url, params={"size": 3, "since": first["watermark"]}).json()
+            assert [item["id"] for item in first["items"] + rest["items"]] == [post.id for post in test_posts]
+            assert first["has_more"] is True
+            assert rest["has_more"] is False
+            assert "content" not in first["items"][0]
+
+            authenticated_client.put(f"/api/v1/posts/{test_posts[0].id}", json={"title": "수정"})
+            authenticated_client.delete(f"/api/v1/posts/{test_posts[1].id}")
+            # SYNC_WATERMARK_LAG_SECONDS 이내 변경분은 아직 보내지 않고 watermark 도 넘기지 않음
+            pending = authenticated_client.get(url, params={"since": rest["watermark"]}).json()
+            assert (pending["items"], pending["deleted"]) == ([], [])
+
+        with patch.object(settings, "SYNC_WATERMARK_LAG_SECONDS", 0):
+            changes = authenticated_client.get(url, params={"since": pending["watermark"]}).json()
+        assert [(item["id"], item["title"]) for item in changes["items"]] == [(test_posts[0].id, "수정")]
+        assert changes["deleted"] == [test_posts[1].id]
+
+    def test_sync_pages_stop_at_horizon(self, authenticated_client: TestClient, test_posts: list[Post], db: Session):
+        """가득 찬 페이지라도 horizon 이후 게시글은 보내지 않아, 나중에 커밋된 더 이른 변경분을 놓치지 않음"""
+        now = datetime.now(timezone.utc)
+        test_posts[0].updated_at = now - timedelta(hours=2)
+        for i, post in enumerate(test_posts[1:]):
+            post.updated_at = now - timedelta(seconds=60 - i)
+        db.commit()
+        url = f"/api/v1/boards/{test_posts[0].board_id}/posts/changes"
+
+        with patch.object(settings, "SYNC_WATERMARK_LAG_SECONDS", 3600):
+            first = authenticated_client.get(url, params={"size": 2}).json()
+        assert [item["id"] for item in first["items"]] == [test_posts[0].id]
+        assert first["has_more"] is False
+
+        # horizon 이후, 이미 저장된 게시글보다 이른 시각으로 늦게 커밋된 변경
+        late = Post(title="늦은 커밋", content="내용", board_id=test_posts[0].board_id, owner_id=test_posts[0].owner_id)
+        db.add(late)
+        db.flush()
+        late.updated_at = now - timedelta(seconds=120)
+        db.commit()
+
+        ids, watermark = [], first["watermark"]
+        with patch.object(settings, "SYNC_WATERMARK_LAG_SECONDS", 0):
+            while True:
+                page = authenticated_client.get(url, params={"size": 2, "since": watermark}).json()
+                ids += [item["id"] for item in page["items"]]
+                watermark = page["watermark"]
+                if not page["has_more"]:
+                    break
+        assert ids == [late.id] + [post.id for post in test_posts[1:]]
+
+    def test_sync_without_changes_past_retention(self, authenticated_client: TestClient, test_board: Board):
+        """변경분이 없어도 watermark 가 전진해 삭제 기록 보관 기간보다 오래 자주 동기화해도 410 이 아님"""
+
+        class Clock(datetime):
+            current = datetime.now(timezone.utc)
+
+            @classmethod
+            def now(cls, tz=None):
+                return cls.current
+
+        url = f"/api/v1/boards/{test_board.id}/posts/changes"
+        with patch("app.services.post.datetime", Clock):
+            watermark = authenticated_client.get(url).json()["watermark"]
+            for _ in range(settings.SYNC_TOMBSTONE_RETENTION_DAYS + 5):
+                Clock.current += timedelta(days=1)
+                response = authenticated_client.get(url, params={"since": watermark})
+                assert response.status_code == 200
+                assert response.json()["items"] == []
+                watermark = response.json()["watermark"]
+
+    def test_sync_invalid_watermark(self, authenticated_client: TestClient, test_board: Board, another_board: Board):
+        """잘못된 watermark 400, 삭제 기록 보관 기간이 지난 watermark 410, 비공개 게시판 403"""
+        url = f"/api/v1/boards/{test_board.id}/posts/changes"
+        expired = SyncWatermark.initial(datetime(2000, 1, 1, tzinfo=timezone.utc)).encode()
+
+        assert authenticated_client.get(url, params={"since": "invalid"}).status_code == 400
+        assert authenticated_client.get(url, params={"since": expired}).status_code == 410
+        assert authenticated_client.get(f"/api/v1/boards/{another_board.id}/posts/changes").status_code == 403
+
 class TestDeletePost:
     """게시글 삭제 엔드포인트 테스트"""
 
@@ -269,6 +525,17 @@ class TestDeletePost:
         get_response = authenticated_client.get(f"/api/v1/posts/{test_post.id}")
         assert get_response.status_code == 403  # 404 대신 403 반환
 
+    def test_posts_count_not_negative(self, authenticated_client: TestClient, test_post: Post):
+        """게시글 작성/삭제 시 게시판 posts_count 증감, 0 아래로는 내려가지 않음"""
+        board_url = f"/api/v1/boards/{test_post.board_id}"
+        created = authenticated_client.post(f"{board_url}/posts", json={"title": "제목", "content": "내용"}).json()
+        assert authenticated_client.get(board_url).json()["posts_count"] == 1
+
+        # 픽스처 게시글은 posts_count 에 반영되지 않은 상태로 생성됨
+        authenticated_client.delete(f"/api/v1/posts/{created['id']}")
+        authenticated_client.delete(f"/api/v1/posts/{test_post.id}")
+        assert authenticated_client.get(board_url).json()["posts_count"] == 0
+
     def test_delete_post_not_owner(self, authenticated_client: TestClient, another_user_post: Post):
         """다른 사용자의 게시글 삭제 시도"""
         response = authenticated_client.delete(f"/api/v1/posts/{another_user_post.id}")
@@ -9,6 +9,7 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
+from app.core.config import settings
 from app.db.session import get_db
 from app.core.security import create_access_token, get_password_hash
 from app.models import User, Board, Post
@@ -120,6 +121,35 @@ def mock_redis_session():
         yield
 
 
+@pytest.fixture(autouse=True)
+def disable_response_cache():
+    """테스트마다 DB 를 새로 만들어 ID 가 겹치므로 응답 캐시(상세, 게시판 목록, 인증 사용자)는 기본으로 끔."""
+    with patch.object(settings, "DETAIL_CACHE_ENABLED", False), \
+            patch.object(settings, "BOARD_LIST_CACHE_ENABLED", False), \
+            patch.object(settings, "PRINCIPAL_CACHE_ENABLED", False):
+        yield
+
+
+@pytest.fixture
+def response_cache():
+    """응답 캐시를 켜고 테스트 전후로 캐시 항목 삭제 (Redis, 프로세스 내 L1)."""
+    from app.core.cache import clear_local_caches
+    from app.redis.session import redis_client
+
+    def clear():
+        keys = list(redis_client.scan_iter(match="cache:*", count=100))
+        if keys:
+            redis_client.delete(*keys)
+        clear_local_caches()
+
+    with patch.object(settings, "DETAIL_CACHE_ENABLED", True), \
+            patch.object(settings, "BOARD_LIST_CACHE_ENABLED", True), \
+            patch.object(settings, "PRINCIPAL_CACHE_ENABLED", True):
+        clear()
+        yield redis_client
+        clear()
+
+
 @pytest.fixture
 def authenticated_client(client: TestClient, test_user: User) -> TestClient:
     """인증된 테스트 클라이언트 생성."""
@@ -0,0 +1,129 @@
+import os
+from pathlib import Path
+from typing import Generator
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+
+# 실행 계획 회귀 테스트용 PostgreSQL (미설정 시 테스트 건너뜀)
+TEST_POSTGRES_URL = os.getenv("TEST_POSTGRES_URL")
+# 다른 데이터와 섞이지 않도록 전용 스키마에 마이그레이션 적용
+QUERY_PLAN_SCHEMA = "query_plan_test"
+MIGRATIONS_DIR = Path(__file__).resolve().parents[2] / "migrations"
+
+# 고정 데이터셋 크기 (ANALYZE 기본 샘플 30000행 이하로 유지해 통계가 매번 같도록 함)
+SEED_USERS = 200
+SEED_BOARDS = 5_000
+SEED_POSTS = 30_000
+SEED_TOMBSTONES = 3_000
+# 게시글이 몰리는 게시판 수 (게시판당 SEED_POSTS / POST_BOARDS 개)
+POST_BOARDS = 300
+
+SEED_SQL = [
+    f"""
+    INSERT INTO users (fullname, email, password)
+    SELECT 'user ' || g, 'user' || g || '@example.com', 'x'
+    FROM generate_series(1, {SEED_USERS}) AS g
+    """,
+    # 5개 중 4개는 공개 게시판, 소유자는 사용자에게 고르게 분배
+    f"""
+    INSERT INTO boards (name, public, owner_id, posts_count, created_at, updated_at)
+    SELECT 'board ' || lpad(g::text, 5, '0'), g % 5 <> 0, g % {SEED_USERS} + 1, 0,
+           timestamptz '2025-01-01 00:00:00+00' + g * interval '1 minute',
+           timestamptz '2025-01-01 00:00:00+00' + g * interval '1 minute' + (g % 7) * interval '1 day'
+    FROM generate_series(1, {SEED_BOARDS}) AS g
+    """,
+    f"""
+    INSERT INTO posts (board_id, owner_id, title, content, excerpt, created_at, updated_at)
+    SELECT g % {POST_BOARDS} + 1, g % {SEED_USERS} + 1, 'post ' || lpad(g::text, 6, '0'), repeat('content ', 20),
+           rtrim(repeat('content ', 20)),
+           timestamptz '2025-01-01 00:00:00+00' + g * interval '10 seconds',
+           timestamptz '2025-01-01 00:00:00+00' + g * interval '10 seconds'
+    FROM generate_series(1, {SEED_POSTS}) AS g
+    """,
+    # 이미 삭제된 게시글의 삭제 기록 (게시글과 같은 게시판에 분배)
+    f"""
+    INSERT INTO post_tombstones (post_id, board_id, deleted_at)
+    SELECT {SEED_POSTS} + g, g % {POST_BOARDS} + 1, timestamptz '2025-01-01 00:00:00+00' + g * interval '1 minute'
+    FROM generate_series(1, {SEED_TOMBSTONES}) AS g
+    """,
+    """
+    UPDATE boards SET posts_count = counts.total
+    FROM (SELECT board_id, count(*) AS total FROM posts GROUP BY board_id) AS counts
+    WHERE boards.id = counts.board_id
+    """,
+]
+
+# 실행 계획이 환경에 따라 달라지지 않도록 고정하는 플래너 설정
+PLANNER_SETTINGS = [
+    "SET max_parallel_workers_per_gather = 0",
+    "SET jit = off",
+]
+
+
+def _migrate(url: str) -> None:
+    """전용 스키마에 alembic 마이그레이션(head) 적용
+
+    alembic.ini 를 읽으면 fileConfig 가 앱 로거를 비활성화하므로 설정을 직접 구성합니다.
+    """
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    config.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(scope="session")
+def postgres_engine() -> Generator[Engine, None, None]:
+    """마이그레이션과 고정 데이터셋이 적용된 PostgreSQL 엔진"""
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL 미설정 (실행 계획 회귀 테스트는 PostgreSQL 필요)")
+
+    admin_engine = create_engine(TEST_POSTGRES_URL)
+    with admin_engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {QUERY_PLAN_SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {QUERY_PLAN_SCHEMA}"))
+    admin_engine.dispose()
+
+    separator = "&" if "?" in TEST_POSTGRES_URL else "?"
+    url = f"{TEST_POSTGRES_URL}{separator}options=-csearch_path%3D{QUERY_PLAN_SCHEMA}"
+    _migrate(url)
+
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        for statement in SEED_SQL:
+            conn.execute(text(statement))
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
+
+    yield engine
+
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {QUERY_PLAN_SCHEMA} CASCADE"))
+    engine.dispose()
+
+
+@pytest.fixture
+def plan_connection(postgres_engine: Engine) -> Generator[Connection, None, None]:
+    """플래너 설정을 고정한 커넥션 (테스트 종료 시 롤백)"""
+    with postgres_engine.connect() as conn:
+        for statement in PLANNER_SETTINGS:
+            conn.execute(text(statement))
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+
+
+@pytest.fixture
+def plan_db(plan_connection: Connection) -> Generator[Session, None, None]:
+    """plan_connection 에 바인딩된 세션"""
+    session = Session(bind=plan_connection)
+    try:
+        yield session
+    finally:
+        session.close()
@@ -0,0 +1,31 @@
+"""
+게시판 이름순 정렬 테스트 (PostgreSQL)
+
+게시판 목록은 캐시한 공개 게시판과 DB 에서 조회한 비공개 게시판을 Python 문자열 비교로 합치므로
+DB 정렬과 keyset 조건도 데이터베이스 기본 collation (예: en_US) 이 아닌 코드 포인트 순서여야 합니다.
+
+    TEST_POSTGRES_URL=postgresql://... pytest tests/db
+"""
+from sqlalchemy.orm import Session
+
+from app.crud.board import board as board_crud
+from app.models import Board
+from app.schemas.board import BoardSortOption
+
+# 고정 데이터셋 이름 ('board 00001' ...) 보다 코드 포인트 순서로 앞서는 이름 (en_US 에서는 "Zebra" 가 마지막)
+MIXED_CASE_NAMES = ["apple", "Zebra", "Apple", "banana"]
+OWNER_ID = 2
+
+
+def test_name_order_matches_python(plan_db: Session):
+    """DB 이름순 정렬과 keyset 경계 이후 조회가 Python 문자열 순서와 같음"""
+    for name in MIXED_CASE_NAMES:
+        plan_db.add(Board(name=name, public=True, owner_id=OWNER_ID))
+    plan_db.flush()
+    expected = sorted(MIXED_CASE_NAMES + ["board 00001"])
+
+    rows = board_crud.get_public_boards(plan_db, BoardSortOption.name, limit=len(expected))
+    assert [row.value for row in rows] == expected
+
+    after = board_crud.get_public_boards(plan_db, BoardSortOption.name, (rows[1].value, rows[1].id), limit=2)
+    assert [row.value for row in after] == expected[2:4]
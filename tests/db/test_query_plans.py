@@ -0,0 +1,191 @@
+"""
+실행 계획 회귀 테스트
+
+고정 데이터셋에서 목록/상세 조회가 실제로 실행하는 모든 쿼리(페이지네이션 count 포함)를
+EXPLAIN (FORMAT JSON) 으로 수집하고, 비용/행 수를 제외한 계획 구조를 커밋된 스냅샷과 비교합니다.
+마이그레이션이나 쿼리 변경으로 인덱스 스캔이 Seq Scan + Sort 로 바뀌면 실패합니다.
+
+    TEST_POSTGRES_URL=postgresql://... pytest tests/db
+    TEST_POSTGRES_URL=postgresql://... UPDATE_QUERY_PLANS=true pytest tests/db   # 스냅샷 갱신
+"""
+import difflib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+from fastapi_pagination import set_page
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.crud.board import board as board_crud
+from app.crud.post import post as post_crud
+from app.db.fingerprint import normalize_sql
+from app.schemas.board import BoardSortOption
+from app.schemas.pagination import TotalCursorParams
+from app.schemas.post import PostListResponse, PostSortOption
+
+SNAPSHOT_DIR = Path(__file__).resolve().parent / "query_plans"
+UPDATE_QUERY_PLANS = os.getenv("UPDATE_QUERY_PLANS", "false").lower() == "true"
+
+# 스냅샷에 남길 계획 노드 속성 (비용, 행 수, 조건식 등 데이터/버전에 따라 흔들리는 값은 제외)
+PLAN_KEYS = (
+    "Node Type",
+    "Parent Relationship",
+    "Subplan Name",
+    "Join Type",
+    "Strategy",
+    "Relation Name",
+    "Index Name",
+    "Scan Direction",
+    "Sort Key",
+)
+# 조회 기준 사용자/게시판/게시글 (conftest 고정 데이터셋 기준: 사용자 1은 비공개 게시판만 소유)
+USER_ID = 1
+BOARD_ID = 1
+POST_ID = 1
+PAGE_SIZE = 20
+# 변경분 동기화 기준 위치 (게시판 1의 게시글 중간쯤)
+SYNC_AFTER = (datetime(2025, 1, 2, tzinfo=timezone.utc), 0)
+SYNC_UNTIL = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def normalize_plan(node: Dict[str, Any]) -> Dict[str, Any]:
+    """EXPLAIN JSON 노드에서 PLAN_KEYS 만 남긴 트리"""
+    normalized = {key: node[key] for key in PLAN_KEYS if key in node}
+    if "Plans" in node:
+        normalized["Plans"] = [normalize_plan(child) for child in node["Plans"]]
+    return normalized
+
+
+def capture_statements(conn: Connection, func: Callable[[], Any]) -> List[tuple]:
+    """func 실행 중 커넥션에서 실행된 SELECT 문과 파라미터 수집"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(conn, "before_cursor_execute", before_cursor_execute)
+    try:
+        func()
+    finally:
+        event.remove(conn, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+def explain(conn: Connection, statement: str, parameters: Any) -> Dict[str, Any]:
+    """EXPLAIN (FORMAT JSON) 결과의 최상위 Plan 노드를 정규화해 반환"""
+    result = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters).scalar()
+    if isinstance(result, str):
+        result = json.loads(result)
+    return normalize_plan(result[0]["Plan"])
+
+
+def collect_plans(conn: Connection, steps: List[tuple]) -> List[Dict[str, Any]]:
+    """(단계 이름, 실행 함수) 목록을 실행하며 단계별 쿼리의 실행 계획 수집"""
+    plans = []
+    for step, func in steps:
+        for index, (statement, parameters) in enumerate(capture_statements(conn, func)):
+            plans.append({
+                "query": f"{step}#{index}",
+                "sql": normalize_sql(statement),
+                "plan": explain(conn, statement, parameters),
+            })
+    return plans
+
+
+def paginate_steps(db: Session, page_model, build_stmt: Callable[[], Any]) -> List[tuple]:
+    """첫 페이지와 커서로 이어지는 두 번째 페이지 조회 단계"""
+    cursors = {}
+
+    def first_page():
+        with set_page(page_model):
+            page = paginate(db, build_stmt(), TotalCursorParams(size=PAGE_SIZE))
+        cursors["next"] = page.next_page
+
+    def next_page():
+        with set_page(page_model):
+            paginate(db, build_stmt(), TotalCursorParams(size=PAGE_SIZE, cursor=cursors["next"]))
+
+    return [("page1", first_page), ("page2", next_page)]
+
+
+def assert_matches_snapshot(name: str, plans: List[Dict[str, Any]]) -> None:
+    """스냅샷과 계획 구조 비교 (UPDATE_QUERY_PLANS=true 면 스냅샷 갱신)"""
+    path = SNAPSHOT_DIR / f"{name}.json"
+    current = json.dumps(plans, ensure_ascii=False, indent=2) + "\n"
+    if UPDATE_QUERY_PLANS:
+        path.write_text(current, encoding="utf-8")
+        return
+    if not path.exists():
+        pytest.fail(f"실행 계획 스냅샷 없음: {path} (UPDATE_QUERY_PLANS=true 로 생성)")
+
+    expected = json.loads(path.read_text(encoding="utf-8"))
+    if [(p["query"], p["plan"]) for p in expected] != [(p["query"], p["plan"]) for p in plans]:
+        diff = difflib.unified_diff(
+            path.read_text(encoding="utf-8").splitlines(),
+            current.splitlines(),
+            fromfile=f"{name} (snapshot)",
+            tofile=f"{name} (current)",
+            lineterm="",
+        )
+        pytest.fail(
+            f"실행 계획이 스냅샷과 다릅니다: {name}\n" + "\n".join(diff)
+            + "\n의도한 변경이면 UPDATE_QUERY_PLANS=true 로 스냅샷을 갱신하세요."
+        )
+
+
+class TestQueryPlans:
+    """조회 쿼리 실행 계획 회귀 테스트"""
+
+    @pytest.mark.parametrize("sort", list(BoardSortOption), ids=lambda sort: sort.value)
+    def test_accessible_boards(self, plan_connection: Connection, plan_db: Session, sort: BoardSortOption):
+        """게시판 목록 (정렬 옵션별 공개 게시판 캐시 채우기/캐시 범위 밖 페이지 + 본인 비공개 게시판 + count)"""
+        boundary = {}
+
+        def public_prefix():
+            rows = board_crud.get_public_boards(plan_db, sort, limit=settings.BOARD_LIST_CACHE_SIZE)
+            boundary["after"] = (rows[-1].value, rows[-1].id)
+
+        steps = [
+            ("public_prefix", public_prefix),
+            ("public_page", lambda: board_crud.get_public_boards(plan_db, sort, boundary["after"], limit=PAGE_SIZE + 1)),
+            ("public_previous", lambda: board_crud.get_public_boards(
+                plan_db, sort, boundary["after"], backwards=True, limit=PAGE_SIZE + 1
+            )),
+            ("private_page", lambda: board_crud.get_private_boards(plan_db, USER_ID, sort, limit=PAGE_SIZE + 1)),
+            ("public_count", lambda: board_crud.count_public_boards(plan_db)),
+            ("private_count", lambda: board_crud.count_private_boards(plan_db, USER_ID)),
+        ]
+        assert_matches_snapshot(f"boards_{sort.value}", collect_plans(plan_connection, steps))
+
+    @pytest.mark.parametrize("sort", list(PostSortOption), ids=lambda sort: sort.value)
+    def test_accessible_posts(self, plan_connection: Connection, plan_db: Session, sort: PostSortOption):
+        """게시글 목록 (정렬 옵션별 count + 첫 페이지 + 다음 페이지)"""
+        steps = paginate_steps(
+            plan_db, PostListResponse,
+            lambda: post_crud.get_accessible_posts(plan_db, USER_ID, BOARD_ID, sort),
+        )
+        assert_matches_snapshot(f"posts_{sort.value}", collect_plans(plan_connection, steps))
+
+    def test_accessible_post(self, plan_connection: Connection, plan_db: Session):
+        """게시글 상세 (조건부 요청의 버전 조회 포함)"""
+        steps = [
+            ("detail", lambda: post_crud.get_with_access(plan_db, POST_ID)),
+            ("version", lambda: post_crud.get_accessible_version(plan_db, USER_ID, POST_ID)),
+        ]
+        assert_matches_snapshot("post_detail", collect_plans(plan_connection, steps))
+
+    def test_post_changes(self, plan_connection: Connection, plan_db: Session):
+        """게시글 변경분 동기화 (수정된 게시글 + 삭제 기록)"""
+        steps = [
+            ("changes", lambda: post_crud.get_changes(plan_db, BOARD_ID, SYNC_AFTER, SYNC_UNTIL, PAGE_SIZE + 1)),
+            ("tombstones", lambda: post_crud.get_tombstones(plan_db, BOARD_ID, SYNC_AFTER, SYNC_UNTIL, PAGE_SIZE + 1)),
+        ]
+        assert_matches_snapshot("post_changes", collect_plans(plan_connection, steps))
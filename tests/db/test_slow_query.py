@@ -0,0 +1,199 @@
+"""슬로우 쿼리 로그 테스트"""
+import logging
+from typing import Generator
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app import crud
+from app.core.config import settings
+from app.db import slow_query
+from app.db.base_class import Base
+from app.db.events import _after_cursor_execute, _before_cursor_execute, register_query_events
+from app.db.fingerprint import fingerprint, normalize_sql
+from app.db.slow_query import _should_explain, find_caller, redact_parameters
+
+SLOW_QUERY_LOGGER = "app.db.slow_query"
+
+
+@pytest.fixture
+def observed_engine() -> Generator[Engine, None, None]:
+    """쿼리 이벤트가 등록된 전용 엔진
+
+    옵저버는 앱 엔진(app.db.session)에만 연결되므로 테스트 엔진에 같은 리스너를 붙여 사용합니다.
+    EXPLAIN 수집의 rollback 이 다른 테스트 세션에 영향을 주지 않도록 conftest 엔진과 분리합니다.
+    """
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    register_query_events(engine)
+    try:
+        yield engine
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", _after_cursor_execute)
+        engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def reset_explain_counts() -> Generator[None, None, None]:
+    """fingerprint별 EXPLAIN 수집 횟수 초기화"""
+    slow_query._explain_counts.clear()
+    yield
+    slow_query._explain_counts.clear()
+
+
+def _wait_for_explain() -> None:
+    """EXPLAIN 실행기(단일 스레드)에 예약된 작업이 끝날 때까지 대기"""
+    slow_query._explain_executor.submit(lambda: None).result(timeout=5)
+
+
+def _slow_query_logs(caplog: pytest.LogCaptureFixture) -> list[str]:
+    return [record.getMessage() for record in caplog.records if record.name == SLOW_QUERY_LOGGER]
+
+
+class TestRedactParameters:
+    """파라미터 값 치환 테스트"""
+
+    def test_named_parameters(self):
+        """dict 파라미터는 키를 유지하고 값만 타입 이름으로 치환"""
+        assert redact_parameters({"email": "secret@example.com", "limit": 10}) == {"email": "str", "limit": "int"}
+
+    def test_positional_parameters(self):
+        """튜플 파라미터는 순서대로 타입 이름으로 치환"""
+        assert redact_parameters(("secret@example.com", 10, None)) == ["str", "int", "NoneType"]
+
+    def test_executemany_parameters(self):
+        """executemany 는 행 수와 첫 행의 형태만 남김"""
+        rows = [{"title": "제목 1", "board_id": 1}, {"title": "제목 2", "board_id": 2}]
+
+        assert redact_parameters(rows) == {"rows": 2, "first": {"title": "str", "board_id": "int"}}
+        assert redact_parameters([("a", 1), ("b", 2), ("c", 3)]) == {"rows": 3, "first": ["str", "int"]}
+
+    def test_scalar_and_empty(self):
+        """단일 값과 빈 파라미터"""
+        assert redact_parameters("secret") == "str"
+        assert redact_parameters(()) == []
+        assert redact_parameters({}) == {}
+
+
+class TestFingerprint:
+    """SQL 정규화 및 fingerprint 테스트"""
+
+    def test_literals_and_binds_normalized(self):
+        """리터럴/바인드 파라미터/IN 목록이 같은 형태로 정규화"""
+        assert normalize_sql("SELECT * FROM users WHERE email = 'a@b.c' AND id IN (1, 2,  3)") == (
+            "SELECT * FROM users WHERE email = ? AND id IN (?)"
+        )
+        assert normalize_sql("SELECT * FROM users\n WHERE email = %(email_1)s AND id IN (__[POSTCOMPILE_id_1])") == (
+            "SELECT * FROM users WHERE email = ? AND id IN (?)"
+        )
+
+    def test_same_shape_same_fingerprint(self):
+        """값만 다른 쿼리는 같은 fingerprint, 구조가 다르면 다른 fingerprint"""
+        first = fingerprint("SELECT * FROM posts WHERE board_id = 1 LIMIT 20")
+        second = fingerprint("SELECT * FROM posts WHERE board_id = ? LIMIT ?")
+        other = fingerprint("SELECT * FROM boards WHERE id = ?")
+
+        assert first == second
+        assert first != other
+        assert len(first) == 16
+
+
+class TestShouldExplain:
+    """EXPLAIN 수집 여부 결정 테스트"""
+
+    def test_limit_per_fingerprint(self):
+        """fingerprint별 SLOW_QUERY_EXPLAIN_LIMIT 회까지만 수집"""
+        with patch.object(settings, "SLOW_QUERY_EXPLAIN_LIMIT", 2):
+            assert [_should_explain("a") for _ in range(3)] == [True, True, False]
+            # 다른 fingerprint 는 별도로 센다
+            assert _should_explain("b") is True
+
+    def test_tracked_fingerprints_bounded(self):
+        """추적 중인 fingerprint 수가 상한에 도달하면 새 fingerprint 는 수집하지 않음"""
+        with patch.object(slow_query, "_MAX_TRACKED_FINGERPRINTS", 2):
+            assert _should_explain("a") is True
+            assert _should_explain("b") is True
+            assert _should_explain("c") is False
+            # 이미 추적 중인 fingerprint 는 계속 한도까지 수집
+            assert _should_explain("a") is True
+        assert "c" not in slow_query._explain_counts
+
+
+class TestSlowQueryLog:
+    """쿼리 실행 시 슬로우 쿼리 로그 테스트"""
+
+    def test_below_threshold_not_logged(self, observed_engine: Engine, caplog: pytest.LogCaptureFixture):
+        """임계값 미만 쿼리는 로그를 남기지 않음"""
+        with patch.object(settings, "SLOW_QUERY_THRESHOLD_MS", 60_000), caplog.at_level(logging.WARNING):
+            with observed_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        assert _slow_query_logs(caplog) == []
+        assert slow_query._explain_counts == {}
+
+    def test_slow_query_logged_with_redacted_parameters(
+        self, observed_engine: Engine, caplog: pytest.LogCaptureFixture
+    ):
+        """임계값 이상 쿼리는 정규화된 SQL 과 치환된 파라미터로 기록"""
+        with patch.object(settings, "SLOW_QUERY_THRESHOLD_MS", 0), \
+                patch.object(settings, "SLOW_QUERY_EXPLAIN_LIMIT", 0), \
+                caplog.at_level(logging.WARNING):
+            with observed_engine.connect() as conn:
+                conn.execute(text("SELECT :email AS email"), {"email": "secret@example.com"})
+
+        [message] = _slow_query_logs(caplog)
+        assert f"[{fingerprint('SELECT ? AS email')}]" in message
+        assert "sql=SELECT ? AS email" in message
+        # SQLite 드라이버는 위치 기반 파라미터를 사용
+        assert "params=['str']" in message
+        assert "secret@example.com" not in message
+
+    def test_caller_is_app_code(self, observed_engine: Engine, caplog: pytest.LogCaptureFixture):
+        """호출자는 SQLAlchemy 내부 프레임이 아닌 쿼리를 실행한 앱 코드"""
+        with patch.object(settings, "SLOW_QUERY_THRESHOLD_MS", 0), \
+                patch.object(settings, "SLOW_QUERY_EXPLAIN_LIMIT", 0), \
+                caplog.at_level(logging.WARNING):
+            with Session(bind=observed_engine) as db:
+                crud.user.get_by_email(db, email="secret@example.com")
+
+        [message] = _slow_query_logs(caplog)
+        assert "caller=app.crud.user:CRUDUser.get_by_email " in message
+        assert "sqlalchemy" not in message.split("caller=")[1].split()[0]
+
+    def test_caller_without_app_frame(self):
+        """앱 코드 프레임이 없으면 None"""
+        assert find_caller() is None
+
+    def test_explain_captured(self, observed_engine: Engine, caplog: pytest.LogCaptureFixture):
+        """SELECT 는 fingerprint별 한도만큼 EXPLAIN 결과를 별도 스레드에서 기록"""
+        with patch.object(settings, "SLOW_QUERY_THRESHOLD_MS", 0), \
+                patch.object(settings, "SLOW_QUERY_EXPLAIN_LIMIT", 1), \
+                caplog.at_level(logging.WARNING):
+            with Session(bind=observed_engine) as db:
+                crud.user.get_by_email(db, email="first@example.com")
+                crud.user.get_by_email(db, email="second@example.com")
+            _wait_for_explain()
+
+        plans = [message for message in _slow_query_logs(caplog) if message.startswith("slow query plan")]
+        assert len(plans) == 1
+        assert "users" in plans[0]
+        assert len(slow_query._explain_counts) == 1
+
+    def test_explain_skipped_for_writes(self, observed_engine: Engine, caplog: pytest.LogCaptureFixture):
+        """SELECT/WITH 가 아닌 쿼리는 EXPLAIN 하지 않음"""
+        with patch.object(settings, "SLOW_QUERY_THRESHOLD_MS", 0), \
+                patch.object(settings, "SLOW_QUERY_EXPLAIN_LIMIT", 1), \
+                caplog.at_level(logging.WARNING):
+            with observed_engine.begin() as conn:
+                conn.execute(text("DELETE FROM users WHERE email = :email"), {"email": "secret@example.com"})
+            _wait_for_explain()
+
+        messages = _slow_query_logs(caplog)
+        assert len(messages) == 1
+        assert not any(message.startswith("slow query plan") for message in messages)
+        assert slow_query._explain_counts == {}
@@ -55,6 +55,18 @@ def assert_post_response(response_data: Dict[str, Any], expected_data: Optional[
     assert "owner_id" in response_data
 
 
+def assert_post_summary_response(response_data: Dict[str, Any]) -> None:
+    """게시글 목록 항목 검증 (본문 대신 요약)."""
+    assert "id" in response_data
+    assert "title" in response_data
+    assert "excerpt" in response_data
+    assert "content" not in response_data
+    assert "created_at" in response_data
+    assert "updated_at" in response_data
+    assert "board_id" in response_data
+    assert "owner_id" in response_data
+
+
 def assert_user_response(response_data: Dict[str, Any], expected_data: Dict[str, Any]) -> None:
     """사용자 응답 데이터가 예상 데이터와 일치하는지 검증."""
     assert response_data["fullname"] == expected_data["fullname"]